@@ -9,7 +9,7 @@ Este módulo contém a estrutura base e espaços TODO para implementar:
 Todos os algoritmos utilizam a função de avaliação implementada na classe Tabuleiro.
 """
 
-from typing import Tuple, Optional, List
+from typing import Callable, Tuple, Optional, List
 from abc import ABC, abstractmethod
 import time
 import random
@@ -41,6 +41,9 @@ class EstrategiaJogo(ABC):
         self.nos_explorados = 0
         self.tempo_execucao = 0.0
         self.melhor_movimento_encontrado = None
+        self.melhor_valor_encontrado: Optional[float] = None
+        self.observadores: List[Callable[[dict], None]] = []
+        self.prazo_jogada: Optional[float] = None
     
     @abstractmethod
     def escolher_movimento(self, tabuleiro: Tabuleiro, cor_jogador: CorPeca) -> Movimento:
@@ -61,6 +64,7 @@ class EstrategiaJogo(ABC):
         self.nos_explorados = 0
         self.tempo_execucao = 0.0
         self.melhor_movimento_encontrado = None
+        self.melhor_valor_encontrado: Optional[float] = None
     
     def obter_estatisticas(self) -> dict:
         """
@@ -73,8 +77,97 @@ class EstrategiaJogo(ABC):
             'nos_explorados': self.nos_explorados,
             'tempo_execucao': self.tempo_execucao,
             'profundidade_maxima': self.profundidade_maxima,
-            'melhor_movimento': str(self.melhor_movimento_encontrado) if self.melhor_movimento_encontrado else None
+            'melhor_movimento': self.melhor_movimento_encontrado
         }
+    
+    def adicionar_observador(self, observador: Callable[[dict], None]):
+        """
+        Registra uma função que recebe resultados parciais da busca.
+        
+        Estratégias com aprofundamento iterativo chamam os observadores ao
+        fim de cada profundidade (veja publicar_resultado_parcial). Os
+        observadores são chamados na thread que executa a busca.
+        
+        Args:
+            observador (Callable[[dict], None]): Função chamada com o resultado parcial
+        """
+        self.observadores.append(observador)
+    
+    def remover_observador(self, observador: Callable[[dict], None]):
+        """Remove um observador registrado com adicionar_observador."""
+        self.observadores.remove(observador)
+    
+    def publicar_resultado_parcial(self, resultado: dict):
+        """
+        Envia um resultado parcial aos observadores.
+        
+        Chaves usuais: 'profundidade', 'valor' (do ponto de vista das
+        brancas), 'melhor_movimento', 'variacao_principal' (lista de
+        movimentos), 'nos_explorados' e 'tempo'.
+        
+        Args:
+            resultado (dict): Resultado parcial da busca
+        """
+        for observador in self.observadores:
+            observador(resultado)
+    
+    def notificar_jogada_oponente(self, tabuleiro: Tabuleiro, movimento: Movimento):
+        """
+        Avisa a estratégia da jogada do oponente, já executada no tabuleiro.
+        
+        Estratégias que pensam no tempo do oponente (ponderação) usam este
+        aviso para aproveitar ou descartar a busca em andamento. O padrão
+        não faz nada.
+        
+        Args:
+            tabuleiro (Tabuleiro): Tabuleiro após a jogada do oponente
+            movimento (Movimento): Jogada feita pelo oponente
+        """
+        pass
+    
+    def encerrar_partida(self):
+        """Avisa que a partida terminou (padrão: não faz nada)."""
+        pass
+    
+    def definir_prazo(self, prazo: Optional[float]):
+        """
+        Define o prazo da próxima busca, imposto pelo relógio da partida.
+        
+        Estratégias com limite de tempo buscam até o menor entre o prazo e
+        o próprio tempo_limite (veja limitar_tempo); as demais o ignoram, e
+        perdem por tempo se o estourarem.
+        
+        Args:
+            prazo (Optional[float]): Instante limite, em time.time(); None
+                remove o prazo
+        """
+        self.prazo_jogada = prazo
+    
+    def limitar_tempo(self, tempo_limite: Optional[float], inicio: float) -> Optional[float]:
+        """
+        Combina o limite de tempo da estratégia com o prazo da jogada.
+        
+        Args:
+            tempo_limite (Optional[float]): Limite próprio, em segundos
+            inicio (float): Início da busca, em time.time()
+            
+        Returns:
+            Optional[float]: Segundos disponíveis a partir de inicio (None sem limite)
+        """
+        if self.prazo_jogada is None:
+            return tempo_limite
+        disponivel = max(0.0, self.prazo_jogada - inicio)
+        return disponivel if tempo_limite is None else min(tempo_limite, disponivel)
+    
+    def interromper_busca(self):
+        """
+        Pede que a busca em andamento (em outra thread) termine logo.
+        
+        Estratégias com aprofundamento iterativo devolvem então a melhor
+        jogada encontrada até o momento. O padrão não faz nada: a busca
+        termina normalmente.
+        """
+        pass
 
 
 class MiniMax(EstrategiaJogo):
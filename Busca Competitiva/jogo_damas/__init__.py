@@ -6,11 +6,29 @@ incluindo peças, tabuleiro e coordenação de partidas.
 """
 
 from .peca import Peca, CorPeca, TipoPeca
-from .tabuleiro import Tabuleiro, Movimento, MovimentoInvalidoError
+from .tabuleiro import (
+    Tabuleiro, Movimento, MovimentoInvalidoError,
+    posicao_para_casa, casa_para_posicao
+)
+from .perfil import (
+    TabuleiroPerfilado, obter_perfil, zerar_perfil, diferenca_perfil, formatar_perfil
+)
+from .eventos import RegistroEventos, RegistroNulo, RegistroMemoria, RegistroFluxo
+from .relogio import ControleTempo, Relogio, alocar_tempo
 from .jogo_damas import JogoDamas, StatusJogo
+from .arquivo_partidas import (
+    EscritorArquivoPartidas, LeitorArquivoPartidas, PartidaArquivada,
+    codificar_movimento, decodificar_movimento, indice_movimento, resolver_movimento
+)
 
 __all__ = [
     'Peca', 'CorPeca', 'TipoPeca',
     'Tabuleiro', 'Movimento', 'MovimentoInvalidoError', 
-    'JogoDamas', 'StatusJogo'
+    'posicao_para_casa', 'casa_para_posicao',
+    'TabuleiroPerfilado', 'obter_perfil', 'zerar_perfil', 'diferenca_perfil', 'formatar_perfil',
+    'RegistroEventos', 'RegistroNulo', 'RegistroMemoria', 'RegistroFluxo',
+    'ControleTempo', 'Relogio', 'alocar_tempo',
+    'JogoDamas', 'StatusJogo',
+    'EscritorArquivoPartidas', 'LeitorArquivoPartidas', 'PartidaArquivada',
+    'codificar_movimento', 'decodificar_movimento', 'indice_movimento', 'resolver_movimento'
 ] 
\ No newline at end of file
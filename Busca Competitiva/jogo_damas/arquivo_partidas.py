@@ -0,0 +1,405 @@
+"""
+Módulo com o formato binário de arquivo de partidas.
+
+O formato guarda muitas partidas em um único arquivo, sem texto, para que
+grandes coleções (por exemplo, partidas de autojogo) possam ser gravadas e
+lidas rapidamente. Estrutura do arquivo:
+
+- Cabeçalho: assinatura b'DAMA', versão (uint16), reservado (uint16)
+- Para cada partida:
+  - número de jogadas (uint16), resultado (int8: 1 brancas, -1 pretas,
+    0 empate), reservado (uint8)
+  - um registro por jogada: índice da jogada (uint16), avaliação após
+    a jogada (float32), nós explorados (uint32) e tempo de busca (float32)
+
+O índice da jogada é a sua posição na lista de
+Tabuleiro.obter_movimentos_possiveis() da posição em que foi jogada, de
+modo que a partida é reproduzida exatamente, mesmo quando duas capturas
+têm a mesma origem, o mesmo destino e o mesmo número de peças capturadas.
+
+codificar_movimento() gera um código compacto (5 bits para a casa de
+origem, 5 para a de destino e 6 para o número de capturas) que não depende
+da posição; é usado como rótulo na exportação de árvores de busca.
+"""
+
+import mmap
+import os
+import struct
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+from .peca import CorPeca
+from .tabuleiro import Tabuleiro, Movimento, posicao_para_casa, casa_para_posicao
+
+
+ASSINATURA = b'DAMA'
+VERSAO = 2
+
+_CABECALHO = struct.Struct('<4sHH')
+_CABECALHO_PARTIDA = struct.Struct('<HbB')
+_REGISTRO_JOGADA = struct.Struct('<HfIf')
+
+
+def codificar_movimento(movimento: Movimento) -> int:
+    """
+    Codifica um movimento em um inteiro de 16 bits.
+
+    O código não distingue capturas com a mesma origem, o mesmo destino e
+    o mesmo número de peças capturadas; para gravar partidas use
+    indice_movimento().
+
+    Args:
+        movimento (Movimento): Movimento a codificar
+
+    Returns:
+        int: Código do movimento
+    """
+    origem = posicao_para_casa(movimento.origem) - 1
+    destino = posicao_para_casa(movimento.destino) - 1
+    return origem | (destino << 5) | (min(len(movimento.capturas), 63) << 10)
+
+
+def decodificar_movimento(codigo: int) -> Tuple[Tuple[int, int], Tuple[int, int], int]:
+    """
+    Decodifica um movimento gerado por codificar_movimento().
+
+    Args:
+        codigo (int): Código do movimento
+
+    Returns:
+        Tuple: (origem, destino, número de capturas)
+    """
+    origem = casa_para_posicao((codigo & 0x1F) + 1)
+    destino = casa_para_posicao(((codigo >> 5) & 0x1F) + 1)
+    return origem, destino, codigo >> 10
+
+
+def indice_movimento(tabuleiro: Tabuleiro, movimento: Movimento) -> int:
+    """
+    Calcula o índice de um movimento entre as jogadas legais da posição.
+
+    Args:
+        tabuleiro (Tabuleiro): Posição em que o movimento é jogado
+        movimento (Movimento): Movimento a codificar
+
+    Returns:
+        int: Posição do movimento em obter_movimentos_possiveis()
+
+    Raises:
+        ValueError: Se o movimento não é legal nesta posição
+    """
+    try:
+        return tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual).index(movimento)
+    except ValueError:
+        raise ValueError(f"Movimento {movimento} não é legal nesta posição") from None
+
+
+def resolver_movimento(tabuleiro: Tabuleiro, indice: int) -> Movimento:
+    """
+    Encontra o movimento legal gravado por indice_movimento().
+
+    Args:
+        tabuleiro (Tabuleiro): Posição em que o movimento é jogado
+        indice (int): Índice do movimento entre as jogadas legais
+
+    Returns:
+        Movimento: Movimento legal correspondente
+
+    Raises:
+        ValueError: Se não há jogada legal com esse índice
+    """
+    movimentos = tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)
+    if not 0 <= indice < len(movimentos):
+        raise ValueError(f"Índice de jogada {indice} inválido nesta posição "
+                         f"({len(movimentos)} jogadas legais)")
+    return movimentos[indice]
+
+
+def codificar_resultado(vencedor: Optional[CorPeca]) -> int:
+    """
+    Codifica o vencedor de uma partida como inteiro.
+
+    Args:
+        vencedor (Optional[CorPeca]): Cor do vencedor (None para empate)
+
+    Returns:
+        int: 1 vitória das brancas, -1 das pretas, 0 empate
+    """
+    if vencedor == CorPeca.BRANCA:
+        return 1
+    if vencedor == CorPeca.PRETA:
+        return -1
+    return 0
+
+
+class PartidaArquivada:
+    """
+    Partida lida de um arquivo binário.
+
+    Os registros das jogadas só são desempacotados quando acessados,
+    de forma que percorrer o arquivo apenas pelos resultados é barato.
+
+    Attributes:
+        resultado (int): 1 vitória das brancas, -1 das pretas, 0 empate
+        numero_jogadas (int): Número de jogadas da partida
+    """
+
+    __slots__ = ('resultado', 'numero_jogadas', '_dados', '_inicio')
+
+    def __init__(self, resultado: int, numero_jogadas: int, dados: memoryview, inicio: int):
+        self.resultado = resultado
+        self.numero_jogadas = numero_jogadas
+        self._dados = dados
+        self._inicio = inicio
+
+    def registros(self) -> Iterator[Tuple[int, float, int, float]]:
+        """
+        Itera sobre os registros das jogadas.
+
+        Returns:
+            Iterator: Tuplas (índice da jogada, avaliação, nós, tempo)
+        """
+        fim = self._inicio + self.numero_jogadas * _REGISTRO_JOGADA.size
+        with self._dados[self._inicio:fim] as trecho:
+            return iter(list(_REGISTRO_JOGADA.iter_unpack(trecho)))
+
+    @property
+    def movimentos(self) -> List[int]:
+        """Índices das jogadas (veja indice_movimento), na ordem em que foram jogadas."""
+        return [registro[0] for registro in self.registros()]
+
+    @property
+    def avaliacoes(self) -> List[float]:
+        """Avaliação da posição após cada jogada."""
+        return [registro[1] for registro in self.registros()]
+
+    @property
+    def nos_explorados(self) -> List[int]:
+        """Nós explorados pela busca em cada jogada."""
+        return [registro[2] for registro in self.registros()]
+
+    @property
+    def tempos(self) -> List[float]:
+        """Tempo de busca de cada jogada, em segundos."""
+        return [registro[3] for registro in self.registros()]
+
+    def reconstruir(self, tabuleiro: Optional[Tabuleiro] = None) -> List[Movimento]:
+        """
+        Reproduz a partida e retorna os movimentos completos.
+
+        Args:
+            tabuleiro (Optional[Tabuleiro]): Tabuleiro inicial, modificado no
+                lugar (padrão: nova posição inicial)
+
+        Raises:
+            ValueError: Se algum índice não corresponde a uma jogada legal
+
+        Returns:
+            List[Movimento]: Movimentos jogados
+        """
+        if tabuleiro is None:
+            tabuleiro = Tabuleiro()
+        movimentos = []
+        for indice in self.movimentos:
+            movimento = resolver_movimento(tabuleiro, indice)
+            tabuleiro.executar_movimento(movimento)
+            movimentos.append(movimento)
+        return movimentos
+
+
+class EscritorArquivoPartidas:
+    """
+    Escritor de partidas no formato binário, em modo de acréscimo.
+
+    Pode ser usado como gerenciador de contexto:
+
+        with EscritorArquivoPartidas("partidas.bin") as escritor:
+            escritor.escrever_partida(jogo)
+    """
+
+    def __init__(self, nome_arquivo: str):
+        """
+        Abre (ou cria) o arquivo para acrescentar partidas.
+
+        Args:
+            nome_arquivo (str): Caminho do arquivo
+
+        Raises:
+            ValueError: Se o arquivo existe mas não está no formato esperado
+        """
+        self.nome_arquivo = nome_arquivo
+        self.partidas_escritas = 0
+
+        existente = os.path.exists(nome_arquivo) and os.path.getsize(nome_arquivo) > 0
+        if existente:
+            with open(nome_arquivo, 'rb') as f:
+                _validar_cabecalho(f.read(_CABECALHO.size))
+
+        self._arquivo = open(nome_arquivo, 'ab')
+        if not existente:
+            self._arquivo.write(_CABECALHO.pack(ASSINATURA, VERSAO, 0))
+
+    def escrever(self, movimentos: Sequence[int], resultado: int,
+                 avaliacoes: Optional[Sequence[float]] = None,
+                 nos_explorados: Optional[Sequence[int]] = None,
+                 tempos: Optional[Sequence[float]] = None) -> None:
+        """
+        Escreve uma partida a partir dos dados já codificados.
+
+        Args:
+            movimentos (Sequence[int]): Índices das jogadas (indice_movimento)
+            resultado (int): 1 vitória das brancas, -1 das pretas, 0 empate
+            avaliacoes (Optional[Sequence[float]]): Avaliação após cada jogada
+            nos_explorados (Optional[Sequence[int]]): Nós explorados por jogada
+            tempos (Optional[Sequence[float]]): Tempo de busca por jogada
+        """
+        n = len(movimentos)
+        avaliacoes = avaliacoes if avaliacoes is not None else [0.0] * n
+        nos_explorados = nos_explorados if nos_explorados is not None else [0] * n
+        tempos = tempos if tempos is not None else [0.0] * n
+
+        buffer = bytearray(_CABECALHO_PARTIDA.size + n * _REGISTRO_JOGADA.size)
+        _CABECALHO_PARTIDA.pack_into(buffer, 0, n, resultado, 0)
+        deslocamento = _CABECALHO_PARTIDA.size
+        for i in range(n):
+            _REGISTRO_JOGADA.pack_into(
+                buffer, deslocamento, movimentos[i], float(avaliacoes[i]),
+                min(int(nos_explorados[i]), 0xFFFFFFFF), float(tempos[i])
+            )
+            deslocamento += _REGISTRO_JOGADA.size
+
+        self._arquivo.write(buffer)
+        self.partidas_escritas += 1
+
+    def escrever_partida(self, jogo: Any) -> None:
+        """
+        Escreve uma partida finalizada de JogoDamas.
+
+        Args:
+            jogo (JogoDamas): Partida a ser gravada
+        """
+        status = jogo.status
+
+        # Os índices dependem da posição de cada jogada: volta ao início da
+        # partida em uma cópia e reexecuta o histórico
+        historico = jogo.tabuleiro.historico_movimentos
+        tabuleiro = jogo.tabuleiro.copy()
+        for _ in historico:
+            tabuleiro.desfazer_movimento()
+        movimentos = []
+        for movimento in historico:
+            movimentos.append(indice_movimento(tabuleiro, movimento))
+            tabuleiro.executar_movimento(movimento, validar=False)
+        n = len(movimentos)
+
+        # As jogadas alternam entre brancas e pretas, começando pelas brancas
+        brancas = status.estatisticas_jogadores[CorPeca.BRANCA]
+        pretas = status.estatisticas_jogadores[CorPeca.PRETA]
+        por_jogada = []
+        for i in range(n):
+            stats = brancas if i % 2 == 0 else pretas
+            por_jogada.append(stats[i // 2] if i // 2 < len(stats) else {})
+
+        avaliacoes = [float(a) for a in status.historico_avaliacoes[:n]]
+        avaliacoes += [0.0] * (n - len(avaliacoes))
+
+        self.escrever(
+            movimentos,
+            codificar_resultado(status.vencedor),
+            avaliacoes,
+            [s.get('nos_explorados', 0) for s in por_jogada],
+            [s.get('tempo_execucao', 0.0) for s in por_jogada]
+        )
+
+    def escrever_partidas(self, jogos) -> None:
+        """
+        Escreve várias partidas de uma vez.
+
+        Args:
+            jogos: Iterável de partidas (JogoDamas)
+        """
+        for jogo in jogos:
+            self.escrever_partida(jogo)
+
+    def fechar(self) -> None:
+        """Fecha o arquivo, gravando os dados pendentes."""
+        self._arquivo.close()
+
+    def __enter__(self) -> 'EscritorArquivoPartidas':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.fechar()
+
+
+class LeitorArquivoPartidas:
+    """
+    Leitor de partidas no formato binário usando mapeamento em memória.
+
+    Iterar sobre o leitor produz objetos PartidaArquivada sem copiar os
+    dados do arquivo.
+    """
+
+    def __init__(self, nome_arquivo: str):
+        """
+        Abre o arquivo para leitura.
+
+        Args:
+            nome_arquivo (str): Caminho do arquivo
+
+        Raises:
+            ValueError: Se o arquivo não está no formato esperado
+        """
+        self.nome_arquivo = nome_arquivo
+        self._arquivo = open(nome_arquivo, 'rb')
+        try:
+            self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._arquivo.close()
+            raise ValueError(f"Arquivo de partidas vazio: {nome_arquivo}")
+        self._dados = memoryview(self._mapa)
+        _validar_cabecalho(self._dados[:_CABECALHO.size])
+
+    def __iter__(self) -> Iterator[PartidaArquivada]:
+        dados = self._dados
+        tamanho = len(dados)
+        deslocamento = _CABECALHO.size
+
+        while deslocamento + _CABECALHO_PARTIDA.size <= tamanho:
+            n, resultado, _ = _CABECALHO_PARTIDA.unpack_from(dados, deslocamento)
+            inicio = deslocamento + _CABECALHO_PARTIDA.size
+            fim = inicio + n * _REGISTRO_JOGADA.size
+            if fim > tamanho:
+                raise ValueError(f"Arquivo de partidas truncado: {self.nome_arquivo}")
+            yield PartidaArquivada(resultado, n, dados, inicio)
+            deslocamento = fim
+
+    def contar_partidas(self) -> int:
+        """
+        Conta as partidas do arquivo.
+
+        Returns:
+            int: Número de partidas
+        """
+        return sum(1 for _ in self)
+
+    def fechar(self) -> None:
+        """Libera o mapeamento e fecha o arquivo."""
+        self._dados.release()
+        self._mapa.close()
+        self._arquivo.close()
+
+    def __enter__(self) -> 'LeitorArquivoPartidas':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.fechar()
+
+
+def _validar_cabecalho(dados) -> None:
+    if len(dados) < _CABECALHO.size:
+        raise ValueError("Arquivo de partidas sem cabeçalho")
+    assinatura, versao, _ = _CABECALHO.unpack(bytes(dados[:_CABECALHO.size]))
+    if assinatura != ASSINATURA:
+        raise ValueError("Arquivo não está no formato de partidas de damas")
+    if versao != VERSAO:
+        raise ValueError(f"Versão de arquivo de partidas não suportada: {versao}")
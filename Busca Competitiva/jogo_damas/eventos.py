@@ -0,0 +1,173 @@
+"""
+Módulo com os registros de eventos de uma partida.
+
+JogoDamas envia cada evento como dados estruturados (número da jogada,
+tipo e argumentos) para um registro de eventos. O registro decide se e
+quando transformar o evento em texto:
+
+- RegistroNulo: descarta os eventos (partidas em lote, torneios)
+- RegistroMemoria: guarda o log em memória, como strings formatadas
+- RegistroFluxo: envia os eventos em lotes para um arquivo ou fila
+"""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, List, Tuple
+
+
+# Mensagens de cada tipo de evento; os argumentos do evento preenchem os campos
+MENSAGENS_EVENTOS = {
+    'inicio': "Jogo iniciado",
+    'estrategia_brancas': "Estratégia brancas: {0}",
+    'estrategia_pretas': "Estratégia pretas: {0}",
+    'jogada': "{0.value} jogou: {1}",
+    'limite': "Limite de jogadas ({0}) atingido",
+    'repeticao': "Empate por repetição: posição repetida {0} vezes",
+    'sem_progresso': "Empate: {0} jogadas sem captura nem movimento de peça normal",
+    'erro': "Erro durante jogada: {0}",
+    'tempo': "{0.value} perdeu por tempo",
+    'desistencia': "{0.value} desistiu",
+    'fim': "Jogo finalizado",
+}
+
+
+def formatar_evento(numero_jogada: int, tipo: str, dados: Tuple[Any, ...]) -> str:
+    """
+    Formata um evento como a linha de log tradicional do jogo.
+
+    Args:
+        numero_jogada (int): Número da jogada em que o evento ocorreu
+        tipo (str): Tipo do evento (chave de MENSAGENS_EVENTOS)
+        dados (Tuple[Any, ...]): Argumentos do evento
+
+    Returns:
+        str: Linha de log no formato "Jogada N: mensagem"
+    """
+    mensagem = MENSAGENS_EVENTOS.get(tipo, tipo).format(*dados)
+    return f"Jogada {numero_jogada}: {mensagem}"
+
+
+class RegistroEventos(ABC):
+    """
+    Classe abstrata base para registros de eventos de partidas.
+    """
+
+    @abstractmethod
+    def registrar(self, numero_jogada: int, tipo: str, dados: Tuple[Any, ...] = ()) -> None:
+        """
+        Registra um evento da partida.
+
+        Args:
+            numero_jogada (int): Número da jogada em que o evento ocorreu
+            tipo (str): Tipo do evento (chave de MENSAGENS_EVENTOS)
+            dados (Tuple[Any, ...]): Argumentos do evento
+        """
+        pass
+
+    def obter_log(self) -> List[str]:
+        """
+        Retorna o log formatado mantido pelo registro.
+
+        Returns:
+            List[str]: Linhas de log (vazio se o registro não guarda eventos)
+        """
+        return []
+
+    def descarregar(self) -> None:
+        """Envia eventos pendentes ao destino, se houver."""
+        pass
+
+    def fechar(self) -> None:
+        """Descarrega eventos pendentes e libera recursos do registro."""
+        self.descarregar()
+
+
+class RegistroNulo(RegistroEventos):
+    """Registro que descarta todos os eventos."""
+
+    def registrar(self, numero_jogada: int, tipo: str, dados: Tuple[Any, ...] = ()) -> None:
+        pass
+
+
+class RegistroMemoria(RegistroEventos):
+    """
+    Registro que guarda os eventos em memória.
+
+    Os eventos são guardados como tuplas e formatados apenas quando
+    o log é solicitado.
+    """
+
+    def __init__(self):
+        self.eventos: List[Tuple[int, str, Tuple[Any, ...]]] = []
+
+    def registrar(self, numero_jogada: int, tipo: str, dados: Tuple[Any, ...] = ()) -> None:
+        self.eventos.append((numero_jogada, tipo, dados))
+
+    def obter_log(self) -> List[str]:
+        return [formatar_evento(*evento) for evento in self.eventos]
+
+
+class RegistroFluxo(RegistroEventos):
+    """
+    Registro que envia os eventos para um arquivo ou fila, em lotes.
+
+    O destino pode ser:
+    - um caminho de arquivo ou objeto com write(): cada evento vira uma
+      linha JSON {"jogada": N, "tipo": ..., "dados": [...]}
+    - um objeto com put() (queue.Queue, multiprocessing.Queue): cada
+      evento é enviado como a tupla (jogada, tipo, dados)
+
+    Os eventos ficam acumulados até completar um lote e só então são
+    convertidos e enviados.
+    """
+
+    def __init__(self, destino: Any, tamanho_lote: int = 256):
+        """
+        Inicializa o registro.
+
+        Args:
+            destino: Caminho de arquivo, arquivo aberto ou fila
+            tamanho_lote (int): Número de eventos acumulados antes do envio
+        """
+        self.tamanho_lote = max(1, tamanho_lote)
+        self._pendentes: List[Tuple[int, str, Tuple[Any, ...]]] = []
+        self._fechar_destino = isinstance(destino, str)
+        if self._fechar_destino:
+            destino = open(destino, 'a', encoding='utf-8')
+        self.destino = destino
+
+    def registrar(self, numero_jogada: int, tipo: str, dados: Tuple[Any, ...] = ()) -> None:
+        self._pendentes.append((numero_jogada, tipo, dados))
+        if len(self._pendentes) >= self.tamanho_lote:
+            self.descarregar()
+
+    def descarregar(self) -> None:
+        if not self._pendentes:
+            return
+        pendentes, self._pendentes = self._pendentes, []
+
+        if hasattr(self.destino, 'put'):
+            for evento in pendentes:
+                self.destino.put(evento)
+            return
+
+        linhas = []
+        for numero_jogada, tipo, dados in pendentes:
+            linhas.append(json.dumps(
+                {'jogada': numero_jogada, 'tipo': tipo, 'dados': [_converter_dado(d) for d in dados]},
+                ensure_ascii=False
+            ))
+        self.destino.write("\n".join(linhas) + "\n")
+
+    def fechar(self) -> None:
+        self.descarregar()
+        if self._fechar_destino:
+            self.destino.close()
+
+
+def _converter_dado(dado: Any) -> Any:
+    if hasattr(dado, 'value'):  # Enum
+        return dado.value
+    if isinstance(dado, (int, float, str, bool)) or dado is None:
+        return dado
+    return str(dado)
@@ -6,8 +6,11 @@ incluindo a interação entre jogadores, validação de movimentos e
 determinação do vencedor.
 """
 
+import threading
 from typing import Optional, Tuple, Dict, Any
 from .tabuleiro import Tabuleiro, Movimento, CorPeca, MovimentoInvalidoError
+from .eventos import RegistroEventos, RegistroMemoria
+from .relogio import ControleTempo, Relogio, MARGEM_SEGURANCA
 from exercicios.algoritmos_busca import EstrategiaJogo
 
 
@@ -46,7 +49,7 @@ class StatusJogo:
             avaliacao (float): Avaliação da posição após o movimento
         """
         self.numero_jogadas += 1
-        self.historico_avaliacoes.append(str(avaliacao))
+        self.historico_avaliacoes.append(avaliacao)
 
 
 class JogoDamas:
@@ -60,7 +63,10 @@ class JogoDamas:
     def __init__(self, estrategia_brancas: EstrategiaJogo, 
                  estrategia_pretas: EstrategiaJogo,
                  exibir_tabuleiro: bool = True,
-                 limite_jogadas: int = 200):
+                 limite_jogadas: int = 200,
+                 registro_eventos: Optional[RegistroEventos] = None,
+                 perfilar: bool = False,
+                 controle_tempo: Optional[ControleTempo] = None):
         """
         Inicializa uma nova partida de damas.
         
@@ -69,8 +75,22 @@ class JogoDamas:
             estrategia_pretas: Estratégia para as peças pretas (deve implementar EstrategiaJogo)
             exibir_tabuleiro (bool): Se deve exibir o tabuleiro a cada jogada
             limite_jogadas (int): Limite de jogadas para evitar jogos infinitos
+            registro_eventos (Optional[RegistroEventos]): Destino dos eventos da
+                partida (padrão: RegistroMemoria). Use RegistroNulo em partidas
+                em lote para não formatar nem guardar eventos
+            perfilar (bool): Se deve usar um TabuleiroPerfilado, que mede
+                chamadas e tempo dos métodos mais usados do tabuleiro
+            controle_tempo (Optional[ControleTempo]): Ritmo de jogo; com ele,
+                cada lado tem um relógio e perde a partida se estourar o tempo
         """
-        self.tabuleiro = Tabuleiro()
+        self.perfilar = perfilar
+        self.perfil_tabuleiro: Optional[Dict[str, Dict[str, float]]] = None
+        if perfilar:
+            from .perfil import TabuleiroPerfilado, obter_perfil
+            self.tabuleiro = TabuleiroPerfilado()
+            self._perfil_inicial = obter_perfil()
+        else:
+            self.tabuleiro = Tabuleiro()
         self.estrategias = {
             CorPeca.BRANCA: estrategia_brancas,
             CorPeca.PRETA: estrategia_pretas
@@ -78,22 +98,29 @@ class JogoDamas:
         self.exibir_tabuleiro = exibir_tabuleiro
         self.limite_jogadas = limite_jogadas
         self.status = StatusJogo()
+        self.relogio = Relogio(controle_tempo) if controle_tempo is not None else None
         
-        # Log de eventos do jogo
-        self.log_eventos = []
+        # Registro de eventos do jogo
+        self.registro_eventos = registro_eventos if registro_eventos is not None else RegistroMemoria()
         
-        self._log_evento("Jogo iniciado")
-        self._log_evento(f"Estratégia brancas: {type(estrategia_brancas).__name__}")
-        self._log_evento(f"Estratégia pretas: {type(estrategia_pretas).__name__}")
+        self._log_evento('inicio')
+        self._log_evento('estrategia_brancas', type(estrategia_brancas).__name__)
+        self._log_evento('estrategia_pretas', type(estrategia_pretas).__name__)
     
-    def _log_evento(self, evento: str):
+    @property
+    def log_eventos(self):
+        """Log de eventos formatado (vazio se o registro não guarda eventos)."""
+        return self.registro_eventos.obter_log()
+    
+    def _log_evento(self, tipo: str, *dados):
         """
         Registra um evento no log do jogo.
         
         Args:
-            evento (str): Descrição do evento
+            tipo (str): Tipo do evento (veja eventos.MENSAGENS_EVENTOS)
+            *dados: Argumentos do evento, formatados apenas pelo registro
         """
-        self.log_eventos.append(f"Jogada {self.status.numero_jogadas}: {evento}")
+        self.registro_eventos.registrar(self.status.numero_jogadas, tipo, dados)
     
     def jogar(self) -> CorPeca:
         """
@@ -107,31 +134,15 @@ class JogoDamas:
             print(self.tabuleiro.exibir())
         
         while self.status.em_andamento:
-            # Verificar se o jogo terminou
-            jogo_terminado, vencedor = self.tabuleiro.jogo_terminado()
-            if jogo_terminado:
-                self.status.finalizar_jogo(vencedor)
-                break
-            
-            # Verificar limite de jogadas
-            if self.status.numero_jogadas >= self.limite_jogadas:
-                self._log_evento(f"Limite de jogadas ({self.limite_jogadas}) atingido")
-                # Determinar vencedor pela avaliação atual
-                avaliacao_final = self.tabuleiro.avaliar_posicao()
-                if avaliacao_final > 0:
-                    vencedor = CorPeca.BRANCA
-                elif avaliacao_final < 0:
-                    vencedor = CorPeca.PRETA
-                else:
-                    vencedor = None  # Empate
-                self.status.finalizar_jogo(vencedor)
+            # Verificar se o jogo terminou (no tabuleiro ou pelo limite)
+            if self.verificar_termino():
                 break
             
             # Realizar jogada
             try:
                 self._realizar_jogada()
             except Exception as e:
-                self._log_evento(f"Erro durante jogada: {e}")
+                self._log_evento('erro', e)
                 # Em caso de erro, considerar derrota do jogador atual
                 jogador_atual = self.tabuleiro.turno_atual
                 vencedor = CorPeca.PRETA if jogador_atual == CorPeca.BRANCA else CorPeca.BRANCA
@@ -141,6 +152,47 @@ class JogoDamas:
         self._finalizar_partida()
         return self.status.vencedor
     
+    def verificar_termino(self) -> bool:
+        """
+        Verifica se a partida terminou, finalizando o status se for o caso.
+        
+        A partida termina quando quem joga não tem jogadas, empatada pelas
+        regras de repetição e de falta de progresso
+        (Tabuleiro.verificar_empate) ou quando o limite de jogadas é
+        atingido; no limite, o vencedor é decidido pela avaliação da posição.
+        
+        Returns:
+            bool: Se a partida terminou
+        """
+        jogo_terminado, vencedor = self.tabuleiro.jogo_terminado()
+        if jogo_terminado:
+            self.status.finalizar_jogo(vencedor)
+            return True
+        
+        motivo_empate = self.tabuleiro.verificar_empate()
+        if motivo_empate == 'repeticao':
+            self._log_evento('repeticao', self.tabuleiro.LIMITE_REPETICOES)
+        elif motivo_empate == 'sem_progresso':
+            self._log_evento('sem_progresso', self.tabuleiro.jogadas_sem_progresso)
+        if motivo_empate is not None:
+            self.status.finalizar_jogo(None)
+            return True
+        
+        if self.status.numero_jogadas >= self.limite_jogadas:
+            self._log_evento('limite', self.limite_jogadas)
+            # Determinar vencedor pela avaliação atual
+            avaliacao_final = self.tabuleiro.avaliar_posicao()
+            if avaliacao_final > 0:
+                vencedor = CorPeca.BRANCA
+            elif avaliacao_final < 0:
+                vencedor = CorPeca.PRETA
+            else:
+                vencedor = None  # Empate
+            self.status.finalizar_jogo(vencedor)
+            return True
+        
+        return False
+    
     def _realizar_jogada(self):
         """Realiza uma jogada completa para o jogador atual."""
         jogador_atual = self.tabuleiro.turno_atual
@@ -150,33 +202,142 @@ class JogoDamas:
             print(f"\n--- Turno de {jogador_atual.value} ---")
         
         # Obter movimento da estratégia
-        movimento = estrategia.escolher_movimento(self.tabuleiro, jogador_atual)
+        if self.relogio is None:
+            movimento = estrategia.escolher_movimento(self.tabuleiro, jogador_atual)
+        else:
+            movimento = self._escolher_com_relogio(estrategia, jogador_atual)
+            if movimento is None:
+                return
+        estatisticas = estrategia.obter_estatisticas()
+        avaliacao = self.aplicar_jogada(movimento, estatisticas)
+        
+        if self.exibir_tabuleiro:
+            print(f"Movimento: {movimento}")
+            if estatisticas['tempo_execucao'] > 0:
+                print(f"Tempo: {estatisticas['tempo_execucao']:.3f}s, "
+                      f"Nós explorados: {estatisticas['nos_explorados']}")
+            print(f"Avaliação: {avaliacao:.2f}")
+            print(self.tabuleiro.exibir())
+    
+    def _escolher_com_relogio(self, estrategia: EstrategiaJogo,
+                              jogador_atual: CorPeca) -> Optional[Movimento]:
+        """
+        Obtém a jogada da estratégia com o relógio correndo.
+        
+        A estratégia recebe como prazo o tempo alocado pelo relógio para a
+        jogada; se ainda estiver buscando quando o tempo disponível estiver
+        para acabar, a busca é interrompida. Quem estoura o tempo perde.
+        
+        Args:
+            estrategia (EstrategiaJogo): Estratégia de quem joga
+            jogador_atual (CorPeca): Cor de quem joga
+            
+        Returns:
+            Optional[Movimento]: Jogada escolhida, ou None se o jogador
+            perdeu por tempo (a partida já está finalizada)
+        """
+        relogio = self.relogio
+        relogio.iniciar_turno(jogador_atual)
+        alocacao = relogio.alocar_tempo(self.tabuleiro.contar_pecas(CorPeca.BRANCA) +
+                                         self.tabuleiro.contar_pecas(CorPeca.PRETA))
+        estrategia.definir_prazo(relogio.inicio_turno + alocacao if alocacao is not None else None)
+        
+        alarme = None
+        disponivel = relogio.tempo_disponivel()
+        if disponivel is not None:
+            alarme = threading.Timer(max(0.0, disponivel - MARGEM_SEGURANCA),
+                                     estrategia.interromper_busca)
+            alarme.daemon = True
+            alarme.start()
+        try:
+            movimento = estrategia.escolher_movimento(self.tabuleiro, jogador_atual)
+        finally:
+            if alarme is not None:
+                alarme.cancel()
+            estrategia.definir_prazo(None)
+        
+        if not relogio.encerrar_turno():
+            self._log_evento('tempo', jogador_atual)
+            oponente = CorPeca.PRETA if jogador_atual == CorPeca.BRANCA else CorPeca.BRANCA
+            self.status.finalizar_jogo(oponente)
+            return None
+        return movimento
+    
+    def aplicar_jogada(self, movimento: Movimento, estatisticas: Dict[str, Any]) -> float:
+        """
+        Executa a jogada de quem tem a vez e registra-a na partida.
+        
+        Usado por jogar() e por quem conduz a partida jogada a jogada
+        (interface gráfica, servidor de partidas), com a jogada obtida por
+        outros meios.
+        
+        Args:
+            movimento (Movimento): Jogada (validada pelo tabuleiro)
+            estatisticas (Dict[str, Any]): Estatísticas da busca da jogada
+            
+        Returns:
+            float: Avaliação da posição após a jogada
+        """
+        jogador_atual = self.tabuleiro.turno_atual
         
         # Registrar estatísticas
-        estatisticas = estrategia.obter_estatisticas()
         self.status.estatisticas_jogadores[jogador_atual].append(estatisticas)
         
         # Executar movimento
         self.tabuleiro.executar_movimento(movimento)
+        self.notificar_jogada(jogador_atual, movimento)
         
         # Registrar evento
-        self._log_evento(f"{jogador_atual.value} jogou: {movimento}")
+        self._log_evento('jogada', jogador_atual, movimento)
         
         # Registrar avaliação da posição
         avaliacao = self.tabuleiro.avaliar_posicao()
         self.status.registrar_jogada(estatisticas, avaliacao)
+        return avaliacao
+    
+    def encerrar(self, vencedor: Optional[CorPeca], evento: Optional[str] = None, *dados):
+        """
+        Encerra a partida conduzida fora de jogar().
         
-        if self.exibir_tabuleiro:
-            print(f"Movimento: {movimento}")
-            if estatisticas['tempo_execucao'] > 0:
-                print(f"Tempo: {estatisticas['tempo_execucao']:.3f}s, "
-                      f"Nós explorados: {estatisticas['nos_explorados']}")
-            print(f"Avaliação: {avaliacao:.2f}")
-            print(self.tabuleiro.exibir())
+        Usado ao fim de uma partida jogada a jogada (depois de
+        verificar_termino()) ou por um motivo externo ao tabuleiro.
+        
+        Args:
+            vencedor (Optional[CorPeca]): Cor do vencedor (None para empate)
+            evento (Optional[str]): Tipo do evento registrado (ex.: 'tempo',
+                'desistencia'); None não registra evento
+            *dados: Argumentos do evento
+        """
+        if evento is not None:
+            self._log_evento(evento, *dados)
+        self.status.finalizar_jogo(vencedor)
+        self._finalizar_partida()
+    
+    def notificar_jogada(self, cor_jogador: CorPeca, movimento: Movimento):
+        """
+        Avisa a estratégia do oponente de uma jogada já executada.
+        
+        Args:
+            cor_jogador (CorPeca): Cor de quem fez a jogada
+            movimento (Movimento): Jogada executada
+        """
+        oponente = CorPeca.PRETA if cor_jogador == CorPeca.BRANCA else CorPeca.BRANCA
+        self.estrategias[oponente].notificar_jogada_oponente(self.tabuleiro, movimento)
+    
+    def encerrar_estrategias(self):
+        """Avisa as estratégias do fim da partida (por exemplo, para parar a ponderação)."""
+        for estrategia in {id(e): e for e in self.estrategias.values()}.values():
+            estrategia.encerrar_partida()
     
     def _finalizar_partida(self):
         """Finaliza a partida e exibe resultados."""
-        self._log_evento("Jogo finalizado")
+        self.encerrar_estrategias()
+        self._log_evento('fim')
+        self.registro_eventos.descarregar()
+        
+        if self.perfilar:
+            from .perfil import obter_perfil, diferenca_perfil
+            self.perfil_tabuleiro = diferenca_perfil(obter_perfil(), self._perfil_inicial)
         
         if self.exibir_tabuleiro:
             print("\n=== RESULTADO FINAL ===")
@@ -197,6 +358,11 @@ class JogoDamas:
                     print(f"  Tempo total: {tempo_total:.3f}s")
                     print(f"  Nós explorados: {nos_total}")
                     print(f"  Tempo médio por jogada: {tempo_total/len(stats):.3f}s")
+            
+            if self.perfil_tabuleiro is not None:
+                from .perfil import formatar_perfil
+                print("\nPerfil do tabuleiro:")
+                print(formatar_perfil(self.perfil_tabuleiro))
     
     def obter_resumo_partida(self) -> Dict[str, Any]:
         """
@@ -205,7 +371,7 @@ class JogoDamas:
         Returns:
             Dict[str, Any]: Dicionário com informações da partida
         """
-        return {
+        resumo = {
             'vencedor': self.status.vencedor.value if self.status.vencedor else None,
             'numero_jogadas': self.status.numero_jogadas,
             'avaliacao_final': str(self.tabuleiro.avaliar_posicao()) if abs(self.tabuleiro.avaliar_posicao()) == float('inf') or abs(self.tabuleiro.avaliar_posicao()) == float('-inf') else self.tabuleiro.avaliar_posicao(),
@@ -213,7 +379,7 @@ class JogoDamas:
                 'brancas': self.tabuleiro.contar_pecas(CorPeca.BRANCA),
                 'pretas': self.tabuleiro.contar_pecas(CorPeca.PRETA)
             },
-            'historico_avaliacoes': self.status.historico_avaliacoes,
+            'historico_avaliacoes': [str(a) for a in self.status.historico_avaliacoes],
             'estatisticas_jogadores': {
                 'branca': self.status.estatisticas_jogadores[CorPeca.BRANCA],
                 'preta': self.status.estatisticas_jogadores[CorPeca.PRETA]
@@ -221,6 +387,11 @@ class JogoDamas:
             'log_eventos': self.log_eventos,
             'historico_movimentos': [str(mov) for mov in self.tabuleiro.historico_movimentos]
         }
+        if self.perfil_tabuleiro is not None:
+            resumo['perfil_tabuleiro'] = self.perfil_tabuleiro
+        if self.relogio is not None:
+            resumo['relogio'] = self.relogio.resumo()
+        return resumo
     
     def salvar_partida(self, nome_arquivo: str):
         """
@@ -248,4 +419,19 @@ class JogoDamas:
         with open(nome_arquivo, 'w', encoding='utf-8') as f:
             json.dump(resumo, f, indent=2, ensure_ascii=False, default=converter_para_json)
         
-        print(f"Partida salva em: {nome_arquivo}") 
\ No newline at end of file
+        print(f"Partida salva em: {nome_arquivo}")
+    
+    def salvar_partida_binaria(self, nome_arquivo: str):
+        """
+        Acrescenta a partida a um arquivo binário de partidas.
+        
+        Mais compacto e rápido que salvar_partida(); veja o módulo
+        arquivo_partidas para o formato e para a leitura em lote.
+        
+        Args:
+            nome_arquivo (str): Arquivo de partidas (criado se não existir)
+        """
+        from .arquivo_partidas import EscritorArquivoPartidas
+        
+        with EscritorArquivoPartidas(nome_arquivo) as escritor:
+            escritor.escrever_partida(self)
@@ -0,0 +1,137 @@
+"""
+Modo de perfilamento do Tabuleiro.
+
+TabuleiroPerfilado é uma subclasse de Tabuleiro cujos métodos mais usados
+contam chamadas e acumulam tempo (time.perf_counter_ns). Como a troca é
+feita na construção do tabuleiro (JogoDamas(..., perfilar=True)), o
+Tabuleiro comum não tem nenhum custo extra. Cópias de um TabuleiroPerfilado
+também são perfiladas, então as cópias feitas pelos motores de busca entram
+na contagem.
+
+Os contadores são globais ao processo: obter_perfil() retorna o acumulado
+desde o último zerar_perfil(), e JogoDamas guarda a diferença de cada
+partida em obter_resumo_partida()['perfil_tabuleiro'].
+"""
+
+import functools
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from .tabuleiro import Tabuleiro
+
+
+# Métodos perfilados, na ordem do relatório
+METODOS_PERFILADOS = (
+    'obter_movimentos_possiveis',
+    '_buscar_capturas_recursivo',
+    'executar_movimento',
+    '_movimento_valido',
+    'copy',
+    'avaliar_posicao',
+    'jogo_terminado',
+)
+
+# Por método: [chamadas, tempo acumulado em nanossegundos]
+_contadores: Dict[str, List[int]] = {nome: [0, 0] for nome in METODOS_PERFILADOS}
+
+
+def _perfilar(nome: str, metodo: Callable) -> Callable:
+    """
+    Envolve um método com contador de chamadas e cronômetro.
+
+    Chamadas recursivas (como em _buscar_capturas_recursivo) são contadas,
+    mais de uma vez. A chamada mais externa é identificada por thread:
+    chamadas simultâneas em outras threads (ponderação, MCTS paralelo,
+    interface gráfica) também são cronometradas.
+    """
+    contador = _contadores[nome]
+    ativas = threading.local()
+    relogio = time.perf_counter_ns
+
+    @functools.wraps(metodo)
+    def perfilado(self, *args, **kwargs):
+        contador[0] += 1
+        if getattr(ativas, 'profundidade', 0):
+            return metodo(self, *args, **kwargs)
+        ativas.profundidade = 1
+        inicio = relogio()
+        try:
+            return metodo(self, *args, **kwargs)
+        finally:
+            contador[1] += relogio() - inicio
+            ativas.profundidade = 0
+
+    return perfilado
+
+
+class TabuleiroPerfilado(Tabuleiro):
+    """
+    Tabuleiro que mede chamadas e tempo dos métodos de METODOS_PERFILADOS.
+
+    Os tempos são inclusivos: o tempo de avaliar_posicao inclui as gerações
+    de jogadas feitas dentro dela.
+    """
+    pass
+
+
+for _nome in METODOS_PERFILADOS:
+    setattr(TabuleiroPerfilado, _nome, _perfilar(_nome, getattr(Tabuleiro, _nome)))
+del _nome
+
+
+def obter_perfil() -> Dict[str, Dict[str, float]]:
+    """
+    Retorna o perfil acumulado no processo.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Por método, 'chamadas' e 'tempo' (segundos)
+    """
+    return {nome: {'chamadas': chamadas, 'tempo': tempo_ns / 1e9}
+            for nome, (chamadas, tempo_ns) in _contadores.items()}
+
+
+def zerar_perfil() -> None:
+    """Zera os contadores de todos os métodos."""
+    for contador in _contadores.values():
+        contador[0] = 0
+        contador[1] = 0
+
+
+def diferenca_perfil(final: Dict[str, Dict[str, float]],
+                     inicial: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """
+    Calcula o perfil de um intervalo a partir de dois instantâneos.
+
+    Args:
+        final: Perfil no fim do intervalo
+        inicial: Perfil no início do intervalo
+
+    Returns:
+        Dict[str, Dict[str, float]]: Chamadas e tempo ocorridos no intervalo
+    """
+    return {nome: {'chamadas': final[nome]['chamadas'] - inicial[nome]['chamadas'],
+                   'tempo': final[nome]['tempo'] - inicial[nome]['tempo']}
+            for nome in final}
+
+
+def formatar_perfil(perfil: Optional[Dict[str, Dict[str, float]]] = None) -> str:
+    """
+    Formata um perfil como tabela de texto.
+
+    Args:
+        perfil: Perfil a formatar (padrão: o acumulado no processo)
+
+    Returns:
+        str: Tabela com chamadas, tempo total e tempo médio por método
+    """
+    if perfil is None:
+        perfil = obter_perfil()
+
+    linhas = [f"{'Método':<28} {'Chamadas':>10} {'Tempo (s)':>10} {'Médio (µs)':>11}"]
+    for nome in METODOS_PERFILADOS:
+        chamadas = perfil[nome]['chamadas']
+        tempo = perfil[nome]['tempo']
+        medio = tempo / chamadas * 1e6 if chamadas else 0.0
+        linhas.append(f"{nome:<28} {chamadas:>10} {tempo:>10.3f} {medio:>11.1f}")
+    return "\n".join(linhas)
@@ -0,0 +1,256 @@
+"""
+Controle de tempo das partidas.
+
+ControleTempo descreve o ritmo de jogo: tempo total por lado, incremento
+somado a cada jogada concluída e, opcionalmente, um limite por jogada
+(timeout_por_jogada da configuração de experimento). Relogio aplica o
+controle a uma partida: mede o tempo de cada jogada, desconta-o do lado
+que jogou e informa quando um lado estourou o tempo (perde a partida).
+
+Relogio.alocar_tempo() sugere quanto tempo gastar na próxima jogada
+(veja alocar_tempo()); JogoDamas passa esse prazo às estratégias com
+EstrategiaJogo.definir_prazo() e, como garantia, interrompe a busca
+(interromper_busca) quando o tempo disponível acaba.
+
+Os tempos são medidos com time.time(), o mesmo relógio usado pelos prazos
+das buscas.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from .peca import CorPeca
+
+
+# Estimativa de jogadas que ainda faltam (para cada lado), em função do
+# número de peças no tabuleiro: cerca de 36 na abertura e 18 com 6 peças
+JOGADAS_RESTANTES_MINIMAS = 12
+JOGADAS_RESTANTES_POR_PECA = 1.0
+
+# Fração do incremento somada à alocação e fração máxima do tempo
+# restante que uma única jogada pode usar
+FRACAO_INCREMENTO = 0.8
+FRACAO_MAXIMA = 0.5
+
+# Peso extra do meio-jogo, em que as decisões costumam ser mais difíceis
+PESO_MEIO_JOGO = 1.25
+PECAS_MEIO_JOGO = (10, 20)
+
+# Folga descontada do tempo disponível para cobrir o custo de devolver a jogada
+MARGEM_SEGURANCA = 0.05
+
+
+def alocar_tempo(restante: Optional[float], incremento: float, pecas: int,
+                 tempo_por_jogada: Optional[float] = None) -> Optional[float]:
+    """
+    Calcula o tempo a gastar em uma jogada.
+
+    O tempo restante é dividido pelas jogadas que ainda devem faltar
+    (estimadas pelo número de peças), com peso maior no meio-jogo, mais
+    parte do incremento. Uma jogada nunca usa mais que FRACAO_MAXIMA do
+    tempo restante nem mais que o limite por jogada.
+
+    Args:
+        restante (Optional[float]): Tempo restante do lado, em segundos
+            (None sem tempo total)
+        incremento (float): Incremento por jogada, em segundos
+        pecas (int): Número de peças no tabuleiro (dos dois lados)
+        tempo_por_jogada (Optional[float]): Limite por jogada, em segundos
+
+    Returns:
+        Optional[float]: Tempo da jogada, em segundos (None sem limite algum)
+    """
+    if restante is None:
+        if tempo_por_jogada is None:
+            return None
+        return max(0.0, tempo_por_jogada - MARGEM_SEGURANCA)
+
+    jogadas_restantes = JOGADAS_RESTANTES_MINIMAS + JOGADAS_RESTANTES_POR_PECA * pecas
+    peso = PESO_MEIO_JOGO if PECAS_MEIO_JOGO[0] <= pecas <= PECAS_MEIO_JOGO[1] else 1.0
+    alocacao = restante / jogadas_restantes * peso + incremento * FRACAO_INCREMENTO
+    alocacao = min(alocacao, restante * FRACAO_MAXIMA)
+    if tempo_por_jogada is not None:
+        alocacao = min(alocacao, tempo_por_jogada)
+    return max(0.0, alocacao - MARGEM_SEGURANCA)
+
+
+class ControleTempo:
+    """
+    Ritmo de jogo de uma partida.
+
+    Attributes:
+        tempo_total (Optional[float]): Tempo inicial de cada lado, em segundos
+            (None: sem tempo total)
+        incremento (float): Segundos somados ao lado após cada jogada
+        tempo_por_jogada (Optional[float]): Limite de cada jogada, em segundos
+            (None: sem limite por jogada)
+    """
+
+    def __init__(self, tempo_total: Optional[float] = None, incremento: float = 0.0,
+                 tempo_por_jogada: Optional[float] = None):
+        if tempo_total is None and tempo_por_jogada is None:
+            raise ValueError("Defina o tempo total e/ou o tempo por jogada")
+        self.tempo_total = tempo_total
+        self.incremento = incremento
+        self.tempo_por_jogada = tempo_por_jogada
+
+    @classmethod
+    def de_configuracao(cls, configuracao: Dict[str, Any]) -> Optional['ControleTempo']:
+        """
+        Cria o controle a partir das configurações de teste de um experimento.
+
+        Lê 'tempo_total', 'incremento' e 'timeout_por_jogada' (as chaves de
+        "configuracoes_teste" em configuracao_experimento.json).
+
+        Args:
+            configuracao (Dict[str, Any]): Configurações de teste
+
+        Returns:
+            Optional[ControleTempo]: Controle, ou None se nenhum tempo é definido
+        """
+        tempo_total = configuracao.get('tempo_total')
+        tempo_por_jogada = configuracao.get('timeout_por_jogada')
+        if tempo_total is None and tempo_por_jogada is None:
+            return None
+        return cls(tempo_total, configuracao.get('incremento', 0.0), tempo_por_jogada)
+
+    def para_dict(self) -> Dict[str, Optional[float]]:
+        """Controle como dicionário (para resumos em JSON)."""
+        return {
+            'tempo_total': self.tempo_total,
+            'incremento': self.incremento,
+            'tempo_por_jogada': self.tempo_por_jogada,
+        }
+
+
+class Relogio:
+    """
+    Relógio de uma partida.
+
+    A cada jogada: iniciar_turno() quando o lado recebe a vez e
+    encerrar_turno() quando ele devolve a jogada. Sem tempo total, só o
+    limite por jogada é verificado.
+    """
+
+    def __init__(self, controle: ControleTempo):
+        """
+        Args:
+            controle (ControleTempo): Ritmo de jogo
+        """
+        self.controle = controle
+        self.restante: Dict[CorPeca, Optional[float]] = {
+            CorPeca.BRANCA: controle.tempo_total,
+            CorPeca.PRETA: controle.tempo_total,
+        }
+        self.tempos_jogadas: Dict[CorPeca, List[float]] = {CorPeca.BRANCA: [], CorPeca.PRETA: []}
+        self.perdeu_por_tempo: Optional[CorPeca] = None
+        self.cor_turno: Optional[CorPeca] = None
+        self.inicio_turno = 0.0
+
+    def iniciar_turno(self, cor: CorPeca):
+        """
+        Começa a contar o tempo de um lado.
+
+        Args:
+            cor (CorPeca): Lado que recebe a vez
+        """
+        self.cor_turno = cor
+        self.inicio_turno = time.time()
+
+    def encerrar_turno(self) -> bool:
+        """
+        Para o relógio do lado que jogou, descontando o tempo gasto.
+
+        O incremento só é somado se a jogada terminou dentro do tempo.
+
+        Returns:
+            bool: Se a jogada terminou dentro do tempo; False marca o lado
+            em perdeu_por_tempo
+        """
+        cor = self.cor_turno
+        decorrido = time.time() - self.inicio_turno
+        self.cor_turno = None
+        self.tempos_jogadas[cor].append(decorrido)
+
+        dentro_do_tempo = (self.controle.tempo_por_jogada is None or
+                           decorrido <= self.controle.tempo_por_jogada)
+        if self.restante[cor] is not None:
+            self.restante[cor] -= decorrido
+            if self.restante[cor] < 0:
+                self.restante[cor] = 0.0
+                dentro_do_tempo = False
+            elif dentro_do_tempo:
+                self.restante[cor] += self.controle.incremento
+
+        if not dentro_do_tempo:
+            self.perdeu_por_tempo = cor
+        return dentro_do_tempo
+
+    def marcar_tempo_esgotado(self):
+        """Encerra o turno em andamento como derrota por tempo (alarme de quem conduz a partida)."""
+        cor = self.cor_turno
+        self.tempos_jogadas[cor].append(time.time() - self.inicio_turno)
+        self.cor_turno = None
+        if self.restante[cor] is not None:
+            self.restante[cor] = 0.0
+        self.perdeu_por_tempo = cor
+
+    def tempo_restante(self, cor: CorPeca) -> Optional[float]:
+        """
+        Tempo total restante de um lado, descontando o turno em andamento.
+
+        Args:
+            cor (CorPeca): Lado consultado
+
+        Returns:
+            Optional[float]: Segundos restantes (None sem tempo total)
+        """
+        restante = self.restante[cor]
+        if restante is not None and cor == self.cor_turno:
+            restante = max(0.0, restante - (time.time() - self.inicio_turno))
+        return restante
+
+    def tempo_disponivel(self) -> Optional[float]:
+        """
+        Tempo até o lado que está jogando estourar (total ou por jogada).
+
+        Returns:
+            Optional[float]: Segundos até a derrota por tempo (None sem limite)
+        """
+        decorrido = time.time() - self.inicio_turno
+        limites = []
+        if self.restante[self.cor_turno] is not None:
+            limites.append(self.restante[self.cor_turno] - decorrido)
+        if self.controle.tempo_por_jogada is not None:
+            limites.append(self.controle.tempo_por_jogada - decorrido)
+        return max(0.0, min(limites)) if limites else None
+
+    def alocar_tempo(self, pecas: int) -> Optional[float]:
+        """
+        Tempo a gastar na jogada em andamento (veja alocar_tempo()).
+
+        Args:
+            pecas (int): Número de peças no tabuleiro
+
+        Returns:
+            Optional[float]: Segundos para a jogada (None sem limite)
+        """
+        return alocar_tempo(self.tempo_restante(self.cor_turno), self.controle.incremento,
+                            pecas, self.controle.tempo_por_jogada)
+
+    def resumo(self) -> Dict[str, Any]:
+        """
+        Uso do relógio na partida.
+
+        Returns:
+            Dict[str, Any]: Controle de tempo, tempo restante, tempo usado,
+            tempo de cada jogada e maior jogada por lado, e quem perdeu por tempo
+        """
+        return {
+            'controle': self.controle.para_dict(),
+            'tempo_restante': {cor.value: self.tempo_restante(cor) for cor in CorPeca},
+            'tempo_usado': {cor.value: sum(self.tempos_jogadas[cor]) for cor in CorPeca},
+            'maior_jogada': {cor.value: max(self.tempos_jogadas[cor], default=0.0) for cor in CorPeca},
+            'tempos_jogadas': {cor.value: list(self.tempos_jogadas[cor]) for cor in CorPeca},
+            'perdeu_por_tempo': self.perdeu_por_tempo.value if self.perdeu_por_tempo else None,
+        }
@@ -7,7 +7,59 @@ movimento de peças, capturas, promoções e validações.
 
 from typing import List, Optional, Tuple, Dict, Set
 from copy import deepcopy
-from .peca import Peca, CorPeca
+import random
+import struct
+from .peca import Peca, CorPeca, TipoPeca
+
+
+# Casas escuras na numeração padrão PDN (1-32): a casa 1 é a primeira casa
+# escura da linha 0 e a casa 32 é a última casa escura da linha 7.
+CASAS_ESCURAS: Tuple[Tuple[int, int], ...] = tuple(
+    (linha, coluna) for linha in range(8) for coluna in range(8) if (linha + coluna) % 2 == 1
+)
+_INDICE_CASA: Dict[Tuple[int, int], int] = {posicao: i for i, posicao in enumerate(CASAS_ESCURAS)}
+
+# Formato binário compacto: máscaras de 32 bits (brancas, pretas, damas) + turno
+_FORMATO_BINARIO = struct.Struct('<IIIB')
+
+# Chaves de Zobrist (64 bits) de cada peça em cada casa, para o hash
+# incremental usado na detecção de repetições. A semente fixa mantém os
+# hashes iguais entre execuções e processos.
+_gerador_zobrist = random.Random(20250529)
+_CHAVES_ZOBRIST: Dict[CorPeca, Dict[TipoPeca, List[List[int]]]] = {
+    cor: {tipo: [[_gerador_zobrist.getrandbits(64) for _ in range(8)] for _ in range(8)]
+          for tipo in TipoPeca}
+    for cor in CorPeca
+}
+del _gerador_zobrist
+
+
+def posicao_para_casa(posicao: Tuple[int, int]) -> int:
+    """
+    Converte uma posição (linha, coluna) para o número da casa (1-32).
+    
+    Args:
+        posicao (Tuple[int, int]): Posição de uma casa escura
+        
+    Returns:
+        int: Número da casa na numeração PDN
+    """
+    return _INDICE_CASA[posicao] + 1
+
+
+def casa_para_posicao(casa: int) -> Tuple[int, int]:
+    """
+    Converte o número da casa (1-32) para a posição (linha, coluna).
+    
+    Args:
+        casa (int): Número da casa na numeração PDN
+        
+    Returns:
+        Tuple[int, int]: Posição correspondente no tabuleiro
+    """
+    if not 1 <= casa <= len(CASAS_ESCURAS):
+        raise ValueError(f"Casa inválida: {casa}")
+    return CASAS_ESCURAS[casa - 1]
 
 
 class MovimentoInvalidoError(Exception):
@@ -47,6 +99,30 @@ class Movimento:
                 self.destino == other.destino and 
                 self.capturas == other.capturas and
                 self.promocao == other.promocao)
+    
+    def to_pdn(self) -> str:
+        """
+        Retorna o movimento em notação PDN (ex.: "22-18", "22x15", "22x15x24").
+        
+        Capturas múltiplas são escritas com todas as casas em que a peça
+        pousa. Como a peça sempre pousa na casa logo após a peça capturada,
+        o caminho determina as capturas e cada jogada legal tem uma notação
+        diferente, mesmo quando duas capturas têm a mesma origem e o mesmo
+        destino.
+        
+        Returns:
+            str: Movimento em notação PDN
+        """
+        if not self.e_captura:
+            return f"{posicao_para_casa(self.origem)}-{posicao_para_casa(self.destino)}"
+        casas = [posicao_para_casa(self.origem)]
+        linha, coluna = self.origem
+        for linha_captura, coluna_captura in self.capturas:
+            dir_linha = 1 if linha_captura > linha else -1
+            dir_coluna = 1 if coluna_captura > coluna else -1
+            linha, coluna = linha_captura + dir_linha, coluna_captura + dir_coluna
+            casas.append(posicao_para_casa((linha, coluna)))
+        return 'x'.join(str(casa) for casa in casas)
 
 
 class Tabuleiro:
@@ -59,8 +135,32 @@ class Tabuleiro:
     
     TAMANHO = 8
     
-    def __init__(self):
-        """Inicializa o tabuleiro com a configuração inicial do jogo."""
+    # Regras de empate: a mesma posição pela terceira vez (com a mesma vez de
+    # jogar) ou 40 jogadas seguidas (20 de cada lado) sem captura e sem
+    # movimento de peça normal
+    LIMITE_REPETICOES = 3
+    LIMITE_SEM_PROGRESSO = 40
+    
+    # Características usadas por avaliar_posicao(), na ordem do vetor de pesos
+    CARACTERISTICAS_AVALIACAO = ('peca', 'dama', 'avanco', 'mobilidade', 'fileira_base', 'centro')
+    
+    # Pesos da função de avaliação (podem ser ajustados por utils/ajuste_pesos.py)
+    pesos_avaliacao: Dict[str, float] = {
+        'peca': 3.0,          # Peça normal
+        'dama': 10.0,         # Dama
+        'avanco': 0.1,        # Por fileira avançada de cada peça
+        'mobilidade': 0.1,    # Por movimento possível
+        'fileira_base': 0.0,  # Peça normal guardando a fileira de promoção adversária
+        'centro': 0.0,        # Peça nas casas centrais
+    }
+    
+    def __init__(self, inicializar_pecas: bool = True):
+        """
+        Inicializa o tabuleiro com a configuração inicial do jogo.
+        
+        Args:
+            inicializar_pecas (bool): Se False, cria um tabuleiro vazio
+        """
         self.tabuleiro: List[List[Optional[Peca]]] = [[None for _ in range(self.TAMANHO)] 
                                                       for _ in range(self.TAMANHO)]
         self.turno_atual = CorPeca.BRANCA  # Brancas sempre começam
@@ -69,7 +169,19 @@ class Tabuleiro:
             CorPeca.BRANCA: [],
             CorPeca.PRETA: []
         }
-        self._inicializar_pecas()
+        # Peças de cada cor indexadas pela casa (linha * TAMANHO + coluna),
+        # mantidas junto com a grade para que geração de jogadas, contagem e
+        # avaliação percorram só as peças existentes
+        self.pecas_por_cor: Dict[CorPeca, Dict[int, Peca]] = {CorPeca.BRANCA: {}, CorPeca.PRETA: {}}
+        # Hash da disposição das peças (sem o turno) e contador de jogadas sem
+        # captura nem movimento de peça normal; os históricos guardam os
+        # valores anteriores a cada movimento, para repetições e desfazer_movimento()
+        self.hash_posicao = 0
+        self.jogadas_sem_progresso = 0
+        self.historico_hashes: List[int] = []
+        self.historico_sem_progresso: List[int] = []
+        if inicializar_pecas:
+            self._inicializar_pecas()
     
     def _inicializar_pecas(self) -> None:
         """Inicializa as peças na posição inicial do jogo."""
@@ -84,6 +196,41 @@ class Tabuleiro:
             for coluna in range(self.TAMANHO):
                 if (linha + coluna) % 2 == 1:  # Apenas casas escuras
                     self.tabuleiro[linha][coluna] = Peca(CorPeca.BRANCA, (linha, coluna))
+        
+        self._indexar_pecas()
+    
+    def _indexar_pecas(self) -> None:
+        """
+        Reconstrói a partir da grade as peças por cor e o hash da posição.
+        
+        executar_movimento() e desfazer_movimento() os mantêm
+        incrementalmente; a reconstrução só é usada quando o tabuleiro é
+        montado diretamente (posição inicial, FEN, formato binário, cópia).
+        """
+        self.pecas_por_cor = {CorPeca.BRANCA: {}, CorPeca.PRETA: {}}
+        for linha in range(self.TAMANHO):
+            for coluna in range(self.TAMANHO):
+                peca = self.tabuleiro[linha][coluna]
+                if peca:
+                    self.pecas_por_cor[peca.cor][linha * self.TAMANHO + coluna] = peca
+        self.hash_posicao = self._calcular_hash()
+    
+    def _calcular_hash(self) -> int:
+        """
+        Calcula do zero o hash de Zobrist da disposição das peças.
+        
+        executar_movimento() e desfazer_movimento() o mantêm incrementalmente;
+        este cálculo só é usado por _indexar_pecas().
+        
+        Returns:
+            int: Hash de 64 bits (o turno não entra no hash)
+        """
+        hash_posicao = 0
+        for pecas in self.pecas_por_cor.values():
+            for peca in pecas.values():
+                linha, coluna = peca.posicao
+                hash_posicao ^= _CHAVES_ZOBRIST[peca.cor][peca.tipo][linha][coluna]
+        return hash_posicao
     
     def get_peca(self, posicao: Tuple[int, int]) -> Optional[Peca]:
         """
@@ -138,25 +285,20 @@ class Tabuleiro:
         """
         movimentos = []
         capturas_obrigatorias = []
+        pecas = self.obter_todas_pecas(cor)
         
         # Primeiro, verificar se há capturas obrigatórias
-        for linha in range(self.TAMANHO):
-            for coluna in range(self.TAMANHO):
-                peca = self.tabuleiro[linha][coluna]
-                if peca and peca.cor == cor:
-                    capturas = self._obter_capturas_peca(peca)
-                    capturas_obrigatorias.extend(capturas)
+        for peca in pecas:
+            capturas = self._obter_capturas_peca(peca)
+            capturas_obrigatorias.extend(capturas)
         
         # Se há capturas obrigatórias, retornar apenas elas
         if capturas_obrigatorias:
             return capturas_obrigatorias
         
         # Caso contrário, retornar movimentos normais
-        for linha in range(self.TAMANHO):
-            for coluna in range(self.TAMANHO):
-                peca = self.tabuleiro[linha][coluna]
-                if peca and peca.cor == cor:
-                    movimentos.extend(self._obter_movimentos_peca(peca))
+        for peca in pecas:
+            movimentos.extend(self._obter_movimentos_peca(peca))
         
         return movimentos
     
@@ -320,12 +462,15 @@ class Tabuleiro:
         
         return False
     
-    def executar_movimento(self, movimento: Movimento) -> bool:
+    def executar_movimento(self, movimento: Movimento, validar: bool = True) -> bool:
         """
         Executa um movimento no tabuleiro.
         
         Args:
             movimento (Movimento): Movimento a ser executado
+            validar (bool): Se deve verificar se o movimento é legal. Buscas que
+                só executam movimentos gerados por obter_movimentos_possiveis()
+                podem desativar a verificação
             
         Returns:
             bool: True se o movimento foi executado com sucesso
@@ -333,7 +478,7 @@ class Tabuleiro:
         Raises:
             MovimentoInvalidoError: Se o movimento é inválido
         """
-        if not self._movimento_valido(movimento):
+        if validar and not self._movimento_valido(movimento):
             raise MovimentoInvalidoError(f"Movimento inválido: {movimento}")
         
         # Obter a peça a ser movida
@@ -341,8 +486,21 @@ class Tabuleiro:
         if not peca:
             raise MovimentoInvalidoError("Não há peça na origem do movimento")
         
+        # Guardar hash e contador anteriores; capturas e movimentos de peça
+        # normal são irreversíveis e zeram o contador
+        self.historico_hashes.append(self.hash_posicao)
+        self.historico_sem_progresso.append(self.jogadas_sem_progresso)
+        if movimento.capturas or not peca.e_dama():
+            self.jogadas_sem_progresso = 0
+        else:
+            self.jogadas_sem_progresso += 1
+        chaves = _CHAVES_ZOBRIST[peca.cor]
+        hash_posicao = self.hash_posicao ^ chaves[peca.tipo][movimento.origem[0]][movimento.origem[1]]
+        pecas_jogador = self.pecas_por_cor[peca.cor]
+        
         # Remover a peça da posição original
         self.tabuleiro[movimento.origem[0]][movimento.origem[1]] = None
+        del pecas_jogador[movimento.origem[0] * self.TAMANHO + movimento.origem[1]]
         
         # Executar capturas
         for pos_captura in movimento.capturas:
@@ -350,14 +508,18 @@ class Tabuleiro:
             if peca_capturada:
                 self.pecas_capturadas[peca_capturada.cor].append(peca_capturada)
                 self.tabuleiro[pos_captura[0]][pos_captura[1]] = None
+                del self.pecas_por_cor[peca_capturada.cor][pos_captura[0] * self.TAMANHO + pos_captura[1]]
+                hash_posicao ^= _CHAVES_ZOBRIST[peca_capturada.cor][peca_capturada.tipo][pos_captura[0]][pos_captura[1]]
         
         # Mover a peça para o destino
         peca.mover_para(movimento.destino)
         self.tabuleiro[movimento.destino[0]][movimento.destino[1]] = peca
+        pecas_jogador[movimento.destino[0] * self.TAMANHO + movimento.destino[1]] = peca
         
         # Verificar promoção
         if movimento.promocao:
             peca.promover_a_dama()
+        self.hash_posicao = hash_posicao ^ chaves[peca.tipo][movimento.destino[0]][movimento.destino[1]]
         
         # Adicionar ao histórico e alternar turno
         self.historico_movimentos.append(movimento)
@@ -365,6 +527,52 @@ class Tabuleiro:
         
         return True
     
+    def desfazer_movimento(self) -> Movimento:
+        """
+        Desfaz o último movimento executado, restaurando peças capturadas,
+        promoção e turno.
+        
+        Permite que buscas explorem a árvore sobre um único tabuleiro, sem
+        copiá-lo a cada nó.
+        
+        Returns:
+            Movimento: Movimento desfeito
+            
+        Raises:
+            MovimentoInvalidoError: Se não há movimentos no histórico
+        """
+        if not self.historico_movimentos:
+            raise MovimentoInvalidoError("Não há movimento para desfazer")
+        
+        movimento = self.historico_movimentos.pop()
+        
+        # Voltar a peça para a origem
+        peca = self.tabuleiro[movimento.destino[0]][movimento.destino[1]]
+        self.tabuleiro[movimento.destino[0]][movimento.destino[1]] = None
+        peca.mover_para(movimento.origem)
+        self.tabuleiro[movimento.origem[0]][movimento.origem[1]] = peca
+        pecas_jogador = self.pecas_por_cor[peca.cor]
+        del pecas_jogador[movimento.destino[0] * self.TAMANHO + movimento.destino[1]]
+        pecas_jogador[movimento.origem[0] * self.TAMANHO + movimento.origem[1]] = peca
+        
+        if movimento.promocao:
+            peca.tipo = TipoPeca.NORMAL
+        
+        # Restaurar capturas (foram empilhadas na ordem de movimento.capturas)
+        cor_adversaria = CorPeca.PRETA if peca.cor == CorPeca.BRANCA else CorPeca.BRANCA
+        capturadas = self.pecas_capturadas[cor_adversaria]
+        pecas_adversario = self.pecas_por_cor[cor_adversaria]
+        for pos_captura in reversed(movimento.capturas):
+            peca_capturada = capturadas.pop()
+            self.tabuleiro[pos_captura[0]][pos_captura[1]] = peca_capturada
+            pecas_adversario[pos_captura[0] * self.TAMANHO + pos_captura[1]] = peca_capturada
+        
+        self.hash_posicao = self.historico_hashes.pop()
+        self.jogadas_sem_progresso = self.historico_sem_progresso.pop()
+        self.turno_atual = peca.cor
+        
+        return movimento
+    
     def _movimento_valido(self, movimento: Movimento) -> bool:
         """
         Verifica se um movimento é válido.
@@ -423,6 +631,40 @@ class Tabuleiro:
         
         return False, None
     
+    def repeticoes(self) -> int:
+        """
+        Conta quantas vezes a posição atual já ocorreu na partida.
+        
+        Só são comparadas as posições desde o último movimento irreversível
+        (captura ou movimento de peça normal) e com a mesma vez de jogar,
+        isto é, a um número par de jogadas da posição atual.
+        
+        Returns:
+            int: Ocorrências anteriores da posição (0 se ela é nova)
+        """
+        if self.jogadas_sem_progresso < 4:
+            return 0
+        hashes = self.historico_hashes
+        limite = min(self.jogadas_sem_progresso, len(hashes))
+        hash_posicao = self.hash_posicao
+        return sum(1 for distancia in range(4, limite + 1, 2) if hashes[-distancia] == hash_posicao)
+    
+    def verificar_empate(self) -> Optional[str]:
+        """
+        Verifica as regras de empate por repetição e por falta de progresso.
+        
+        Returns:
+            Optional[str]: 'repeticao' se a posição ocorreu pela
+            LIMITE_REPETICOES-ésima vez, 'sem_progresso' após
+            LIMITE_SEM_PROGRESSO jogadas sem captura nem movimento de peça
+            normal, ou None se nenhuma regra de empate se aplica
+        """
+        if self.jogadas_sem_progresso >= self.LIMITE_SEM_PROGRESSO:
+            return 'sem_progresso'
+        if self.repeticoes() >= self.LIMITE_REPETICOES - 1:
+            return 'repeticao'
+        return None
+    
     def contar_pecas(self, cor: CorPeca) -> int:
         """
         Conta o número de peças de uma cor no tabuleiro.
@@ -433,31 +675,24 @@ class Tabuleiro:
         Returns:
             int: Número de peças da cor especificada
         """
-        contador = 0
-        for linha in range(self.TAMANHO):
-            for coluna in range(self.TAMANHO):
-                peca = self.tabuleiro[linha][coluna]
-                if peca and peca.cor == cor:
-                    contador += 1
-        return contador
+        return len(self.pecas_por_cor[cor])
     
     def obter_todas_pecas(self, cor: CorPeca) -> List[Peca]:
         """
         Obtém todas as peças de uma cor no tabuleiro.
         
+        As peças vêm na ordem das casas (linha a linha), a mesma de uma
+        varredura da grade, para que a ordem das jogadas geradas não dependa
+        da ordem dos movimentos que levaram à posição.
+        
         Args:
             cor (CorPeca): Cor das peças
             
         Returns:
             List[Peca]: Lista com todas as peças da cor especificada
         """
-        pecas = []
-        for linha in range(self.TAMANHO):
-            for coluna in range(self.TAMANHO):
-                peca = self.tabuleiro[linha][coluna]
-                if peca and peca.cor == cor:
-                    pecas.append(peca)
-        return pecas
+        pecas = self.pecas_por_cor[cor]
+        return [pecas[casa] for casa in sorted(pecas)]
     
     def copy(self) -> 'Tabuleiro':
         """
@@ -466,11 +701,16 @@ class Tabuleiro:
         Returns:
             Tabuleiro: Nova instância do tabuleiro
         """
-        novo_tabuleiro = Tabuleiro()
+        # type(self) preserva subclasses (por exemplo, TabuleiroPerfilado)
+        novo_tabuleiro = type(self)(inicializar_pecas=False)
         novo_tabuleiro.tabuleiro = deepcopy(self.tabuleiro)
         novo_tabuleiro.turno_atual = self.turno_atual
         novo_tabuleiro.historico_movimentos = deepcopy(self.historico_movimentos)
         novo_tabuleiro.pecas_capturadas = deepcopy(self.pecas_capturadas)
+        novo_tabuleiro._indexar_pecas()
+        novo_tabuleiro.jogadas_sem_progresso = self.jogadas_sem_progresso
+        novo_tabuleiro.historico_hashes = list(self.historico_hashes)
+        novo_tabuleiro.historico_sem_progresso = list(self.historico_sem_progresso)
         return novo_tabuleiro
     
     def avaliar_posicao(self) -> float:
@@ -491,29 +731,210 @@ class Tabuleiro:
             else:
                 return 0.0  # Empate (caso raro em damas)
         
-        pontuacao = 0.0
+        pesos = self.pesos_avaliacao
+        caracteristicas = self.caracteristicas_avaliacao()
+        return sum(pesos[nome] * valor
+                   for nome, valor in zip(self.CARACTERISTICAS_AVALIACAO, caracteristicas))
+    
+    def caracteristicas_avaliacao(self) -> List[float]:
+        """
+        Calcula as características da posição usadas na avaliação.
         
-        # Contar peças e damas
-        for linha in range(self.TAMANHO):
-            for coluna in range(self.TAMANHO):
-                peca = self.tabuleiro[linha][coluna]
-                if peca:
-                    valor_peca = 10 if peca.e_dama() else 3
-                    if peca.cor == CorPeca.BRANCA:
-                        pontuacao += valor_peca
-                        # Bônus por posição (peças mais avançadas valem mais)
-                        pontuacao += (7 - linha) * 0.1
-                    else:
-                        pontuacao -= valor_peca
-                        # Bônus por posição (peças mais avançadas valem mais)
-                        pontuacao -= linha * 0.1
+        Cada característica é a diferença entre brancas e pretas, na ordem de
+        CARACTERISTICAS_AVALIACAO. A avaliação de uma posição não terminal é
+        a soma dos produtos destas características pelos pesos_avaliacao.
         
-        # Bônus por mobilidade (número de movimentos possíveis)
+        Returns:
+            List[float]: Valores das características
+        """
+        pecas = damas = avanco = fileira_base = centro = 0
+        
+        for cor, sinal in ((CorPeca.BRANCA, 1), (CorPeca.PRETA, -1)):
+            for peca in self.pecas_por_cor[cor].values():
+                linha, coluna = peca.posicao
+                if peca.e_dama():
+                    damas += sinal
+                else:
+                    pecas += sinal
+                    # Peças normais na própria primeira fileira impedem promoções
+                    if linha == (self.TAMANHO - 1 if sinal == 1 else 0):
+                        fileira_base += sinal
+                # Bônus por posição (peças mais avançadas valem mais)
+                avanco += (7 - linha) if sinal == 1 else -linha
+                if 3 <= linha <= 4 and 2 <= coluna <= 5:
+                    centro += sinal
+        
+        # Mobilidade (número de movimentos possíveis)
         movimentos_brancas = len(self.obter_movimentos_possiveis(CorPeca.BRANCA))
         movimentos_pretas = len(self.obter_movimentos_possiveis(CorPeca.PRETA))
-        pontuacao += (movimentos_brancas - movimentos_pretas) * 0.1
         
-        return pontuacao
+        return [pecas, damas, avanco, movimentos_brancas - movimentos_pretas, fileira_base, centro]
+    
+    @classmethod
+    def definir_pesos_avaliacao(cls, pesos: Dict[str, float]) -> None:
+        """
+        Define os pesos da função de avaliação para todos os tabuleiros.
+        
+        Args:
+            pesos (Dict[str, float]): Pesos por característica; características
+                omitidas mantêm o peso atual
+                
+        Raises:
+            ValueError: Se algum nome de característica é desconhecido
+        """
+        desconhecidas = set(pesos) - set(cls.CARACTERISTICAS_AVALIACAO)
+        if desconhecidas:
+            raise ValueError(f"Características desconhecidas: {sorted(desconhecidas)}")
+        cls.pesos_avaliacao = {**cls.pesos_avaliacao, **{k: float(v) for k, v in pesos.items()}}
+    
+    def to_fen(self) -> str:
+        """
+        Serializa a posição no formato FEN de damas (PDN).
+        
+        O formato é "<turno>:W<casas>:B<casas>", onde W são as peças brancas,
+        B as pretas e o turno é W ou B. As casas usam a numeração 1-32 e damas
+        são prefixadas com K. Posição inicial: "W:W21,...,32:B1,...,12".
+        
+        Returns:
+            str: Posição em notação FEN
+        """
+        casas = {CorPeca.BRANCA: [], CorPeca.PRETA: []}
+        for casa, (linha, coluna) in enumerate(CASAS_ESCURAS, 1):
+            peca = self.tabuleiro[linha][coluna]
+            if peca:
+                casas[peca.cor].append(f"K{casa}" if peca.e_dama() else str(casa))
+        
+        turno = 'W' if self.turno_atual == CorPeca.BRANCA else 'B'
+        return (f"{turno}:W{','.join(casas[CorPeca.BRANCA])}"
+                f":B{','.join(casas[CorPeca.PRETA])}")
+    
+    @classmethod
+    def from_fen(cls, fen: str) -> 'Tabuleiro':
+        """
+        Cria um tabuleiro a partir de uma posição em notação FEN.
+        
+        Aceita intervalos de casas no estilo PDN (ex.: "W:W21-32:B1-12").
+        
+        Args:
+            fen (str): Posição em notação FEN
+            
+        Returns:
+            Tabuleiro: Novo tabuleiro com a posição descrita
+            
+        Raises:
+            ValueError: Se a string não é uma posição FEN válida
+        """
+        campos = fen.strip().rstrip('.').split(':')
+        if not campos or campos[0].upper() not in ('W', 'B'):
+            raise ValueError(f"FEN inválido: {fen!r}")
+        
+        tabuleiro = cls(inicializar_pecas=False)
+        tabuleiro.turno_atual = CorPeca.BRANCA if campos[0].upper() == 'W' else CorPeca.PRETA
+        
+        for campo in campos[1:]:
+            if not campo:
+                continue
+            if campo[0].upper() not in ('W', 'B'):
+                raise ValueError(f"FEN inválido: {fen!r}")
+            cor = CorPeca.BRANCA if campo[0].upper() == 'W' else CorPeca.PRETA
+            
+            for item in campo[1:].split(','):
+                item = item.strip()
+                if not item:
+                    continue
+                tipo = TipoPeca.NORMAL
+                if item[0].upper() == 'K':
+                    tipo = TipoPeca.DAMA
+                    item = item[1:]
+                try:
+                    if '-' in item:
+                        inicio, fim = item.split('-')
+                        casas = range(int(inicio), int(fim) + 1)
+                    else:
+                        casas = (int(item),)
+                    for casa in casas:
+                        linha, coluna = casa_para_posicao(casa)
+                        tabuleiro.tabuleiro[linha][coluna] = Peca(cor, (linha, coluna), tipo)
+                except ValueError:
+                    raise ValueError(f"FEN inválido: {fen!r}") from None
+        
+        tabuleiro._indexar_pecas()
+        return tabuleiro
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serializa a posição em formato binário compacto (13 bytes).
+        
+        O formato contém três máscaras de 32 bits (peças brancas, peças pretas
+        e damas), indexadas pela numeração das casas, seguidas de um byte com
+        o turno (0 para brancas, 1 para pretas).
+        
+        Returns:
+            bytes: Posição empacotada
+        """
+        brancas = pretas = damas = 0
+        for peca in self.pecas_por_cor[CorPeca.BRANCA].values():
+            bit = 1 << _INDICE_CASA[peca.posicao]
+            brancas |= bit
+            if peca.e_dama():
+                damas |= bit
+        for peca in self.pecas_por_cor[CorPeca.PRETA].values():
+            bit = 1 << _INDICE_CASA[peca.posicao]
+            pretas |= bit
+            if peca.e_dama():
+                damas |= bit
+        
+        turno = 0 if self.turno_atual == CorPeca.BRANCA else 1
+        return _FORMATO_BINARIO.pack(brancas, pretas, damas, turno)
+    
+    @classmethod
+    def from_bytes(cls, dados: bytes) -> 'Tabuleiro':
+        """
+        Cria um tabuleiro a partir do formato binário de to_bytes().
+        
+        Args:
+            dados (bytes): Posição empacotada (13 bytes)
+            
+        Returns:
+            Tabuleiro: Novo tabuleiro com a posição descrita
+            
+        Raises:
+            ValueError: Se os dados não são uma posição binária válida
+        """
+        if len(dados) != _FORMATO_BINARIO.size:
+            raise ValueError(f"Posição binária inválida: {len(dados)} bytes "
+                             f"(esperados {_FORMATO_BINARIO.size})")
+        brancas, pretas, damas, turno = _FORMATO_BINARIO.unpack(dados)
+        if brancas & pretas:
+            raise ValueError("Posição binária inválida: casa ocupada por duas cores")
+        
+        tabuleiro = cls(inicializar_pecas=False)
+        tabuleiro.turno_atual = CorPeca.BRANCA if turno == 0 else CorPeca.PRETA
+        
+        ocupadas = brancas | pretas
+        while ocupadas:
+            bit = ocupadas & -ocupadas
+            indice = bit.bit_length() - 1
+            ocupadas ^= bit
+            linha, coluna = CASAS_ESCURAS[indice]
+            cor = CorPeca.BRANCA if brancas & bit else CorPeca.PRETA
+            tipo = TipoPeca.DAMA if damas & bit else TipoPeca.NORMAL
+            tabuleiro.tabuleiro[linha][coluna] = Peca(cor, (linha, coluna), tipo)
+        
+        tabuleiro._indexar_pecas()
+        return tabuleiro
+    
+    def chave_posicao(self) -> bytes:
+        """
+        Retorna uma chave que identifica a posição (peças e turno).
+        
+        Usada como chave de tabelas de transposição: posições iguais
+        alcançadas por caminhos diferentes têm a mesma chave.
+        
+        Returns:
+            bytes: Chave da posição
+        """
+        return self.to_bytes()
     
     def exibir(self) -> str:
         """
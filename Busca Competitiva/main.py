@@ -5,12 +5,15 @@ Este módulo fornece uma interface amigável para executar partidas,
 comparar algoritmos e realizar experimentos com diferentes estratégias.
 """
 
+import os
 import sys
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Importar módulos do jogo de damas
-from jogo_damas import JogoDamas, CorPeca
+from jogo_damas import (JogoDamas, CorPeca, RegistroNulo, ControleTempo,
+                        zerar_perfil, formatar_perfil)
+from utils.instrumentacao import agregar_estatisticas, formatar_estatisticas
 
 # Importar algoritmos de busca
 from exercicios.algoritmos_busca import (
@@ -47,14 +50,50 @@ def executar_partida_simples():
           f"Pretas: {resumo['pecas_restantes']['pretas']}")
 
 
-def executar_torneio_algoritmos(numero_partidas: int = 10):
+# Arquivos de configuração de experimento procurados, em ordem: o salvo pela
+# opção 6 do menu (no diretório atual) e o distribuído com o projeto
+ARQUIVOS_CONFIGURACAO = (
+    'configuracao_experimento.json',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils', 'configuracao_experimento.json'),
+)
+
+
+def carregar_controle_tempo() -> Optional[ControleTempo]:
+    """
+    Lê o controle de tempo da configuração de experimento.
+    
+    Usa "tempo_total", "incremento" e "timeout_por_jogada" de
+    "configuracoes_teste" no primeiro arquivo de ARQUIVOS_CONFIGURACAO.
+    
+    Returns:
+        Optional[ControleTempo]: Controle de tempo, ou None sem arquivo
+        ou sem tempo configurado
+    """
+    import json
+    
+    for nome_arquivo in ARQUIVOS_CONFIGURACAO:
+        if os.path.exists(nome_arquivo):
+            with open(nome_arquivo, encoding='utf-8') as f:
+                configuracao = json.load(f)
+            return ControleTempo.de_configuracao(configuracao.get('configuracoes_teste', {}))
+    return None
+
+
+def executar_torneio_algoritmos(numero_partidas: int = 10, perfilar: bool = False,
+                                controle_tempo: Optional[ControleTempo] = None):
     """
     Executa um torneio entre diferentes algoritmos de busca.
     
     Args:
         numero_partidas (int): Número de partidas para cada confronto
+        perfilar (bool): Se deve perfilar o tabuleiro e exibir o perfil
+            acumulado ao final do torneio
+        controle_tempo (Optional[ControleTempo]): Ritmo de jogo das partidas
+            (veja carregar_controle_tempo); quem estoura o tempo perde
     """
     print(f"=== TORNEIO DE ALGORITMOS ({numero_partidas} partidas cada) ===")
+    if controle_tempo is not None:
+        print(f"Controle de tempo: {controle_tempo.para_dict()}")
     print()
     
     # TODO: Quando os algoritmos estiverem implementados, descomente as linhas abaixo
@@ -74,6 +113,8 @@ def executar_torneio_algoritmos(numero_partidas: int = 10):
     }
     
     resultados = {}
+    if perfilar:
+        zerar_perfil()
     
     nomes_algoritmos = list(algoritmos.keys())
     for i, nome1 in enumerate(nomes_algoritmos):
@@ -83,10 +124,13 @@ def executar_torneio_algoritmos(numero_partidas: int = 10):
             vitorias_1 = 0
             vitorias_2 = 0
             empates = 0
+            derrotas_tempo = 0
             tempo_total_1 = 0
             tempo_total_2 = 0
             nos_total_1 = 0
             nos_total_2 = 0
+            estatisticas_1 = []
+            estatisticas_2 = []
             
             for partida in range(numero_partidas):
                 if partida % 2 == 0:
@@ -102,11 +146,16 @@ def executar_torneio_algoritmos(numero_partidas: int = 10):
                     estrategia_brancas=estrategia_brancas,
                     estrategia_pretas=estrategia_pretas,
                     exibir_tabuleiro=False,
-                    limite_jogadas=200
+                    limite_jogadas=200,
+                    registro_eventos=RegistroNulo(),
+                    perfilar=perfilar,
+                    controle_tempo=controle_tempo
                 )
                 
                 vencedor = jogo.jogar()
                 resumo = jogo.obter_resumo_partida()
+                if jogo.relogio is not None and jogo.relogio.perdeu_por_tempo is not None:
+                    derrotas_tempo += 1
                 
                 # Determinar vencedor do confronto
                 if vencedor is None:
@@ -121,6 +170,13 @@ def executar_torneio_algoritmos(numero_partidas: int = 10):
                 stats_brancas = resumo['estatisticas_jogadores']['branca']
                 stats_pretas = resumo['estatisticas_jogadores']['preta']
                 
+                if partida % 2 == 0:
+                    estatisticas_1.extend(stats_brancas)
+                    estatisticas_2.extend(stats_pretas)
+                else:
+                    estatisticas_1.extend(stats_pretas)
+                    estatisticas_2.extend(stats_brancas)
+                
                 if partida % 2 == 0:
                     # Algoritmo 1 com brancas
                     if stats_brancas:
@@ -144,19 +200,37 @@ def executar_torneio_algoritmos(numero_partidas: int = 10):
                 'vitorias_1': vitorias_1,
                 'vitorias_2': vitorias_2,
                 'empates': empates,
+                'derrotas_tempo': derrotas_tempo,
                 'tempo_medio_1': tempo_total_1 / numero_partidas if numero_partidas > 0 else 0,
                 'tempo_medio_2': tempo_total_2 / numero_partidas if numero_partidas > 0 else 0,
                 'nos_medio_1': nos_total_1 / numero_partidas if numero_partidas > 0 else 0,
-                'nos_medio_2': nos_total_2 / numero_partidas if numero_partidas > 0 else 0
+                'nos_medio_2': nos_total_2 / numero_partidas if numero_partidas > 0 else 0,
+                'instrumentacao_1': agregar_estatisticas(estatisticas_1),
+                'instrumentacao_2': agregar_estatisticas(estatisticas_2)
             }
             
             print(f"  {nome1}: {vitorias_1} vitórias")
             print(f"  {nome2}: {vitorias_2} vitórias")
             print(f"  Empates: {empates}")
+            if derrotas_tempo:
+                print(f"  Derrotas por tempo: {derrotas_tempo}")
             print(f"  Tempo médio - {nome1}: {tempo_total_1/numero_partidas:.3f}s, "
                   f"{nome2}: {tempo_total_2/numero_partidas:.3f}s")
+            
+            # Métricas dos motores instrumentados (utils/instrumentacao.py)
+            for nome, chave in ((nome1, 'instrumentacao_1'), (nome2, 'instrumentacao_2')):
+                linhas = formatar_estatisticas(resultados[confronto][chave])
+                if linhas:
+                    print(f"  Instrumentação - {nome}:")
+                    for linha in linhas:
+                        print(f"    {linha}")
             print()
     
+    if perfilar:
+        print("Perfil do tabuleiro (torneio completo):")
+        print(formatar_perfil())
+        print()
+    
     return resultados
 
 
@@ -261,7 +335,8 @@ def executar_teste_desempenho():
                 estrategia_brancas=estrategia,
                 estrategia_pretas=JogadorAleatorio(),
                 exibir_tabuleiro=False,
-                limite_jogadas=100
+                limite_jogadas=100,
+                registro_eventos=RegistroNulo()
             )
             
             inicio = time.time()
@@ -313,6 +388,8 @@ def salvar_configuracao_experimento():
             'partidas_por_confronto': 20,
             'limite_jogadas': 200,
             'timeout_por_jogada': 30.0,
+            'tempo_total': None,
+            'incremento': 0.0,
             'salvar_historicos': True
         },
         'metricas_avaliacao': [
@@ -430,7 +507,7 @@ def main():
                 executar_partida_simples()
             elif escolha == '2':
                 numero_partidas = int(input("Número de partidas por confronto (padrão 10): ") or "10")
-                executar_torneio_algoritmos(numero_partidas)
+                executar_torneio_algoritmos(numero_partidas, controle_tempo=carregar_controle_tempo())
             elif escolha == '3':
                 executar_analise_profundidade()
             elif escolha == '4':
@@ -0,0 +1,47 @@
+"""Testes do formato binário de jogo_damas/arquivo_partidas.py."""
+
+import random
+
+from jogo_damas import (Tabuleiro, EscritorArquivoPartidas, LeitorArquivoPartidas,
+                        indice_movimento, resolver_movimento)
+
+
+# Duas capturas de 25 para 18 com as mesmas cinco peças, em ordens diferentes
+FEN_CAPTURAS_AMBIGUAS = 'W:W21,23,24,25,27,28,29,31,32:B1,3,4,5,6,7,12,14,15,22'
+
+
+def _partida_aleatoria(rng, limite=200):
+    tabuleiro = Tabuleiro()
+    for _ in range(limite):
+        movimentos = tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)
+        if not movimentos:
+            break
+        tabuleiro.executar_movimento(rng.choice(movimentos), validar=False)
+    return tabuleiro.historico_movimentos
+
+
+def test_indice_distingue_capturas_com_mesmas_casas():
+    tabuleiro = Tabuleiro.from_fen(FEN_CAPTURAS_AMBIGUAS)
+    movimentos = tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)
+    assert len(movimentos) == 2 and movimentos[0] != movimentos[1]
+    for movimento in movimentos:
+        assert resolver_movimento(tabuleiro, indice_movimento(tabuleiro, movimento)) == movimento
+
+
+def test_partidas_aleatorias_sao_reproduzidas_exatamente(tmp_path):
+    rng = random.Random(2024)
+    partidas = [_partida_aleatoria(rng) for _ in range(300)]
+
+    caminho = str(tmp_path / 'partidas.bin')
+    with EscritorArquivoPartidas(caminho) as escritor:
+        for historico in partidas:
+            tabuleiro = Tabuleiro()
+            indices = []
+            for movimento in historico:
+                indices.append(indice_movimento(tabuleiro, movimento))
+                tabuleiro.executar_movimento(movimento, validar=False)
+            escritor.escrever(indices, 0)
+
+    with LeitorArquivoPartidas(caminho) as leitor:
+        reconstruidas = [partida.reconstruir() for partida in leitor]
+    assert reconstruidas == partidas
@@ -0,0 +1,18 @@
+"""Testes de regressão dos motores de utils/busca_avancada.py."""
+
+from jogo_damas import Tabuleiro, CorPeca
+from utils.busca_avancada import BuscaMTDf, BuscaNegamax
+
+
+def test_mtdf_termina_com_valores_iguais_por_arredondamento():
+    # Duas jogadas valem -9.8 e -9.799999999999999: os limites ficavam a
+    # 1 ulp e as passagens se repetiam indefinidamente
+    tabuleiro = Tabuleiro.from_fen('W:WK2:B5,18,23,K27')
+    mtdf = BuscaMTDf(profundidade_maxima=5)
+    movimento = mtdf.escolher_movimento(tabuleiro, CorPeca.BRANCA)
+
+    assert mtdf.passagens <= mtdf.MAXIMO_PASSAGENS * mtdf.profundidade_maxima
+    negamax = BuscaNegamax(profundidade_maxima=5)
+    negamax.escolher_movimento(tabuleiro, CorPeca.BRANCA)
+    assert abs(mtdf.melhor_valor_encontrado - negamax.melhor_valor_encontrado) < 1e-6
+    assert movimento in tabuleiro.obter_movimentos_possiveis(CorPeca.BRANCA)
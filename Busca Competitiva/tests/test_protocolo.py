@@ -0,0 +1,33 @@
+"""Testes da notação de jogadas de utils/protocolo.py."""
+
+import pytest
+
+from jogo_damas import Tabuleiro
+from utils.protocolo import interpretar_movimento, montar_posicao
+
+
+# Duas capturas de 25 para 18 com as mesmas cinco peças, em ordens diferentes
+FEN_CAPTURAS_AMBIGUAS = 'W:W21,23,24,25,27,28,29,31,32:B1,3,4,5,6,7,12,14,15,22'
+
+
+def test_capturas_com_mesmas_casas_tem_notacoes_diferentes():
+    tabuleiro = Tabuleiro.from_fen(FEN_CAPTURAS_AMBIGUAS)
+    movimentos = tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)
+    textos = [movimento.to_pdn() for movimento in movimentos]
+
+    assert textos == ['25x18x9x2x11x18', '25x18x11x2x9x18']
+    for movimento, texto in zip(movimentos, textos):
+        assert interpretar_movimento(tabuleiro, texto) == movimento
+
+
+def test_forma_abreviada_ambigua_e_rejeitada():
+    tabuleiro = Tabuleiro.from_fen(FEN_CAPTURAS_AMBIGUAS)
+    with pytest.raises(ValueError, match='ambígua'):
+        interpretar_movimento(tabuleiro, '25x18')
+
+
+def test_montar_posicao_usa_a_captura_indicada():
+    inicial = Tabuleiro.from_fen(FEN_CAPTURAS_AMBIGUAS)
+    segunda = inicial.obter_movimentos_possiveis(inicial.turno_atual)[1]
+    tabuleiro = montar_posicao(['fen', FEN_CAPTURAS_AMBIGUAS, 'moves', segunda.to_pdn()])
+    assert tabuleiro.historico_movimentos == [segunda]
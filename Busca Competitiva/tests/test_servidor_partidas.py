@@ -0,0 +1,67 @@
+"""Testes do servidor de partidas de utils/servidor_partidas.py."""
+
+import asyncio
+import json
+
+from jogo_damas import Tabuleiro
+from utils.protocolo import descrever_posicao, interpretar_movimento
+from utils.servidor_partidas import ServidorPartidas, buscar_jogada
+
+
+# Duas capturas de 25 para 18 com as mesmas cinco peças, em ordens diferentes
+FEN_CAPTURAS_AMBIGUAS = 'W:W21,23,24,25,27,28,29,31,32:B1,3,4,5,6,7,12,14,15,22'
+
+
+async def _receber(leitor, tipo, **campos):
+    while True:
+        mensagem = json.loads(await asyncio.wait_for(leitor.readline(), 5))
+        if mensagem['tipo'] == tipo and all(mensagem[c] == v for c, v in campos.items()):
+            return mensagem
+
+
+async def _jogar_segunda_captura():
+    servidor = ServidorPartidas(porta=0, processos=1)
+    await servidor.iniciar()
+    try:
+        leitor, escritor = await asyncio.open_connection(servidor.host, servidor.porta)
+
+        def enviar(mensagem):
+            escritor.write((json.dumps(mensagem) + "\n").encode('utf-8'))
+
+        enviar({'tipo': 'criar', 'branca': 'remoto', 'preta': 'remoto'})
+        numero = (await _receber(leitor, 'criada'))['partida']
+        partida = servidor.partidas[numero]
+        partida.jogo.tabuleiro = Tabuleiro.from_fen(FEN_CAPTURAS_AMBIGUAS)
+        segunda = partida.jogo.tabuleiro.obter_movimentos_possiveis(
+            partida.jogo.tabuleiro.turno_atual)[1]
+
+        enviar({'tipo': 'entrar', 'partida': numero, 'cor': 'branca'})
+        enviar({'tipo': 'entrar', 'partida': numero, 'cor': 'preta'})
+        estado = await _receber(leitor, 'estado', iniciada=True)
+        jogadas_legais = estado['jogadas_legais']
+
+        enviar({'tipo': 'jogar', 'partida': numero, 'jogada': '25x18'})
+        erro = await _receber(leitor, 'erro')
+        enviar({'tipo': 'jogar', 'partida': numero, 'jogada': segunda.to_pdn()})
+        estado = await _receber(leitor, 'estado', jogadas=1)
+
+        escritor.close()
+        return jogadas_legais, erro, estado, partida.jogo.tabuleiro.historico_movimentos, segunda
+    finally:
+        servidor.fechar()
+
+
+def test_jogador_remoto_escolhe_entre_capturas_com_mesmas_casas():
+    jogadas_legais, erro, estado, historico, segunda = asyncio.run(_jogar_segunda_captura())
+
+    assert jogadas_legais == ['25x18x9x2x11x18', '25x18x11x2x9x18']
+    assert 'ambígua' in erro['mensagem']
+    assert historico == [segunda]
+    assert estado['ultima_jogada'] == '25x18x11x2x9x18'
+
+
+def test_jogada_do_motor_e_interpretada_sem_ambiguidade():
+    tabuleiro = Tabuleiro.from_fen(FEN_CAPTURAS_AMBIGUAS)
+    texto, estatisticas = buscar_jogada('negamax', 2, None, descrever_posicao(tabuleiro))
+    assert texto.count('x') == 5
+    assert interpretar_movimento(tabuleiro, texto).to_pdn() == texto
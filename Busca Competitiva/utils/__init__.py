@@ -8,4 +8,4 @@ e configurações de experimentos.
 # Soluções completas são importadas apenas quando necessário
 # para evitar que estudantes vejam as respostas acidentalmente
 
-__all__ = ['solucao_exemplo'] 
\ No newline at end of file
+__all__ = ['solucao_exemplo', 'autojogo', 'ajuste_pesos', 'mcts', 'busca_avancada', 'instrumentacao', 'arvore_busca', 'ponderacao', 'protocolo', 'servidor_partidas'] 
\ No newline at end of file
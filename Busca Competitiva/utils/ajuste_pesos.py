@@ -0,0 +1,278 @@
+"""
+Ajuste dos pesos da função de avaliação pelo método de Texel.
+
+A partir das amostras de autojogo (utils/autojogo.py), os pesos de
+Tabuleiro.avaliar_posicao são ajustados para minimizar o erro quadrático
+entre o resultado das partidas e sigmoide(K * avaliação):
+
+    erro = média((resultado - sigmoide(K * X @ pesos)) ** 2)
+
+As características de todas as posições são calculadas uma única vez em
+uma matriz NumPy X, e o gradiente é calculado em lote sobre a matriz.
+
+Uso pela linha de comando:
+    python -m utils.ajuste_pesos --diretorio dados_autojogo --saida pesos_avaliacao.json
+
+Os pesos salvos são aplicados aos motores com carregar_pesos().
+"""
+
+import json
+import math
+import time
+from typing import Dict, Iterable, Tuple
+
+try:
+    import numpy as np
+    NUMPY_DISPONIVEL = True
+except ImportError:
+    NUMPY_DISPONIVEL = False
+
+from jogo_damas import Tabuleiro
+
+
+def _exigir_numpy():
+    if not NUMPY_DISPONIVEL:
+        raise ImportError("O ajuste de pesos requer NumPy. Instale com: pip install numpy")
+
+
+def montar_matrizes(amostras: Iterable[Tuple[bytes, float, int]],
+                    peso_resultado: float = 1.0,
+                    k_busca: float = 0.5) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Calcula a matriz de características e o vetor de alvos das amostras.
+
+    Amostras com valor de busca infinito (posições já decididas) são
+    descartadas, pois a avaliação estática não se aplica a elas.
+
+    Args:
+        amostras: Tuplas (posição empacotada, valor da busca, resultado)
+        peso_resultado (float): Peso do resultado da partida no alvo; o
+            restante vem de sigmoide(k_busca * valor da busca)
+        k_busca (float): Escala usada para converter o valor da busca em alvo
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Matriz X (N x características) e alvos y
+    """
+    _exigir_numpy()
+    linhas = []
+    alvos = []
+
+    for posicao, valor_busca, resultado in amostras:
+        if not math.isfinite(valor_busca):
+            continue
+        tabuleiro = Tabuleiro.from_bytes(posicao)
+        linhas.append(tabuleiro.caracteristicas_avaliacao())
+        alvo = (resultado + 1) / 2  # 1 vitória das brancas, 0.5 empate, 0 derrota
+        if peso_resultado < 1.0:
+            alvo = (peso_resultado * alvo +
+                    (1 - peso_resultado) / (1 + math.exp(-k_busca * valor_busca)))
+        alvos.append(alvo)
+
+    X = np.asarray(linhas, dtype=np.float64).reshape(-1, len(Tabuleiro.CARACTERISTICAS_AVALIACAO))
+    y = np.asarray(alvos, dtype=np.float64)
+    return X, y
+
+
+def _sigmoide(z: 'np.ndarray') -> 'np.ndarray':
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -500, 500)))
+
+
+def calcular_erro(X: 'np.ndarray', y: 'np.ndarray', pesos: 'np.ndarray', k: float) -> float:
+    """
+    Calcula o erro quadrático médio entre alvos e sigmoide(K * avaliação).
+
+    Args:
+        X (np.ndarray): Matriz de características
+        y (np.ndarray): Alvos (0 a 1, do ponto de vista das brancas)
+        pesos (np.ndarray): Vetor de pesos
+        k (float): Escala da sigmoide
+
+    Returns:
+        float: Erro médio
+    """
+    return float(np.mean((y - _sigmoide(k * (X @ pesos))) ** 2))
+
+
+def ajustar_k(X: 'np.ndarray', y: 'np.ndarray', pesos: 'np.ndarray',
+              k_min: float = 0.01, k_max: float = 5.0, iteracoes: int = 60) -> float:
+    """
+    Encontra a escala K que minimiza o erro com os pesos atuais.
+
+    Usa busca da seção áurea, supondo erro unimodal em K.
+
+    Args:
+        X (np.ndarray): Matriz de características
+        y (np.ndarray): Alvos
+        pesos (np.ndarray): Vetor de pesos
+        k_min (float): Limite inferior de K
+        k_max (float): Limite superior de K
+        iteracoes (int): Iterações da busca
+
+    Returns:
+        float: Melhor escala K encontrada
+    """
+    razao = (math.sqrt(5) - 1) / 2
+    a, b = k_min, k_max
+    c = b - razao * (b - a)
+    d = a + razao * (b - a)
+    erro_c = calcular_erro(X, y, pesos, c)
+    erro_d = calcular_erro(X, y, pesos, d)
+
+    for _ in range(iteracoes):
+        if erro_c < erro_d:
+            b, d, erro_d = d, c, erro_c
+            c = b - razao * (b - a)
+            erro_c = calcular_erro(X, y, pesos, c)
+        else:
+            a, c, erro_c = c, d, erro_d
+            d = a + razao * (b - a)
+            erro_d = calcular_erro(X, y, pesos, d)
+
+    return (a + b) / 2
+
+
+def ajustar_pesos(X: 'np.ndarray', y: 'np.ndarray', pesos_iniciais: 'np.ndarray', k: float,
+                  iteracoes: int = 2000, taxa_aprendizado: float = 0.05,
+                  tolerancia: float = 1e-9, exibir_progresso: bool = False) -> 'np.ndarray':
+    """
+    Minimiza o erro por descida de gradiente em lote (Adam).
+
+    Args:
+        X (np.ndarray): Matriz de características
+        y (np.ndarray): Alvos
+        pesos_iniciais (np.ndarray): Ponto de partida
+        k (float): Escala da sigmoide (mantida fixa)
+        iteracoes (int): Número máximo de iterações
+        taxa_aprendizado (float): Passo do Adam
+        tolerancia (float): Para quando o erro melhora menos que isto
+        exibir_progresso (bool): Se deve imprimir o erro periodicamente
+
+    Returns:
+        np.ndarray: Pesos ajustados
+    """
+    pesos = pesos_iniciais.astype(np.float64).copy()
+    momento = np.zeros_like(pesos)
+    variancia = np.zeros_like(pesos)
+    beta1, beta2, epsilon = 0.9, 0.999, 1e-8
+    n = len(y)
+    erro_anterior = float('inf')
+
+    for iteracao in range(1, iteracoes + 1):
+        previsao = _sigmoide(k * (X @ pesos))
+        residuo = previsao - y
+        erro = float(np.mean(residuo ** 2))
+        gradiente = (2.0 * k / n) * (X.T @ (residuo * previsao * (1.0 - previsao)))
+
+        momento = beta1 * momento + (1 - beta1) * gradiente
+        variancia = beta2 * variancia + (1 - beta2) * gradiente ** 2
+        momento_corrigido = momento / (1 - beta1 ** iteracao)
+        variancia_corrigida = variancia / (1 - beta2 ** iteracao)
+        pesos -= taxa_aprendizado * momento_corrigido / (np.sqrt(variancia_corrigida) + epsilon)
+
+        if exibir_progresso and iteracao % 100 == 0:
+            print(f"  Iteração {iteracao}: erro {erro:.6f}")
+        if abs(erro_anterior - erro) < tolerancia:
+            break
+        erro_anterior = erro
+
+    return pesos
+
+
+def executar_ajuste(amostras: Iterable[Tuple[bytes, float, int]],
+                    iteracoes: int = 2000,
+                    taxa_aprendizado: float = 0.05,
+                    peso_resultado: float = 1.0,
+                    exibir_progresso: bool = True) -> Dict[str, float]:
+    """
+    Executa o ajuste completo a partir dos pesos atuais do Tabuleiro.
+
+    Args:
+        amostras: Tuplas (posição empacotada, valor da busca, resultado)
+        iteracoes (int): Iterações da descida de gradiente
+        taxa_aprendizado (float): Passo do Adam
+        peso_resultado (float): Peso do resultado da partida no alvo
+        exibir_progresso (bool): Se deve imprimir o progresso
+
+    Returns:
+        Dict[str, float]: Pesos ajustados por característica
+    """
+    _exigir_numpy()
+    nomes = Tabuleiro.CARACTERISTICAS_AVALIACAO
+
+    inicio = time.time()
+    X, y = montar_matrizes(amostras, peso_resultado)
+    if len(y) == 0:
+        raise ValueError("Nenhuma amostra utilizável para o ajuste")
+    if exibir_progresso:
+        print(f"{len(y)} posições, características calculadas em {time.time() - inicio:.1f}s")
+
+    pesos = np.array([Tabuleiro.pesos_avaliacao[nome] for nome in nomes], dtype=np.float64)
+    k = ajustar_k(X, y, pesos)
+    if exibir_progresso:
+        print(f"K = {k:.4f}, erro inicial {calcular_erro(X, y, pesos, k):.6f}")
+
+    pesos = ajustar_pesos(X, y, pesos, k, iteracoes, taxa_aprendizado,
+                          exibir_progresso=exibir_progresso)
+    if exibir_progresso:
+        print(f"Erro final {calcular_erro(X, y, pesos, k):.6f} "
+              f"({time.time() - inicio:.1f}s no total)")
+
+    return {nome: float(valor) for nome, valor in zip(nomes, pesos)}
+
+
+def salvar_pesos(pesos: Dict[str, float], nome_arquivo: str) -> None:
+    """
+    Salva os pesos da avaliação em um arquivo JSON.
+
+    Args:
+        pesos (Dict[str, float]): Pesos por característica
+        nome_arquivo (str): Caminho do arquivo
+    """
+    with open(nome_arquivo, 'w', encoding='utf-8') as f:
+        json.dump(pesos, f, indent=2, ensure_ascii=False)
+
+
+def carregar_pesos(nome_arquivo: str, aplicar: bool = True) -> Dict[str, float]:
+    """
+    Carrega pesos de um arquivo JSON e, opcionalmente, aplica-os ao Tabuleiro.
+
+    Args:
+        nome_arquivo (str): Caminho do arquivo gerado por salvar_pesos()
+        aplicar (bool): Se deve definir os pesos usados por avaliar_posicao()
+
+    Returns:
+        Dict[str, float]: Pesos carregados
+    """
+    with open(nome_arquivo, 'r', encoding='utf-8') as f:
+        pesos = json.load(f)
+    if aplicar:
+        Tabuleiro.definir_pesos_avaliacao(pesos)
+    return pesos
+
+
+def main():
+    """Executa o ajuste pela linha de comando."""
+    import argparse
+    from utils.autojogo import ler_diretorio_amostras
+
+    parser = argparse.ArgumentParser(description="Ajusta os pesos da avaliação (método de Texel)")
+    parser.add_argument('--diretorio', default='dados_autojogo', help="Diretório das amostras")
+    parser.add_argument('--saida', default='pesos_avaliacao.json', help="Arquivo de pesos")
+    parser.add_argument('--iteracoes', type=int, default=2000)
+    parser.add_argument('--taxa', type=float, default=0.05, help="Taxa de aprendizado")
+    parser.add_argument('--peso-resultado', type=float, default=1.0,
+                        help="Peso do resultado no alvo (o restante vem do valor da busca)")
+    args = parser.parse_args()
+
+    pesos = executar_ajuste(ler_diretorio_amostras(args.diretorio), args.iteracoes,
+                            args.taxa, args.peso_resultado)
+    salvar_pesos(pesos, args.saida)
+
+    print("\nPesos ajustados:")
+    for nome, valor in pesos.items():
+        print(f"  {nome}: {valor:.4f}")
+    print(f"Salvos em: {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
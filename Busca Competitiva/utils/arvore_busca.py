@@ -0,0 +1,289 @@
+"""
+Registro da árvore de busca para análise offline.
+
+RegistroArvore grava, para cada nó visitado por uma busca alfa-beta, a
+jogada que levou ao nó, a janela (alfa, beta) na entrada, o valor retornado
+e se o nó foi podado (teve um corte beta e descartou irmãos restantes dos
+seus filhos). Os nós ficam em colunas compactas (array.array), e não em
+objetos Python, para que milhares de buscas caibam em memória e possam ser
+analisadas com NumPy (para_numpy()) ou salvas em arquivo binário.
+
+Colunas (um elemento por nó):
+
+- busca: número da busca no registro (uint32)
+- pai: índice do nó pai no registro, -1 na raiz (int32)
+- ply: distância até a raiz (uint8)
+- ordem: posição da jogada na lista de jogadas do pai (uint16)
+- movimento: jogada codificada com codificar_movimento() (uint16; 0 na raiz)
+- alfa, beta: janela na entrada do nó (float32)
+- valor: valor retornado pelo nó (float32)
+- filhos: número de jogadas legais no nó (uint16)
+- podado: 1 se o nó teve corte beta (uint8)
+- indice_corte: ordem do filho que causou o corte, -1 sem corte (int16)
+
+O registro é limitado por busca (profundidade_maxima e limite_nos); nós fora
+do limite não são gravados, e seus descendentes também não. O arquivo
+binário tem o cabeçalho b'ARVB', versão (uint16), reservado (uint16) e
+número de nós (uint32), seguido de cada coluna inteira, em little-endian.
+
+Os motores só registram quando recebem um registro (PodaAlfaBetaCompleta(
+..., registro_arvore=RegistroArvore())); sem ele, o custo é uma comparação
+com None por jogada.
+"""
+
+import struct
+import sys
+from array import array
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+    NUMPY_DISPONIVEL = True
+except ImportError:
+    NUMPY_DISPONIVEL = False
+
+from jogo_damas import Movimento
+from jogo_damas.arquivo_partidas import codificar_movimento
+
+
+ASSINATURA = b'ARVB'
+VERSAO = 1
+
+_CABECALHO = struct.Struct('<4sHHI')
+
+# Nome da coluna, código do array.array e tipo NumPy equivalente
+COLUNAS = (
+    ('busca', 'I', '<u4'),
+    ('pai', 'i', '<i4'),
+    ('ply', 'B', 'u1'),
+    ('ordem', 'H', '<u2'),
+    ('movimento', 'H', '<u2'),
+    ('alfa', 'f', '<f4'),
+    ('beta', 'f', '<f4'),
+    ('valor', 'f', '<f4'),
+    ('filhos', 'H', '<u2'),
+    ('podado', 'B', 'u1'),
+    ('indice_corte', 'h', '<i2'),
+)
+
+
+class RegistroArvore:
+    """
+    Árvore de busca gravada em colunas.
+
+    A busca chama iniciar_busca() na raiz, entrar()/sair() em volta de cada
+    chamada recursiva, definir_filhos() depois de gerar as jogadas de um nó,
+    marcar_corte() quando poda e finalizar_busca() ao terminar.
+    """
+
+    def __init__(self, profundidade_maxima: Optional[int] = None, limite_nos: int = 100000):
+        """
+        Args:
+            profundidade_maxima (Optional[int]): Maior ply gravado (padrão: todos)
+            limite_nos (int): Máximo de nós gravados por busca
+        """
+        self.profundidade_maxima = profundidade_maxima
+        self.limite_nos = limite_nos
+        self.colunas: Dict[str, array] = {nome: array(codigo) for nome, codigo, _ in COLUNAS}
+        self.buscas = 0
+        self.buscas_truncadas = 0
+        self._pilha: List[int] = []
+        self._nos_busca = 0
+        self._truncada = False
+
+    def __len__(self) -> int:
+        return len(self.colunas['pai'])
+
+    def _gravar(self, pai: int, ply: int, ordem: int, movimento: int,
+                alfa: float, beta: float) -> int:
+        colunas = self.colunas
+        indice = len(colunas['pai'])
+        colunas['busca'].append(self.buscas - 1)
+        colunas['pai'].append(pai)
+        colunas['ply'].append(min(ply, 255))
+        colunas['ordem'].append(ordem)
+        colunas['movimento'].append(movimento)
+        colunas['alfa'].append(alfa)
+        colunas['beta'].append(beta)
+        colunas['valor'].append(0.0)
+        colunas['filhos'].append(0)
+        colunas['podado'].append(0)
+        colunas['indice_corte'].append(-1)
+        self._nos_busca += 1
+        return indice
+
+    def iniciar_busca(self, alfa: float, beta: float) -> None:
+        """
+        Começa uma nova busca, gravando a raiz.
+
+        Args:
+            alfa (float): Alfa na raiz
+            beta (float): Beta na raiz
+        """
+        self.buscas += 1
+        self._nos_busca = 0
+        self._truncada = False
+        self._pilha = [self._gravar(-1, 0, 0, 0, alfa, beta)]
+
+    def entrar(self, movimento: Movimento, ordem: int, alfa: float, beta: float) -> None:
+        """
+        Registra a entrada em um filho do nó atual.
+
+        Args:
+            movimento (Movimento): Jogada que leva ao filho
+            ordem (int): Posição da jogada na lista do nó atual
+            alfa (float): Alfa passado ao filho
+            beta (float): Beta passado ao filho
+        """
+        pilha = self._pilha
+        pai = pilha[-1]
+        ply = len(pilha)
+        if (pai < 0 or (self.profundidade_maxima is not None and ply > self.profundidade_maxima)):
+            pilha.append(-1)
+        elif self._nos_busca >= self.limite_nos:
+            self._truncada = True
+            pilha.append(-1)
+        else:
+            pilha.append(self._gravar(pai, ply, ordem, codificar_movimento(movimento), alfa, beta))
+
+    def sair(self, valor: float) -> None:
+        """
+        Registra o valor retornado pelo filho atual e volta ao pai.
+
+        Args:
+            valor (float): Valor retornado pelo filho
+        """
+        indice = self._pilha.pop()
+        if indice >= 0:
+            self.colunas['valor'][indice] = valor
+
+    def definir_filhos(self, quantidade: int) -> None:
+        """
+        Registra o número de jogadas legais do nó atual.
+
+        Args:
+            quantidade (int): Número de jogadas geradas
+        """
+        indice = self._pilha[-1]
+        if indice >= 0:
+            self.colunas['filhos'][indice] = min(quantidade, 65535)
+
+    def marcar_corte(self, ordem: int) -> None:
+        """
+        Marca o nó atual como podado.
+
+        Args:
+            ordem (int): Posição do filho que causou o corte
+        """
+        indice = self._pilha[-1]
+        if indice >= 0:
+            self.colunas['podado'][indice] = 1
+            self.colunas['indice_corte'][indice] = ordem
+
+    def finalizar_busca(self, valor: float) -> None:
+        """
+        Termina a busca atual, gravando o valor da raiz.
+
+        Args:
+            valor (float): Valor da raiz
+        """
+        if self._pilha:
+            self.colunas['valor'][self._pilha[0]] = valor
+        self._pilha = []
+        if self._truncada:
+            self.buscas_truncadas += 1
+
+    def para_numpy(self) -> 'np.ndarray':
+        """
+        Converte o registro em um array estruturado NumPy.
+
+        Returns:
+            np.ndarray: Um elemento por nó, com um campo por coluna
+        """
+        if not NUMPY_DISPONIVEL:
+            raise ImportError("A conversão requer NumPy. Instale com: pip install numpy")
+        dados = np.empty(len(self), dtype=[(nome, tipo) for nome, _, tipo in COLUNAS])
+        for nome, _, tipo in COLUNAS:
+            dados[nome] = np.frombuffer(self.colunas[nome].tobytes(), dtype=tipo[-2:])
+        return dados
+
+    def salvar(self, caminho: str) -> None:
+        """
+        Salva o registro no formato binário.
+
+        Args:
+            caminho (str): Arquivo de destino
+        """
+        with open(caminho, 'wb') as arquivo:
+            arquivo.write(_CABECALHO.pack(ASSINATURA, VERSAO, 0, len(self)))
+            for nome, _, _ in COLUNAS:
+                coluna = self.colunas[nome]
+                if sys.byteorder == 'big':
+                    coluna = array(coluna.typecode, coluna)
+                    coluna.byteswap()
+                arquivo.write(coluna.tobytes())
+
+    @classmethod
+    def carregar(cls, caminho: str) -> 'RegistroArvore':
+        """
+        Carrega um registro salvo com salvar().
+
+        Args:
+            caminho (str): Arquivo de origem
+
+        Returns:
+            RegistroArvore: Registro com os nós do arquivo
+        """
+        registro = cls()
+        with open(caminho, 'rb') as arquivo:
+            assinatura, versao, _, total = _CABECALHO.unpack(arquivo.read(_CABECALHO.size))
+            if assinatura != ASSINATURA:
+                raise ValueError(f"{caminho} não é um arquivo de árvore de busca")
+            if versao != VERSAO:
+                raise ValueError(f"Versão de arquivo não suportada: {versao}")
+            for nome, codigo, _ in COLUNAS:
+                coluna = array(codigo)
+                coluna.frombytes(arquivo.read(total * coluna.itemsize))
+                if sys.byteorder == 'big':
+                    coluna.byteswap()
+                registro.colunas[nome] = coluna
+        if total:
+            registro.buscas = registro.colunas['busca'][-1] + 1
+        return registro
+
+    def resumo(self) -> Dict[str, Any]:
+        """
+        Calcula métricas de poda e ordenação a partir dos nós gravados.
+
+        Returns:
+            Dict[str, Any]: Nós e cortes por ply, taxa de cortes no primeiro
+            filho e fração de filhos descartados pelos cortes
+        """
+        colunas = self.colunas
+        nos_por_ply: List[int] = []
+        cortes_por_ply: List[int] = []
+        cortes = cortes_primeiro = filhos_total = filhos_podados = 0
+
+        for ply, filhos, podado, indice_corte in zip(colunas['ply'], colunas['filhos'],
+                                                     colunas['podado'], colunas['indice_corte']):
+            if ply >= len(nos_por_ply):
+                nos_por_ply.extend([0] * (ply + 1 - len(nos_por_ply)))
+                cortes_por_ply.extend([0] * (ply + 1 - len(cortes_por_ply)))
+            nos_por_ply[ply] += 1
+            filhos_total += filhos
+            if podado:
+                cortes_por_ply[ply] += 1
+                cortes += 1
+                if indice_corte == 0:
+                    cortes_primeiro += 1
+                filhos_podados += filhos - indice_corte - 1
+
+        return {
+            'buscas': self.buscas,
+            'buscas_truncadas': self.buscas_truncadas,
+            'nos': len(self),
+            'nos_por_profundidade': nos_por_ply,
+            'cortes_por_profundidade': cortes_por_ply,
+            'taxa_corte_primeira_jogada': cortes_primeiro / cortes if cortes else 0.0,
+            'fracao_filhos_podados': filhos_podados / filhos_total if filhos_total else 0.0,
+        }
@@ -0,0 +1,323 @@
+"""
+Geração de dados por autojogo para ajuste da função de avaliação.
+
+Este módulo joga partidas rápidas, sem interface, entre motores de busca
+em todos os núcleos disponíveis e grava amostras (posição, valor da busca,
+resultado da partida) em arquivos binários divididos em partes (shards).
+Essas amostras alimentam o ajuste dos pesos de Tabuleiro.avaliar_posicao.
+
+Formato de cada arquivo de amostras:
+- Cabeçalho: assinatura b'DAMS', versão (uint16), reservado (uint16)
+- Registros de 18 bytes: posição (13 bytes, Tabuleiro.to_bytes()), valor
+  da busca do ponto de vista das brancas (float32) e resultado da partida
+  (int8: 1 vitória das brancas, -1 das pretas, 0 empate)
+
+Uso pela linha de comando:
+    python -m utils.autojogo --partidas 1000 --diretorio dados_autojogo
+"""
+
+import glob
+import mmap
+import os
+import random
+import struct
+import time
+from multiprocessing import Pool
+from typing import Iterator, List, Optional, Tuple
+
+from jogo_damas import JogoDamas, Tabuleiro, Movimento, CorPeca, RegistroNulo
+from jogo_damas.arquivo_partidas import codificar_resultado
+from exercicios import EstrategiaJogo
+from utils.busca_avancada import BuscaNegamax
+
+
+ASSINATURA_AMOSTRAS = b'DAMS'
+VERSAO_AMOSTRAS = 1
+
+_CABECALHO = struct.Struct('<4sHH')
+_AMOSTRA = struct.Struct('<13sfb')
+
+
+class EstrategiaColetora(EstrategiaJogo):
+    """
+    Estratégia que joga com um motor de busca e coleta amostras.
+
+    A cada jogada registra a posição e o valor encontrado pelo motor.
+    Para diversificar as partidas, as primeiras jogadas são aleatórias
+    e, depois delas, cada jogada pode ser trocada por uma aleatória.
+    """
+
+    def __init__(self, motor: EstrategiaJogo, probabilidade_aleatoria: float = 0.1,
+                 jogadas_aleatorias: int = 4):
+        """
+        Inicializa a estratégia coletora.
+
+        Args:
+            motor (EstrategiaJogo): Motor de busca que escolhe as jogadas
+            probabilidade_aleatoria (float): Chance de trocar a jogada do motor
+                por uma jogada aleatória
+            jogadas_aleatorias (int): Jogadas iniciais (de cada lado) sempre
+                aleatórias e sem coleta de amostras
+        """
+        super().__init__(motor.profundidade_maxima)
+        self.motor = motor
+        self.probabilidade_aleatoria = probabilidade_aleatoria
+        self.jogadas_aleatorias = jogadas_aleatorias
+        self.amostras: List[Tuple[bytes, float]] = []
+
+    def escolher_movimento(self, tabuleiro: Tabuleiro, cor_jogador: CorPeca) -> Movimento:
+        """Escolhe a jogada com o motor e registra a amostra da posição."""
+        self.resetar_estatisticas()
+        inicio = time.time()
+
+        movimentos_possiveis = tabuleiro.obter_movimentos_possiveis(cor_jogador)
+        if not movimentos_possiveis:
+            raise ValueError("Não há movimentos possíveis para o jogador atual")
+
+        if len(tabuleiro.historico_movimentos) < 2 * self.jogadas_aleatorias:
+            movimento = random.choice(movimentos_possiveis)
+            self.nos_explorados = len(movimentos_possiveis)
+        else:
+            movimento = self.motor.escolher_movimento(tabuleiro, cor_jogador)
+            self.nos_explorados = self.motor.nos_explorados
+            valor = self.motor.melhor_valor_encontrado
+            if valor is not None:
+                self.amostras.append((tabuleiro.to_bytes(), valor))
+                self.melhor_valor_encontrado = valor
+            if random.random() < self.probabilidade_aleatoria:
+                movimento = random.choice(movimentos_possiveis)
+
+        self.melhor_movimento_encontrado = movimento
+        self.tempo_execucao = time.time() - inicio
+        return movimento
+
+
+class EscritorAmostras:
+    """Escritor de amostras de autojogo em um arquivo binário."""
+
+    def __init__(self, nome_arquivo: str):
+        """
+        Cria o arquivo de amostras (sobrescreve se existir).
+
+        Args:
+            nome_arquivo (str): Caminho do arquivo
+        """
+        self.nome_arquivo = nome_arquivo
+        self.amostras_escritas = 0
+        self._arquivo = open(nome_arquivo, 'wb')
+        self._arquivo.write(_CABECALHO.pack(ASSINATURA_AMOSTRAS, VERSAO_AMOSTRAS, 0))
+
+    def escrever(self, amostras: List[Tuple[bytes, float]], resultado: int) -> None:
+        """
+        Escreve as amostras de uma partida.
+
+        Args:
+            amostras (List[Tuple[bytes, float]]): Pares (posição, valor da busca)
+            resultado (int): Resultado da partida (1, -1 ou 0)
+        """
+        buffer = bytearray(len(amostras) * _AMOSTRA.size)
+        for i, (posicao, valor) in enumerate(amostras):
+            _AMOSTRA.pack_into(buffer, i * _AMOSTRA.size, posicao, valor, resultado)
+        self._arquivo.write(buffer)
+        self.amostras_escritas += len(amostras)
+
+    def fechar(self) -> None:
+        """Fecha o arquivo."""
+        self._arquivo.close()
+
+    def __enter__(self) -> 'EscritorAmostras':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.fechar()
+
+
+def ler_amostras(nome_arquivo: str) -> Iterator[Tuple[bytes, float, int]]:
+    """
+    Lê as amostras de um arquivo gerado por EscritorAmostras.
+
+    Args:
+        nome_arquivo (str): Caminho do arquivo
+
+    Returns:
+        Iterator: Tuplas (posição, valor da busca, resultado)
+    """
+    with open(nome_arquivo, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _CABECALHO.size:
+            raise ValueError(f"Arquivo de amostras sem cabeçalho: {nome_arquivo}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            assinatura, versao, _ = _CABECALHO.unpack_from(mapa)
+            if assinatura != ASSINATURA_AMOSTRAS or versao != VERSAO_AMOSTRAS:
+                raise ValueError(f"Arquivo não está no formato de amostras: {nome_arquivo}")
+            corpo = len(mapa) - _CABECALHO.size
+            fim = _CABECALHO.size + corpo - corpo % _AMOSTRA.size
+            dados = memoryview(mapa)[_CABECALHO.size:fim]
+            registros = _AMOSTRA.iter_unpack(dados)
+            try:
+                yield from registros
+            finally:
+                # O iterador mantém uma referência ao buffer do mapeamento
+                del registros
+                dados.release()
+
+
+def ler_diretorio_amostras(diretorio: str) -> Iterator[Tuple[bytes, float, int]]:
+    """
+    Lê as amostras de todos os arquivos de um diretório de autojogo.
+
+    Args:
+        diretorio (str): Diretório com os arquivos amostras_*.bin
+
+    Returns:
+        Iterator: Tuplas (posição, valor da busca, resultado)
+    """
+    for nome_arquivo in sorted(glob.glob(os.path.join(diretorio, 'amostras_*.bin'))):
+        yield from ler_amostras(nome_arquivo)
+
+
+def _gerar_shard(parametros: dict) -> Tuple[int, int, float]:
+    """Joga as partidas de uma parte e grava suas amostras (executa em um processo)."""
+    random.seed(parametros['semente'])
+    inicio = time.time()
+    partidas = 0
+
+    with EscritorAmostras(parametros['nome_arquivo']) as escritor:
+        for _ in range(parametros['numero_partidas']):
+            coletoras = [
+                EstrategiaColetora(
+                    parametros['classe_motor'](profundidade_maxima=parametros['profundidade']),
+                    parametros['probabilidade_aleatoria'],
+                    parametros['jogadas_aleatorias']
+                )
+                for _ in range(2)
+            ]
+            jogo = JogoDamas(
+                estrategia_brancas=coletoras[0],
+                estrategia_pretas=coletoras[1],
+                exibir_tabuleiro=False,
+                limite_jogadas=parametros['limite_jogadas'],
+                registro_eventos=RegistroNulo()
+            )
+            resultado = codificar_resultado(jogo.jogar())
+            for coletora in coletoras:
+                escritor.escrever(coletora.amostras, resultado)
+            partidas += 1
+        amostras = escritor.amostras_escritas
+
+    return partidas, amostras, time.time() - inicio
+
+
+def gerar_dados_autojogo(numero_partidas: int, diretorio: str,
+                         processos: Optional[int] = None,
+                         profundidade: int = 2,
+                         probabilidade_aleatoria: float = 0.1,
+                         jogadas_aleatorias: int = 4,
+                         limite_jogadas: int = 200,
+                         partidas_por_shard: int = 100,
+                         classe_motor: type = BuscaNegamax,
+                         semente: Optional[int] = None,
+                         exibir_progresso: bool = True) -> dict:
+    """
+    Gera amostras de treino jogando partidas de autojogo em paralelo.
+
+    Cada parte (shard) é jogada por um processo e gravada em
+    <diretorio>/amostras_NNNNN.bin.
+
+    Args:
+        numero_partidas (int): Total de partidas
+        diretorio (str): Diretório de saída (criado se não existir)
+        processos (Optional[int]): Número de processos (padrão: todos os núcleos)
+        profundidade (int): Profundidade de busca dos motores
+        probabilidade_aleatoria (float): Chance de jogada aleatória após a abertura
+        jogadas_aleatorias (int): Jogadas aleatórias de abertura por lado
+        limite_jogadas (int): Limite de jogadas por partida
+        partidas_por_shard (int): Partidas gravadas em cada arquivo
+        classe_motor (type): Classe do motor (deve preencher
+            melhor_valor_encontrado). O padrão, BuscaNegamax, busca sobre um
+            único tabuleiro (executar/desfazer); motores que copiam o
+            tabuleiro a cada nó, como PodaAlfaBetaCompleta, são várias
+            vezes mais lentos
+        semente (Optional[int]): Semente base para reprodução
+        exibir_progresso (bool): Se deve imprimir o progresso
+
+    Returns:
+        dict: Resumo com partidas, amostras, tempo e posições por segundo
+    """
+    os.makedirs(diretorio, exist_ok=True)
+    if semente is None:
+        semente = random.randrange(2 ** 31)
+
+    tarefas = []
+    restantes = numero_partidas
+    while restantes > 0:
+        indice = len(tarefas)
+        tarefas.append({
+            'nome_arquivo': os.path.join(diretorio, f"amostras_{indice:05d}.bin"),
+            'numero_partidas': min(partidas_por_shard, restantes),
+            'semente': semente + indice,
+            'classe_motor': classe_motor,
+            'profundidade': profundidade,
+            'probabilidade_aleatoria': probabilidade_aleatoria,
+            'jogadas_aleatorias': jogadas_aleatorias,
+            'limite_jogadas': limite_jogadas,
+        })
+        restantes -= partidas_por_shard
+
+    inicio = time.time()
+    total_partidas = 0
+    total_amostras = 0
+
+    with Pool(processos or os.cpu_count()) as pool:
+        for partidas, amostras, _ in pool.imap_unordered(_gerar_shard, tarefas):
+            total_partidas += partidas
+            total_amostras += amostras
+            if exibir_progresso:
+                decorrido = time.time() - inicio
+                print(f"Partidas: {total_partidas}/{numero_partidas} | "
+                      f"Amostras: {total_amostras} | "
+                      f"{total_amostras / decorrido:.0f} posições/s")
+
+    tempo_total = time.time() - inicio
+    return {
+        'partidas': total_partidas,
+        'amostras': total_amostras,
+        'arquivos': len(tarefas),
+        'tempo_total': tempo_total,
+        'posicoes_por_segundo': total_amostras / tempo_total if tempo_total > 0 else 0.0
+    }
+
+
+def main():
+    """Executa a geração de dados pela linha de comando."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gera amostras de autojogo para ajuste da avaliação")
+    parser.add_argument('--partidas', type=int, default=1000, help="Número total de partidas")
+    parser.add_argument('--diretorio', default='dados_autojogo', help="Diretório de saída")
+    parser.add_argument('--processos', type=int, default=None, help="Processos (padrão: todos os núcleos)")
+    parser.add_argument('--profundidade', type=int, default=2, help="Profundidade de busca")
+    parser.add_argument('--aleatoriedade', type=float, default=0.1,
+                        help="Probabilidade de jogada aleatória")
+    parser.add_argument('--abertura', type=int, default=4,
+                        help="Jogadas aleatórias de abertura por lado")
+    parser.add_argument('--partidas-por-arquivo', type=int, default=100)
+    parser.add_argument('--semente', type=int, default=None)
+    args = parser.parse_args()
+
+    resumo = gerar_dados_autojogo(
+        args.partidas, args.diretorio,
+        processos=args.processos,
+        profundidade=args.profundidade,
+        probabilidade_aleatoria=args.aleatoriedade,
+        jogadas_aleatorias=args.abertura,
+        partidas_por_shard=args.partidas_por_arquivo,
+        semente=args.semente
+    )
+
+    print(f"\n{resumo['partidas']} partidas, {resumo['amostras']} amostras em "
+          f"{resumo['arquivos']} arquivos ({resumo['tempo_total']:.1f}s, "
+          f"{resumo['posicoes_por_segundo']:.0f} posições/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1046 @@
+"""
+Motores de busca avançados baseados em negamax.
+
+Diferente das soluções de referência (utils/solucao_exemplo.py), que
+duplicam os ramos de maximização e minimização e copiam o tabuleiro a cada
+nó, estes motores usam a formulação negamax (o valor de um nó é sempre do
+ponto de vista de quem joga) e exploram a árvore sobre um único tabuleiro,
+com executar_movimento/desfazer_movimento. Uma posição que repete outra da
+partida ou da linha buscada (Tabuleiro.repeticoes) e uma linha sem progresso
+(Tabuleiro.LIMITE_SEM_PROGRESSO) valem empate.
+
+Componentes compartilháveis entre motores:
+- TabelaTransposicao: guarda valores e melhores jogadas por posição
+- OrdenacaoMovimentos: ordena as jogadas (jogada da tabela, capturas,
+  killer moves e heurística de histórico)
+- ReducaoJogadasTardias: configuração das reduções de jogadas tardias
+
+Motores:
+- BuscaNegamax: alfa-beta negamax com tabela, ordenação,
+  aprofundamento iterativo e reduções de jogadas tardias opcionais
+- BuscaPVS: Principal Variation Search (NegaScout)
+- BuscaMTDf: MTD(f), sequência de buscas de janela nula
+- ExpectMiniMaxStar: Expect MiniMax com poda Star1/Star2 nos nós de chance
+
+Para comparar os nós explorados com a PodaAlfaBetaCompleta:
+    python -m utils.busca_avancada
+"""
+
+import math
+import time
+from typing import Dict, List, Optional, Tuple
+
+from jogo_damas import Tabuleiro, Movimento, CorPeca
+from exercicios import EstrategiaJogo
+from utils.instrumentacao import InstrumentacaoBusca
+
+
+# Valores de vitória são finitos para permitir janelas nulas; vitórias mais
+# rápidas valem mais (VALOR_VITORIA - número de jogadas até a vitória)
+VALOR_VITORIA = 100000.0
+LIMITE_VITORIA = VALOR_VITORIA - 1000
+INFINITO = float('inf')
+VALOR_EMPATE = 0.0
+
+# O prazo é consultado a cada 64 nós: a busca termina poucos milissegundos
+# depois do prazo, o que permite prazos curtos impostos pelo relógio
+MASCARA_VERIFICACAO_PRAZO = 63
+
+# Tipos de entrada da tabela de transposição
+EXATO = 0
+LIMITE_INFERIOR = 1  # O valor real é >= valor guardado (corte beta)
+LIMITE_SUPERIOR = 2  # O valor real é <= valor guardado (nenhuma jogada superou alfa)
+
+
+class TempoEsgotado(Exception):
+    """Exceção interna para interromper a busca quando o tempo acaba."""
+    pass
+
+
+class TabelaTransposicao:
+    """
+    Tabela de transposição: valores já calculados por posição.
+
+    Cada entrada é a tupla (profundidade, valor, tipo, melhor_movimento),
+    indexada por Tabuleiro.chave_posicao(). Valores de vitória são guardados
+    relativos ao nó, para valerem em qualquer ply em que a posição reapareça.
+    Quando a tabela enche, ela é esvaziada.
+
+    Uma mesma tabela pode ser passada a vários motores.
+    """
+
+    def __init__(self, tamanho_maximo: int = 1000000):
+        """
+        Inicializa a tabela.
+
+        Args:
+            tamanho_maximo (int): Número máximo de entradas
+        """
+        self.tamanho_maximo = tamanho_maximo
+        self.entradas: Dict[bytes, Tuple[int, float, int, Optional[Movimento]]] = {}
+        self.consultas = 0
+        self.acertos = 0
+
+    def consultar(self, chave: bytes, ply: int) -> Optional[Tuple[int, float, int, Optional[Movimento]]]:
+        """
+        Procura uma posição na tabela.
+
+        Args:
+            chave (bytes): Chave da posição
+            ply (int): Distância do nó até a raiz da busca
+
+        Returns:
+            Optional[Tuple]: (profundidade, valor, tipo, melhor_movimento) ou None
+        """
+        self.consultas += 1
+        entrada = self.entradas.get(chave)
+        if entrada is None:
+            return None
+        self.acertos += 1
+        profundidade, valor, tipo, movimento = entrada
+        if valor >= LIMITE_VITORIA:
+            valor -= ply
+        elif valor <= -LIMITE_VITORIA:
+            valor += ply
+        return profundidade, valor, tipo, movimento
+
+    def armazenar(self, chave: bytes, ply: int, profundidade: int, valor: float,
+                  tipo: int, movimento: Optional[Movimento]) -> None:
+        """
+        Guarda o resultado da busca de uma posição.
+
+        Args:
+            chave (bytes): Chave da posição
+            ply (int): Distância do nó até a raiz da busca
+            profundidade (int): Profundidade restante com que o nó foi buscado
+            valor (float): Valor encontrado
+            tipo (int): EXATO, LIMITE_INFERIOR ou LIMITE_SUPERIOR
+            movimento (Optional[Movimento]): Melhor jogada encontrada
+        """
+        if len(self.entradas) >= self.tamanho_maximo and chave not in self.entradas:
+            self.entradas.clear()
+        if valor >= LIMITE_VITORIA:
+            valor += ply
+        elif valor <= -LIMITE_VITORIA:
+            valor -= ply
+        self.entradas[chave] = (profundidade, valor, tipo, movimento)
+
+    def limpar(self) -> None:
+        """Remove todas as entradas e zera os contadores."""
+        self.entradas.clear()
+        self.consultas = 0
+        self.acertos = 0
+
+
+class OrdenacaoMovimentos:
+    """
+    Ordenação de jogadas para aumentar os cortes da poda.
+
+    Ordem: jogada da tabela de transposição, capturas (mais peças primeiro),
+    promoções, killer moves do ply e, por fim, a heurística de histórico
+    (jogadas que causaram cortes em buscas anteriores).
+
+    Uma mesma ordenação pode ser passada a vários motores.
+    """
+
+    def __init__(self, killers_por_ply: int = 2):
+        """
+        Inicializa as tabelas de ordenação.
+
+        Args:
+            killers_por_ply (int): Killer moves guardados por ply
+        """
+        self.killers_por_ply = killers_por_ply
+        self.killers: List[List[Movimento]] = []
+        self.historico: Dict[tuple, int] = {}
+
+    def ordenar(self, movimentos: List[Movimento], ply: int,
+                movimento_tabela: Optional[Movimento] = None) -> List[Movimento]:
+        """
+        Ordena as jogadas da mais para a menos promissora.
+
+        Args:
+            movimentos (List[Movimento]): Jogadas legais do nó
+            ply (int): Distância do nó até a raiz da busca
+            movimento_tabela (Optional[Movimento]): Melhor jogada guardada na tabela
+
+        Returns:
+            List[Movimento]: Jogadas ordenadas
+        """
+        killers = self.killers[ply] if ply < len(self.killers) else ()
+        historico = self.historico
+
+        def prioridade(movimento: Movimento) -> float:
+            if movimento_tabela is not None and movimento == movimento_tabela:
+                return 3e9
+            if movimento.e_captura:
+                return 2e9 + len(movimento.capturas) * 10 + movimento.promocao
+            if movimento.promocao:
+                return 1.5e9
+            for indice, killer in enumerate(killers):
+                if movimento == killer:
+                    return 1e9 - indice
+            return historico.get((movimento.origem, movimento.destino), 0)
+
+        return sorted(movimentos, key=prioridade, reverse=True)
+
+    def registrar_corte(self, movimento: Movimento, profundidade: int, ply: int) -> None:
+        """
+        Registra uma jogada que causou corte beta.
+
+        Args:
+            movimento (Movimento): Jogada que causou o corte
+            profundidade (int): Profundidade restante do nó
+            ply (int): Distância do nó até a raiz da busca
+        """
+        if movimento.e_captura:
+            return
+        while len(self.killers) <= ply:
+            self.killers.append([])
+        killers = self.killers[ply]
+        if movimento not in killers:
+            killers.insert(0, movimento)
+            del killers[self.killers_por_ply:]
+        chave = (movimento.origem, movimento.destino)
+        self.historico[chave] = self.historico.get(chave, 0) + profundidade * profundidade
+
+    def nova_busca(self) -> None:
+        """Prepara uma nova busca: descarta killers e envelhece o histórico."""
+        self.killers = []
+        self.historico = {chave: valor // 2 for chave, valor in self.historico.items() if valor > 1}
+
+
+class ReducaoJogadasTardias:
+    """
+    Configuração das reduções de jogadas tardias (Late Move Reductions).
+
+    Com boa ordenação, as jogadas do fim da lista raramente são as melhores.
+    Elas são buscadas primeiro com profundidade reduzida e janela nula; só
+    se superarem alfa são buscadas de novo com a profundidade completa.
+    Capturas, promoções e as primeiras jogadas nunca são reduzidas.
+
+    A redução é lida de uma tabela indexada por [profundidade][índice da
+    jogada]. Por padrão, a tabela segue base + ln(profundidade) * ln(índice) / divisor.
+    """
+
+    TAMANHO_TABELA = 64
+
+    def __init__(self, jogadas_completas: int = 3, profundidade_minima: int = 3,
+                 base: float = 0.75, divisor: float = 2.25,
+                 tabela: Optional[List[List[int]]] = None):
+        """
+        Inicializa a configuração.
+
+        Args:
+            jogadas_completas (int): Jogadas de cada nó buscadas sem redução (K)
+            profundidade_minima (int): Profundidade restante mínima para reduzir
+            base (float): Termo constante da fórmula da tabela
+            divisor (float): Divisor da fórmula da tabela
+            tabela (Optional[List[List[int]]]): Tabela de reduções explícita,
+                [profundidade][índice]; substitui a fórmula
+        """
+        self.jogadas_completas = jogadas_completas
+        self.profundidade_minima = profundidade_minima
+        if tabela is None:
+            tabela = [[0 if profundidade == 0 or indice == 0 else
+                       int(base + math.log(profundidade) * math.log(indice) / divisor)
+                       for indice in range(self.TAMANHO_TABELA)]
+                      for profundidade in range(self.TAMANHO_TABELA)]
+        self.tabela = tabela
+
+    def reducao(self, movimento: Movimento, profundidade: int, indice: int) -> int:
+        """
+        Calcula a redução de uma jogada.
+
+        Args:
+            movimento (Movimento): Jogada a buscar
+            profundidade (int): Profundidade restante do nó
+            indice (int): Posição da jogada na lista ordenada
+
+        Returns:
+            int: Número de níveis a reduzir (0 para busca completa)
+        """
+        if (indice < self.jogadas_completas or profundidade < self.profundidade_minima or
+                movimento.e_captura or movimento.promocao):
+            return 0
+        linha = self.tabela[min(profundidade, len(self.tabela) - 1)]
+        reducao = linha[min(indice, len(linha) - 1)]
+        # Manter ao menos um nível de busca
+        return max(0, min(reducao, profundidade - 2))
+
+
+class BuscaNegamax(EstrategiaJogo):
+    """
+    Poda alfa-beta na formulação negamax, com tabela de transposição,
+    ordenação de jogadas e aprofundamento iterativo.
+
+    Serve de base para os demais motores deste módulo, que redefinem a
+    busca na raiz (_buscar_raiz) ou a busca de cada filho (_buscar_filho).
+    """
+
+    def __init__(self, profundidade_maxima: int = 6,
+                 tempo_limite: Optional[float] = None,
+                 tabela_transposicao: Optional[TabelaTransposicao] = None,
+                 ordenacao: Optional[OrdenacaoMovimentos] = None,
+                 reducoes: Optional[ReducaoJogadasTardias] = None,
+                 instrumentar: bool = False):
+        """
+        Inicializa o motor.
+
+        Args:
+            profundidade_maxima (int): Profundidade máxima do aprofundamento iterativo
+            tempo_limite (Optional[float]): Tempo máximo por jogada, em segundos
+            tabela_transposicao (Optional[TabelaTransposicao]): Tabela compartilhada
+                (padrão: uma tabela própria)
+            ordenacao (Optional[OrdenacaoMovimentos]): Ordenação compartilhada
+                (padrão: uma ordenação própria)
+            reducoes (Optional[ReducaoJogadasTardias]): Reduções de jogadas
+                tardias (padrão: desativadas)
+            instrumentar (bool): Se deve coletar métricas por profundidade e
+                tempos (veja utils/instrumentacao.py)
+        """
+        super().__init__(profundidade_maxima)
+        self.instrumentacao = InstrumentacaoBusca() if instrumentar else None
+        self.nos_por_iteracao: List[int] = []
+        self.consultas_tabela = 0
+        self.acertos_tabela = 0
+        self.reducoes = reducoes
+        self.reducoes_aplicadas = 0
+        self.reducoes_repetidas = 0
+        self.tempo_limite = tempo_limite
+        self.tabela = tabela_transposicao if tabela_transposicao is not None else TabelaTransposicao()
+        self.ordenacao = ordenacao if ordenacao is not None else OrdenacaoMovimentos()
+        self.profundidade_alcancada = 0
+        self._prazo: Optional[float] = None
+        self._melhor_movimento_raiz: Optional[Movimento] = None
+
+    def escolher_movimento(self, tabuleiro: Tabuleiro, cor_jogador: CorPeca) -> Movimento:
+        """
+        Escolhe a jogada por aprofundamento iterativo.
+
+        Args:
+            tabuleiro (Tabuleiro): Estado atual do tabuleiro
+            cor_jogador (CorPeca): Cor do jogador que deve jogar
+
+        Returns:
+            Movimento: Melhor jogada da última profundidade concluída
+        """
+        self.resetar_estatisticas()
+        inicio = time.time()
+        tempo_limite = self.limitar_tempo(self.tempo_limite, inicio)
+        self._prazo = inicio + tempo_limite if tempo_limite is not None else None
+
+        movimentos_possiveis = tabuleiro.obter_movimentos_possiveis(cor_jogador)
+        if not movimentos_possiveis:
+            raise ValueError("Não há movimentos possíveis para o jogador atual")
+
+        instrumentacao = self.instrumentacao
+        if instrumentacao is not None:
+            instrumentacao.resetar()
+            trabalho = instrumentacao.cronometrar(tabuleiro.copy, 'copia')()
+            instrumentacao.instrumentar_tabuleiro(trabalho)
+        else:
+            trabalho = tabuleiro.copy()
+        trabalho.turno_atual = cor_jogador
+        jogadas_raiz = len(trabalho.historico_movimentos)
+        self.ordenacao.nova_busca()
+        consultas_iniciais, acertos_iniciais = self.tabela.consultas, self.tabela.acertos
+
+        melhor_movimento = movimentos_possiveis[0]
+        valor: Optional[float] = None
+
+        if len(movimentos_possiveis) > 1:
+            for profundidade in range(1, self.profundidade_maxima + 1):
+                self._melhor_movimento_raiz = None
+                nos_iniciais = self.nos_explorados
+                try:
+                    valor = self._buscar_raiz(trabalho, profundidade, valor)
+                except TempoEsgotado:
+                    while len(trabalho.historico_movimentos) > jogadas_raiz:
+                        trabalho.desfazer_movimento()
+                    break
+                self.nos_por_iteracao.append(self.nos_explorados - nos_iniciais)
+
+                if self._melhor_movimento_raiz is not None:
+                    melhor_movimento = self._melhor_movimento_raiz
+                self.profundidade_alcancada = profundidade
+                self.melhor_valor_encontrado = self._valor_para_brancas(valor, cor_jogador)
+                if self.observadores:
+                    self.publicar_resultado_parcial({
+                        'profundidade': profundidade,
+                        'valor': self.melhor_valor_encontrado,
+                        'melhor_movimento': melhor_movimento,
+                        'variacao_principal': self.variacao_principal(trabalho, melhor_movimento,
+                                                                      profundidade),
+                        'nos_explorados': self.nos_explorados,
+                        'tempo': time.time() - inicio,
+                    })
+
+                # Vitória ou derrota forçada já encontrada
+                if abs(valor) >= LIMITE_VITORIA:
+                    break
+
+        self.consultas_tabela = self.tabela.consultas - consultas_iniciais
+        self.acertos_tabela = self.tabela.acertos - acertos_iniciais
+        self.melhor_movimento_encontrado = melhor_movimento
+        self.tempo_execucao = time.time() - inicio
+        return melhor_movimento
+
+    def variacao_principal(self, tabuleiro: Tabuleiro, primeiro_movimento: Movimento,
+                           limite: int) -> List[Movimento]:
+        """
+        Reconstrói a variação principal seguindo as jogadas da tabela de transposição.
+
+        Args:
+            tabuleiro (Tabuleiro): Posição da raiz (restaurada ao final)
+            primeiro_movimento (Movimento): Melhor jogada da raiz
+            limite (int): Número máximo de jogadas
+
+        Returns:
+            List[Movimento]: Variação principal, a partir da raiz
+        """
+        variacao = [primeiro_movimento]
+        tabuleiro.executar_movimento(primeiro_movimento, validar=False)
+        vistas = {tabuleiro.chave_posicao()}
+        while len(variacao) < limite:
+            entrada = self.tabela.entradas.get(tabuleiro.chave_posicao())
+            if entrada is None or entrada[3] is None:
+                break
+            movimento = entrada[3]
+            if movimento not in tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual):
+                break
+            tabuleiro.executar_movimento(movimento, validar=False)
+            variacao.append(movimento)
+            chave = tabuleiro.chave_posicao()
+            if chave in vistas:
+                break
+            vistas.add(chave)
+        for _ in variacao:
+            tabuleiro.desfazer_movimento()
+        return variacao
+
+    def interromper_busca(self):
+        """Faz o prazo da busca em andamento expirar; a última profundidade concluída é usada."""
+        self.definir_prazo_busca(0.0)
+
+    def definir_prazo_busca(self, prazo: Optional[float]):
+        """
+        Define o prazo da busca em andamento (em outra thread).
+
+        Diferente de definir_prazo, que vale para a próxima busca, muda o
+        prazo já calculado por escolher_movimento; a próxima chamada de
+        escolher_movimento o recalcula.
+
+        Args:
+            prazo (Optional[float]): Instante limite, em time.time(); None
+                remove o prazo
+        """
+        self._prazo = prazo
+
+    def resetar_estatisticas(self):
+        """Reseta as estatísticas de busca."""
+        super().resetar_estatisticas()
+        self.profundidade_alcancada = 0
+        self.reducoes_aplicadas = 0
+        self.reducoes_repetidas = 0
+        self.nos_por_iteracao = []
+        self.consultas_tabela = 0
+        self.acertos_tabela = 0
+
+    def _valor_para_brancas(self, valor: float, cor_jogador: CorPeca) -> float:
+        """Converte um valor negamax para o ponto de vista das brancas."""
+        if valor >= LIMITE_VITORIA:
+            valor = INFINITO
+        elif valor <= -LIMITE_VITORIA:
+            valor = -INFINITO
+        return valor if cor_jogador == CorPeca.BRANCA else -valor
+
+    def _buscar_raiz(self, tabuleiro: Tabuleiro, profundidade: int,
+                     valor_anterior: Optional[float]) -> float:
+        """
+        Busca a raiz com uma profundidade.
+
+        Args:
+            tabuleiro (Tabuleiro): Tabuleiro de trabalho na posição da raiz
+            profundidade (int): Profundidade desta iteração
+            valor_anterior (Optional[float]): Valor da iteração anterior
+
+        Returns:
+            float: Valor da raiz do ponto de vista de quem joga
+        """
+        return self._buscar(tabuleiro, profundidade, -INFINITO, INFINITO, 0)
+
+    @staticmethod
+    def _empate(tabuleiro: Tabuleiro) -> bool:
+        """
+        Se o nó é empate pelas regras da partida.
+
+        Na busca, uma única repetição já vale empate: se a linha é boa para
+        quem repete, o adversário pode repeti-la até a terceira vez.
+        """
+        return (tabuleiro.jogadas_sem_progresso >= tabuleiro.LIMITE_SEM_PROGRESSO or
+                tabuleiro.repeticoes() > 0)
+
+    def _valor_derrota(self, ply: int) -> float:
+        """Valor de um nó em que quem joga não tem jogadas (e perde)."""
+        return -VALOR_VITORIA + ply
+
+    def _avaliar(self, tabuleiro: Tabuleiro, ply: int) -> float:
+        """Avalia uma folha do ponto de vista de quem joga."""
+        valor = tabuleiro.avaliar_posicao()
+        if valor == INFINITO:
+            valor = VALOR_VITORIA - ply
+        elif valor == -INFINITO:
+            valor = -VALOR_VITORIA + ply
+        return valor if tabuleiro.turno_atual == CorPeca.BRANCA else -valor
+
+    def _buscar(self, tabuleiro: Tabuleiro, profundidade: int,
+                alfa: float, beta: float, ply: int) -> float:
+        """
+        Busca negamax com poda alfa-beta (fail-soft).
+
+        Args:
+            tabuleiro (Tabuleiro): Tabuleiro de trabalho
+            profundidade (int): Profundidade restante
+            alfa (float): Limite inferior da janela
+            beta (float): Limite superior da janela
+            ply (int): Distância do nó até a raiz
+
+        Returns:
+            float: Valor do nó do ponto de vista de quem joga
+        """
+        self.nos_explorados += 1
+        if self._prazo is not None and self.nos_explorados & MASCARA_VERIFICACAO_PRAZO == 0 and time.time() > self._prazo:
+            raise TempoEsgotado()
+        if self.instrumentacao is not None:
+            self.instrumentacao.registrar_no(ply)
+
+        if ply > 0 and self._empate(tabuleiro):
+            return VALOR_EMPATE
+
+        if profundidade <= 0:
+            return self._avaliar(tabuleiro, ply)
+
+        # Consultar a tabela de transposição
+        chave = tabuleiro.chave_posicao()
+        entrada = self.tabela.consultar(chave, ply)
+        movimento_tabela = None
+        if entrada is not None:
+            profundidade_tabela, valor_tabela, tipo, movimento_tabela = entrada
+            if ply > 0 and profundidade_tabela >= profundidade:
+                if (tipo == EXATO or
+                        (tipo == LIMITE_INFERIOR and valor_tabela >= beta) or
+                        (tipo == LIMITE_SUPERIOR and valor_tabela <= alfa)):
+                    return valor_tabela
+
+        movimentos = tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)
+        if not movimentos:
+            return self._valor_derrota(ply)
+
+        alfa_original = alfa
+        melhor_valor = -INFINITO
+        melhor_movimento = None
+
+        for indice, movimento in enumerate(self.ordenacao.ordenar(movimentos, ply, movimento_tabela)):
+            tabuleiro.executar_movimento(movimento, validar=False)
+            valor = self._buscar_filho(tabuleiro, movimento, indice, profundidade, alfa, beta, ply)
+            tabuleiro.desfazer_movimento()
+
+            if valor > melhor_valor:
+                melhor_valor = valor
+                melhor_movimento = movimento
+                if ply == 0:
+                    self._melhor_movimento_raiz = movimento
+            if valor > alfa:
+                alfa = valor
+            if alfa >= beta:
+                self.ordenacao.registrar_corte(movimento, profundidade, ply)
+                if self.instrumentacao is not None:
+                    self.instrumentacao.registrar_corte(ply, indice)
+                break  # Poda
+
+        if melhor_valor <= alfa_original:
+            tipo = LIMITE_SUPERIOR
+        elif melhor_valor >= beta:
+            tipo = LIMITE_INFERIOR
+        else:
+            tipo = EXATO
+        self.tabela.armazenar(chave, ply, profundidade, melhor_valor, tipo, melhor_movimento)
+        return melhor_valor
+
+    def _buscar_filho(self, tabuleiro: Tabuleiro, movimento: Movimento, indice: int,
+                      profundidade: int, alfa: float, beta: float, ply: int) -> float:
+        """
+        Busca o filho alcançado por um movimento (já executado no tabuleiro).
+
+        Args:
+            tabuleiro (Tabuleiro): Tabuleiro na posição do filho
+            movimento (Movimento): Jogada que levou ao filho
+            indice (int): Posição da jogada na lista ordenada
+            profundidade (int): Profundidade restante do pai
+            alfa (float): Limite inferior da janela do pai
+            beta (float): Limite superior da janela do pai
+            ply (int): Distância do pai até a raiz
+
+        Returns:
+            float: Valor do filho do ponto de vista do pai
+        """
+        valor = self._buscar_reduzido(tabuleiro, movimento, indice, profundidade, alfa, ply)
+        if valor is not None:
+            return valor
+        return -self._buscar(tabuleiro, profundidade - 1, -beta, -alfa, ply + 1)
+
+    def _buscar_reduzido(self, tabuleiro: Tabuleiro, movimento: Movimento, indice: int,
+                         profundidade: int, alfa: float, ply: int) -> Optional[float]:
+        """
+        Tenta descartar uma jogada tardia com busca reduzida de janela nula.
+
+        Returns:
+            Optional[float]: Valor do filho, se a busca reduzida confirmou que
+            ele não supera alfa; None se a jogada não foi reduzida ou se é
+            preciso buscá-la de novo com a profundidade completa
+        """
+        if self.reducoes is None or ply == 0:
+            return None
+        reducao = self.reducoes.reducao(movimento, profundidade, indice)
+        if reducao == 0:
+            return None
+
+        self.reducoes_aplicadas += 1
+        valor = -self._buscar(tabuleiro, profundidade - 1 - reducao, -alfa - 1e-6, -alfa, ply + 1)
+        if valor <= alfa:
+            return valor
+        self.reducoes_repetidas += 1
+        return None
+
+    def obter_estatisticas(self) -> dict:
+        """
+        Retorna estatísticas incluindo profundidade alcançada, reduções,
+        uso da tabela de transposição e, se ativada, a instrumentação.
+        """
+        stats = super().obter_estatisticas()
+        stats['profundidade_alcancada'] = self.profundidade_alcancada
+        stats['reducoes_aplicadas'] = self.reducoes_aplicadas
+        stats['reducoes_repetidas'] = self.reducoes_repetidas
+        stats['nos_por_iteracao'] = list(self.nos_por_iteracao)
+        stats['consultas_tabela'] = self.consultas_tabela
+        stats['acertos_tabela'] = self.acertos_tabela
+        stats['taxa_acerto_tabela'] = (self.acertos_tabela / self.consultas_tabela
+                                       if self.consultas_tabela else 0.0)
+        # Razão entre os nós das duas últimas iterações do aprofundamento
+        iteracoes = self.nos_por_iteracao
+        stats['fator_ramificacao_efetivo'] = (iteracoes[-1] / iteracoes[-2]
+                                              if len(iteracoes) >= 2 and iteracoes[-2] else None)
+        if self.instrumentacao is not None:
+            stats.update(self.instrumentacao.exportar())
+        return stats
+
+
+class BuscaPVS(BuscaNegamax):
+    """
+    Principal Variation Search (NegaScout).
+
+    O primeiro filho (o mais promissor pela ordenação) é buscado com a
+    janela completa; os demais, com janela nula, apenas para provar que não
+    são melhores. Se um filho supera alfa na janela nula, ele é buscado de
+    novo com a janela completa. Com boa ordenação, a maioria das buscas é de
+    janela nula, que poda muito mais.
+    """
+
+    def __init__(self, profundidade_maxima: int = 6,
+                 tempo_limite: Optional[float] = None,
+                 tabela_transposicao: Optional[TabelaTransposicao] = None,
+                 ordenacao: Optional[OrdenacaoMovimentos] = None,
+                 reducoes: Optional[ReducaoJogadasTardias] = None,
+                 instrumentar: bool = False):
+        super().__init__(profundidade_maxima, tempo_limite, tabela_transposicao, ordenacao,
+                         reducoes, instrumentar)
+        self.pesquisas_repetidas = 0
+
+    def resetar_estatisticas(self):
+        """Reseta as estatísticas de busca."""
+        super().resetar_estatisticas()
+        self.pesquisas_repetidas = 0
+
+    def _buscar_filho(self, tabuleiro: Tabuleiro, movimento: Movimento, indice: int,
+                      profundidade: int, alfa: float, beta: float, ply: int) -> float:
+        if indice == 0:
+            return -self._buscar(tabuleiro, profundidade - 1, -beta, -alfa, ply + 1)
+
+        valor = self._buscar_reduzido(tabuleiro, movimento, indice, profundidade, alfa, ply)
+        if valor is not None:
+            return valor
+
+        # Janela nula: o filho é melhor que alfa?
+        valor = -self._buscar(tabuleiro, profundidade - 1, -alfa - 1e-6, -alfa, ply + 1)
+        if alfa < valor < beta:
+            self.pesquisas_repetidas += 1
+            valor = -self._buscar(tabuleiro, profundidade - 1, -beta, -valor, ply + 1)
+        return valor
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna estatísticas incluindo as buscas repetidas."""
+        stats = super().obter_estatisticas()
+        stats['pesquisas_repetidas'] = self.pesquisas_repetidas
+        return stats
+
+
+class BuscaMTDf(BuscaNegamax):
+    """
+    MTD(f): converge para o valor minimax com buscas de janela nula.
+
+    Cada passagem é uma poda alfa-beta com janela nula (beta - ε, beta),
+    que apenas informa se o valor é menor ou maior que beta e estreita os
+    limites [inferior, superior]. A tabela de transposição guarda os
+    resultados das passagens anteriores, de modo que cada nova passagem
+    percorre principalmente nós já conhecidos. A primeira estimativa de cada
+    profundidade é o valor da profundidade anterior.
+    """
+
+    EPSILON = 1e-6
+
+    # Limite de passagens por profundidade: valores iguais que diferem por
+    # arredondamento de ponto flutuante não podem prender a busca
+    MAXIMO_PASSAGENS = 64
+
+    def __init__(self, profundidade_maxima: int = 6,
+                 tempo_limite: Optional[float] = None,
+                 tabela_transposicao: Optional[TabelaTransposicao] = None,
+                 ordenacao: Optional[OrdenacaoMovimentos] = None,
+                 reducoes: Optional[ReducaoJogadasTardias] = None,
+                 instrumentar: bool = False):
+        super().__init__(profundidade_maxima, tempo_limite, tabela_transposicao, ordenacao,
+                         reducoes, instrumentar)
+        self.passagens = 0
+
+    def resetar_estatisticas(self):
+        """Reseta as estatísticas de busca."""
+        super().resetar_estatisticas()
+        self.passagens = 0
+
+    def _buscar_raiz(self, tabuleiro: Tabuleiro, profundidade: int,
+                     valor_anterior: Optional[float]) -> float:
+        valor = valor_anterior if valor_anterior is not None else self._avaliar(tabuleiro, 0)
+        inferior, superior = -INFINITO, INFINITO
+        melhor_movimento = None
+
+        passagens = 0
+        # Limites a menos de EPSILON já determinam o valor: uma janela nula
+        # entre eles cairia fora de [inferior, superior] e se repetiria
+        while superior - inferior > self.EPSILON and passagens < self.MAXIMO_PASSAGENS:
+            beta = min(max(valor, inferior + self.EPSILON), superior)
+            passagens += 1
+            self._melhor_movimento_raiz = None
+            valor = self._buscar(tabuleiro, profundidade, beta - self.EPSILON, beta, 0)
+            self.passagens += 1
+
+            if valor < beta:
+                superior = valor
+            else:
+                # Só uma passagem que falha alto garante a melhor jogada
+                inferior = valor
+                melhor_movimento = self._melhor_movimento_raiz
+
+        self._melhor_movimento_raiz = melhor_movimento
+        return valor
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna estatísticas incluindo o número de passagens."""
+        stats = super().obter_estatisticas()
+        stats['passagens'] = self.passagens
+        return stats
+
+
+class ExpectMiniMaxStar(BuscaNegamax):
+    """
+    Expect MiniMax com poda Star1/Star2.
+
+    Como em ExpectMiniMaxCompleto, o adversário erra com probabilidade
+    probabilidade_erro: seus nós são nós de chance, com valor
+    (1 - p) * melhor + p * média dos filhos. Com a avaliação limitada ao
+    intervalo [-limite_avaliacao, limite_avaliacao], os filhos ainda não
+    buscados também são limitados, o que permite podar nós de chance:
+
+    - Star1: após cada filho, se os limites do valor do nó já saem da
+      janela (alfa, beta), os demais filhos são ignorados; cada filho é
+      buscado com a janela estreita que basta para decidir isso
+    - Star2: antes, cada filho é sondado buscando só a sua primeira jogada,
+      o que dá limites superiores para os filhos e permite cortes antes da
+      busca completa de qualquer um deles. Como o termo (1 - p) * melhor
+      depende do maior limite, a sondagem raramente corta com p pequeno e
+      vem desativada por padrão
+
+    Nós de chance usam chaves próprias na tabela de transposição, mas os
+    valores seguem o modelo do adversário que erra: não compartilhe a
+    tabela com motores minimax.
+    """
+
+    EPSILON = 1e-6
+
+    def __init__(self, profundidade_maxima: int = 6, probabilidade_erro: float = 0.1,
+                 tempo_limite: Optional[float] = None,
+                 tabela_transposicao: Optional[TabelaTransposicao] = None,
+                 ordenacao: Optional[OrdenacaoMovimentos] = None,
+                 limite_avaliacao: float = 100.0,
+                 sondagem: bool = False,
+                 instrumentar: bool = False):
+        """
+        Inicializa o motor.
+
+        Args:
+            profundidade_maxima (int): Profundidade máxima do aprofundamento iterativo
+            probabilidade_erro (float): Probabilidade de o adversário jogar ao acaso
+            tempo_limite (Optional[float]): Tempo máximo por jogada, em segundos
+            tabela_transposicao (Optional[TabelaTransposicao]): Tabela própria do modelo
+            ordenacao (Optional[OrdenacaoMovimentos]): Ordenação compartilhada
+            limite_avaliacao (float): Limite do valor absoluto da avaliação;
+                vitórias valem exatamente este limite
+            sondagem (bool): Se deve usar a fase de sondagem (Star2)
+            instrumentar (bool): Se deve coletar métricas por profundidade e tempos
+        """
+        super().__init__(profundidade_maxima, tempo_limite, tabela_transposicao, ordenacao,
+                         instrumentar=instrumentar)
+        self.probabilidade_erro = probabilidade_erro
+        self.limite_avaliacao = limite_avaliacao
+        self.sondagem = sondagem
+        self.cortes_star1 = 0
+        self.cortes_star2 = 0
+
+    def resetar_estatisticas(self):
+        """Reseta as estatísticas de busca."""
+        super().resetar_estatisticas()
+        self.cortes_star1 = 0
+        self.cortes_star2 = 0
+
+    def _valor_derrota(self, ply: int) -> float:
+        return -self.limite_avaliacao
+
+    def _avaliar(self, tabuleiro: Tabuleiro, ply: int) -> float:
+        valor = tabuleiro.avaliar_posicao()
+        valor = max(-self.limite_avaliacao, min(self.limite_avaliacao, valor))
+        return valor if tabuleiro.turno_atual == CorPeca.BRANCA else -valor
+
+    def _valor_para_brancas(self, valor: float, cor_jogador: CorPeca) -> float:
+        if abs(valor) >= self.limite_avaliacao:
+            valor = INFINITO if valor > 0 else -INFINITO
+        return valor if cor_jogador == CorPeca.BRANCA else -valor
+
+    def _buscar(self, tabuleiro: Tabuleiro, profundidade: int,
+                alfa: float, beta: float, ply: int) -> float:
+        # Quem joga na raiz decide; o adversário (ply ímpar) é um nó de chance
+        if ply % 2 == 0:
+            return super()._buscar(tabuleiro, profundidade, alfa, beta, ply)
+        return self._buscar_chance(tabuleiro, profundidade, alfa, beta, ply)
+
+    def _limiar(self, constante_maximo: float, constante: float, alvo: float, n: int) -> float:
+        """
+        Resolve (1 - p) * max(C, x) + (p / n) * x + constante = alvo em x.
+
+        A função é crescente em x; o resultado é o valor do próximo filho a
+        partir do qual o nó atinge o alvo.
+        """
+        p = self.probabilidade_erro
+        a = p / n
+        x = (alvo - constante) / ((1 - p) + a)
+        if x >= constante_maximo:
+            return x
+        if a == 0:
+            return -INFINITO if (1 - p) * constante_maximo + constante >= alvo else INFINITO
+        return (alvo - constante - (1 - p) * constante_maximo) / a
+
+    def _sondar(self, tabuleiro: Tabuleiro, profundidade: int, ply: int) -> float:
+        """
+        Limite inferior do valor de um nó de decisão, buscando só a sua
+        primeira jogada (fase de sondagem do Star2).
+        """
+        if profundidade <= 0:
+            return self._avaliar(tabuleiro, ply)
+        movimentos = tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)
+        if not movimentos:
+            return self._valor_derrota(ply)
+
+        entrada = self.tabela.consultar(tabuleiro.chave_posicao(), ply)
+        movimento_tabela = None
+        if entrada is not None:
+            profundidade_tabela, valor_tabela, tipo, movimento_tabela = entrada
+            if profundidade_tabela >= profundidade and tipo != LIMITE_SUPERIOR:
+                return valor_tabela
+
+        movimento = self.ordenacao.ordenar(movimentos, ply, movimento_tabela)[0]
+        tabuleiro.executar_movimento(movimento, validar=False)
+        valor = -self._buscar(tabuleiro, profundidade - 1,
+                              -self.limite_avaliacao, self.limite_avaliacao, ply + 1)
+        tabuleiro.desfazer_movimento()
+        return valor
+
+    def _buscar_chance(self, tabuleiro: Tabuleiro, profundidade: int,
+                       alfa: float, beta: float, ply: int) -> float:
+        """
+        Busca um nó de chance com poda Star1/Star2 (fail-soft).
+
+        Args:
+            tabuleiro (Tabuleiro): Tabuleiro de trabalho
+            profundidade (int): Profundidade restante
+            alfa (float): Limite inferior da janela
+            beta (float): Limite superior da janela
+            ply (int): Distância do nó até a raiz
+
+        Returns:
+            float: Valor esperado do nó do ponto de vista de quem joga
+        """
+        self.nos_explorados += 1
+        if self._prazo is not None and self.nos_explorados & MASCARA_VERIFICACAO_PRAZO == 0 and time.time() > self._prazo:
+            raise TempoEsgotado()
+        if self.instrumentacao is not None:
+            self.instrumentacao.registrar_no(ply)
+
+        if self._empate(tabuleiro):
+            return VALOR_EMPATE
+
+        if profundidade <= 0:
+            return self._avaliar(tabuleiro, ply)
+
+        chave = tabuleiro.chave_posicao() + b'c'
+        entrada = self.tabela.consultar(chave, ply)
+        movimento_tabela = None
+        if entrada is not None:
+            profundidade_tabela, valor_tabela, tipo, movimento_tabela = entrada
+            if profundidade_tabela >= profundidade:
+                if (tipo == EXATO or
+                        (tipo == LIMITE_INFERIOR and valor_tabela >= beta) or
+                        (tipo == LIMITE_SUPERIOR and valor_tabela <= alfa)):
+                    return valor_tabela
+
+        movimentos = tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)
+        if not movimentos:
+            return self._valor_derrota(ply)
+        movimentos = self.ordenacao.ordenar(movimentos, ply, movimento_tabela)
+
+        if len(movimentos) == 1:
+            # Sem escolha, sem incerteza
+            tabuleiro.executar_movimento(movimentos[0], validar=False)
+            valor = -self._buscar(tabuleiro, profundidade - 1, -beta, -alfa, ply + 1)
+            tabuleiro.desfazer_movimento()
+            return valor
+
+        p = self.probabilidade_erro
+        n = len(movimentos)
+        inferior_avaliacao, superior_avaliacao = -self.limite_avaliacao, self.limite_avaliacao
+
+        # Star2: limites superiores dos filhos pela sondagem da primeira jogada
+        superiores = [superior_avaliacao] * n
+        if self.sondagem:
+            for indice, movimento in enumerate(movimentos):
+                tabuleiro.executar_movimento(movimento, validar=False)
+                superiores[indice] = -self._sondar(tabuleiro, profundidade - 1, ply + 1)
+                tabuleiro.desfazer_movimento()
+            limite = (1 - p) * max(superiores) + p * sum(superiores) / n
+            if limite <= alfa:
+                self.cortes_star2 += 1
+                self.tabela.armazenar(chave, ply, profundidade, limite, LIMITE_SUPERIOR, None)
+                return limite
+
+        # Star1: filhos buscados com a janela que basta para decidir o nó
+        soma = 0.0
+        maximo = -INFINITO
+        melhor_movimento = None
+        for indice, movimento in enumerate(movimentos):
+            restantes = superiores[indice + 1:]
+            n_restantes = len(restantes)
+            maximo_restantes = max(restantes) if restantes else -INFINITO
+
+            limite_alto = self._limiar(maximo, p * (soma + n_restantes * inferior_avaliacao) / n, beta, n)
+            limite_baixo = self._limiar(max(maximo, maximo_restantes),
+                                        p * (soma + sum(restantes)) / n, alfa, n)
+            janela_alfa = max(limite_baixo, inferior_avaliacao - self.EPSILON)
+            janela_beta = min(limite_alto, superior_avaliacao + self.EPSILON)
+            if janela_alfa >= janela_beta:
+                janela_alfa = janela_beta - self.EPSILON
+
+            tabuleiro.executar_movimento(movimento, validar=False)
+            valor = -self._buscar(tabuleiro, profundidade - 1, -janela_beta, -janela_alfa, ply + 1)
+            inferior = (1 - p) * max(maximo, valor) + p * (soma + valor + n_restantes * inferior_avaliacao) / n
+            superior = ((1 - p) * max(maximo, valor, maximo_restantes) +
+                        p * (soma + valor + sum(restantes)) / n)
+
+            # Fora da janela o valor do filho é só um limite; se ele não
+            # bastou para decidir o nó, buscar o valor exato
+            if (valor >= janela_beta and inferior < beta) or (valor <= janela_alfa and superior > alfa):
+                valor = -self._buscar(tabuleiro, profundidade - 1,
+                                      -superior_avaliacao - self.EPSILON,
+                                      -inferior_avaliacao + self.EPSILON, ply + 1)
+                inferior = (1 - p) * max(maximo, valor) + p * (soma + valor + n_restantes * inferior_avaliacao) / n
+                superior = ((1 - p) * max(maximo, valor, maximo_restantes) +
+                            p * (soma + valor + sum(restantes)) / n)
+            tabuleiro.desfazer_movimento()
+
+            if valor > maximo:
+                maximo = valor
+                melhor_movimento = movimento
+            soma += valor
+
+            if n_restantes and inferior >= beta:
+                self.cortes_star1 += 1
+                self.tabela.armazenar(chave, ply, profundidade, inferior, LIMITE_INFERIOR, melhor_movimento)
+                return inferior
+            if n_restantes and superior <= alfa:
+                self.cortes_star1 += 1
+                self.tabela.armazenar(chave, ply, profundidade, superior, LIMITE_SUPERIOR, melhor_movimento)
+                return superior
+
+        valor = (1 - p) * maximo + p * soma / n
+        if valor <= alfa:
+            tipo = LIMITE_SUPERIOR
+        elif valor >= beta:
+            tipo = LIMITE_INFERIOR
+        else:
+            tipo = EXATO
+        self.tabela.armazenar(chave, ply, profundidade, valor, tipo, melhor_movimento)
+        return valor
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna estatísticas incluindo os cortes em nós de chance."""
+        stats = super().obter_estatisticas()
+        stats['cortes_star1'] = self.cortes_star1
+        stats['cortes_star2'] = self.cortes_star2
+        return stats
+
+
+def comparar_motores(profundidades: Tuple[int, ...] = (3, 4, 5), jogadas_abertura: int = 8):
+    """
+    Compara os nós explorados pelos motores deste módulo com a
+    PodaAlfaBetaCompleta de referência, na mesma posição.
+
+    Args:
+        profundidades (Tuple[int, ...]): Profundidades a comparar
+        jogadas_abertura (int): Jogadas aleatórias antes da posição de teste
+    """
+    import random
+    from utils.solucao_exemplo import PodaAlfaBetaCompleta
+
+    print("=== COMPARAÇÃO DE MOTORES: NÓS EXPLORADOS ===")
+    print()
+
+    random.seed(5)
+    tabuleiro = Tabuleiro()
+    for _ in range(jogadas_abertura):
+        tabuleiro.executar_movimento(random.choice(
+            tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)))
+
+    for profundidade in profundidades:
+        print(f"Profundidade {profundidade}:")
+        motores = {
+            'AlfaBeta (referência)': PodaAlfaBetaCompleta(profundidade_maxima=profundidade),
+            'Negamax + TT': BuscaNegamax(profundidade_maxima=profundidade),
+            'PVS': BuscaPVS(profundidade_maxima=profundidade),
+            'MTD(f)': BuscaMTDf(profundidade_maxima=profundidade),
+        }
+        for nome, motor in motores.items():
+            movimento = motor.escolher_movimento(tabuleiro, tabuleiro.turno_atual)
+            print(f"  {nome}: {motor.nos_explorados} nós, {motor.tempo_execucao:.3f}s, "
+                  f"valor {motor.melhor_valor_encontrado}, jogada {movimento}")
+        print()
+
+
+if __name__ == "__main__":
+    comparar_motores()
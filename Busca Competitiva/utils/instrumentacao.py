@@ -0,0 +1,223 @@
+"""
+Instrumentação das buscas: métricas estruturadas por busca.
+
+InstrumentacaoBusca coleta, para uma busca:
+- nós explorados e cortes por profundidade (ply)
+- taxa de cortes na primeira jogada (qualidade da ordenação)
+- tempo gasto em geração de jogadas, avaliação e cópia/execução de
+  jogadas no tabuleiro
+
+Os motores só criam a instrumentação quando pedido (instrumentar=True);
+desativada, o custo é uma comparação com None por nó. Os tempos são medidos
+substituindo os métodos do tabuleiro de trabalho da busca, de modo que o
+código do Tabuleiro não muda.
+
+agregar_estatisticas() combina as estatísticas de várias jogadas (por
+exemplo, de uma partida ou de um torneio).
+"""
+
+import math
+import time
+from typing import Any, Callable, Dict, Iterable, List
+
+from jogo_damas import Tabuleiro
+
+
+# Métodos do Tabuleiro cronometrados em cada categoria de tempo
+METODOS_CRONOMETRADOS = {
+    'geracao': ('obter_movimentos_possiveis',),
+    'avaliacao': ('avaliar_posicao',),
+    'copia': ('copy', 'executar_movimento', 'desfazer_movimento'),
+}
+
+
+class InstrumentacaoBusca:
+    """
+    Contadores e cronômetros de uma busca.
+
+    Os tempos são exclusivos: o tempo de obter_movimentos_possiveis chamado
+    de dentro de avaliar_posicao conta como geração, não como avaliação.
+    """
+
+    def __init__(self):
+        self.resetar()
+
+    def resetar(self) -> None:
+        """Zera os contadores para uma nova busca."""
+        self.nos_por_ply: List[int] = []
+        self.cortes_por_ply: List[int] = []
+        self.cortes = 0
+        self.cortes_primeira_jogada = 0
+        self.tempos_ns: Dict[str, int] = {categoria: 0 for categoria in METODOS_CRONOMETRADOS}
+        self._pilha: List[int] = []
+
+    def registrar_no(self, ply: int) -> None:
+        """Conta um nó visitado no ply."""
+        nos = self.nos_por_ply
+        if ply >= len(nos):
+            nos.extend([0] * (ply + 1 - len(nos)))
+        nos[ply] += 1
+
+    def registrar_corte(self, ply: int, indice: int) -> None:
+        """
+        Conta um corte beta.
+
+        Args:
+            ply (int): Distância do nó até a raiz
+            indice (int): Posição, na lista ordenada, da jogada que causou o corte
+        """
+        cortes = self.cortes_por_ply
+        if ply >= len(cortes):
+            cortes.extend([0] * (ply + 1 - len(cortes)))
+        cortes[ply] += 1
+        self.cortes += 1
+        if indice == 0:
+            self.cortes_primeira_jogada += 1
+
+    def cronometrar(self, funcao: Callable, categoria: str) -> Callable:
+        """
+        Envolve uma função para somar seu tempo exclusivo a uma categoria.
+
+        Args:
+            funcao (Callable): Função a cronometrar
+            categoria (str): Categoria de tempo (chave de METODOS_CRONOMETRADOS)
+
+        Returns:
+            Callable: Função envolvida
+        """
+        tempos = self.tempos_ns
+        pilha = self._pilha
+        relogio = time.perf_counter_ns
+
+        def cronometrada(*args, **kwargs):
+            inicio = relogio()
+            pilha.append(0)
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                total = relogio() - inicio
+                tempos[categoria] += total - pilha.pop()
+                if pilha:
+                    pilha[-1] += total
+
+        return cronometrada
+
+    def instrumentar_tabuleiro(self, tabuleiro: Tabuleiro) -> Tabuleiro:
+        """
+        Cronometra os métodos de um tabuleiro (apenas desta instância).
+
+        Args:
+            tabuleiro (Tabuleiro): Tabuleiro de trabalho da busca
+
+        Returns:
+            Tabuleiro: O mesmo tabuleiro
+        """
+        for categoria, metodos in METODOS_CRONOMETRADOS.items():
+            for nome in metodos:
+                setattr(tabuleiro, nome, self.cronometrar(getattr(tabuleiro, nome), categoria))
+        return tabuleiro
+
+    def exportar(self) -> Dict[str, Any]:
+        """
+        Exporta as métricas para obter_estatisticas().
+
+        Returns:
+            Dict[str, Any]: Métricas da busca
+        """
+        return {
+            'nos_por_profundidade': list(self.nos_por_ply),
+            'cortes_por_profundidade': list(self.cortes_por_ply),
+            'cortes': self.cortes,
+            'cortes_primeira_jogada': self.cortes_primeira_jogada,
+            'taxa_corte_primeira_jogada': (self.cortes_primeira_jogada / self.cortes
+                                           if self.cortes else 0.0),
+            'tempo_geracao': self.tempos_ns['geracao'] / 1e9,
+            'tempo_avaliacao': self.tempos_ns['avaliacao'] / 1e9,
+            'tempo_copia': self.tempos_ns['copia'] / 1e9,
+        }
+
+
+def _somar_listas(destino: List[int], origem: List[int]) -> None:
+    if len(origem) > len(destino):
+        destino.extend([0] * (len(origem) - len(destino)))
+    for indice, valor in enumerate(origem):
+        destino[indice] += valor
+
+
+def agregar_estatisticas(estatisticas: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combina as estatísticas de várias buscas.
+
+    Contagens e tempos são somados; as taxas são recalculadas a partir das
+    contagens somadas; o fator de ramificação efetivo é a média geométrica.
+    Métricas ausentes (motores sem instrumentação) são ignoradas.
+
+    Args:
+        estatisticas: Dicionários retornados por obter_estatisticas()
+
+    Returns:
+        Dict[str, Any]: Estatísticas agregadas (vazio se nenhuma busca tinha
+        métricas de instrumentação)
+    """
+    agregado: Dict[str, Any] = {}
+    nos_por_profundidade: List[int] = []
+    cortes_por_profundidade: List[int] = []
+    somas = {'cortes': 0, 'cortes_primeira_jogada': 0, 'consultas_tabela': 0, 'acertos_tabela': 0,
+             'tempo_geracao': 0.0, 'tempo_avaliacao': 0.0, 'tempo_copia': 0.0}
+    presentes = set()
+    soma_log_ramificacao = 0.0
+    buscas_ramificacao = 0
+
+    for stats in estatisticas:
+        if 'nos_por_profundidade' in stats:
+            _somar_listas(nos_por_profundidade, stats['nos_por_profundidade'])
+            _somar_listas(cortes_por_profundidade, stats['cortes_por_profundidade'])
+        for chave in somas:
+            if chave in stats:
+                somas[chave] += stats[chave]
+                presentes.add(chave)
+        ramificacao = stats.get('fator_ramificacao_efetivo')
+        if ramificacao:
+            soma_log_ramificacao += math.log(ramificacao)
+            buscas_ramificacao += 1
+
+    if nos_por_profundidade:
+        agregado['nos_por_profundidade'] = nos_por_profundidade
+        agregado['cortes_por_profundidade'] = cortes_por_profundidade
+    agregado.update({chave: valor for chave, valor in somas.items() if chave in presentes})
+    if 'cortes' in presentes:
+        agregado['taxa_corte_primeira_jogada'] = (somas['cortes_primeira_jogada'] / somas['cortes']
+                                                  if somas['cortes'] else 0.0)
+    if 'consultas_tabela' in presentes:
+        agregado['taxa_acerto_tabela'] = (somas['acertos_tabela'] / somas['consultas_tabela']
+                                          if somas['consultas_tabela'] else 0.0)
+    if buscas_ramificacao:
+        agregado['fator_ramificacao_efetivo'] = math.exp(soma_log_ramificacao / buscas_ramificacao)
+    return agregado
+
+
+def formatar_estatisticas(agregado: Dict[str, Any]) -> List[str]:
+    """
+    Formata estatísticas agregadas em linhas de texto.
+
+    Args:
+        agregado (Dict[str, Any]): Resultado de agregar_estatisticas()
+
+    Returns:
+        List[str]: Linhas para exibição
+    """
+    linhas = []
+    if 'nos_por_profundidade' in agregado:
+        linhas.append(f"Nós por profundidade: {agregado['nos_por_profundidade']}")
+        linhas.append(f"Cortes por profundidade: {agregado['cortes_por_profundidade']}")
+    if 'taxa_corte_primeira_jogada' in agregado:
+        linhas.append(f"Cortes na primeira jogada: {agregado['taxa_corte_primeira_jogada']:.1%}")
+    if 'taxa_acerto_tabela' in agregado:
+        linhas.append(f"Acertos na tabela de transposição: {agregado['taxa_acerto_tabela']:.1%}")
+    if 'fator_ramificacao_efetivo' in agregado:
+        linhas.append(f"Fator de ramificação efetivo: {agregado['fator_ramificacao_efetivo']:.2f}")
+    if 'tempo_geracao' in agregado:
+        linhas.append(f"Tempo: geração {agregado['tempo_geracao']:.3f}s, "
+                      f"avaliação {agregado['tempo_avaliacao']:.3f}s, "
+                      f"cópia/execução {agregado['tempo_copia']:.3f}s")
+    return linhas
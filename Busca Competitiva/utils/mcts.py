@@ -0,0 +1,560 @@
+"""
+Busca em Árvore Monte Carlo (MCTS) para o jogo de damas.
+
+Diferente da família MiniMax, o MCTS estima o valor das jogadas por
+simulações (rollouts) até o fim da partida ou até um limite de jogadas,
+concentrando as simulações nos ramos mais promissores pela fórmula UCT:
+
+    UCT = vitórias / visitas + C * sqrt(ln(visitas do pai) / visitas)
+
+Características desta implementação:
+- Orçamento por número de iterações e/ou tempo (motor "anytime")
+- Reaproveitamento da subárvore da jogada anterior
+- Todas as simulações acontecem sobre um único tabuleiro de trabalho,
+  com executar_movimento/desfazer_movimento, sem copiar o tabuleiro
+
+Versões paralelas:
+- BuscaMonteCarloParalelaRaiz: árvores independentes em processos,
+  com as visitas da raiz somadas ao final
+- BuscaMonteCarloParalelaArvore: uma árvore compartilhada por threads,
+  com perda virtual
+"""
+
+import math
+import multiprocessing
+import os
+import random
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from jogo_damas import Tabuleiro, Movimento, CorPeca
+from exercicios import EstrategiaJogo
+
+
+class NoMCTS:
+    """
+    Nó da árvore de busca Monte Carlo.
+
+    Attributes:
+        movimento (Optional[Movimento]): Movimento que levou a este nó
+        cor_jogou (Optional[CorPeca]): Cor que executou o movimento
+        pai (Optional[NoMCTS]): Nó pai (None na raiz)
+        filhos (List[NoMCTS]): Filhos já expandidos
+        nao_expandidos (Optional[List[Movimento]]): Movimentos ainda sem nó
+            (None enquanto os movimentos não foram gerados)
+        visitas (int): Número de simulações que passaram pelo nó
+        vitorias (float): Soma das recompensas do ponto de vista de cor_jogou
+    """
+
+    __slots__ = ('movimento', 'cor_jogou', 'pai', 'filhos', 'nao_expandidos',
+                 'visitas', 'vitorias')
+
+    def __init__(self, movimento: Optional[Movimento] = None,
+                 cor_jogou: Optional[CorPeca] = None,
+                 pai: Optional['NoMCTS'] = None):
+        self.movimento = movimento
+        self.cor_jogou = cor_jogou
+        self.pai = pai
+        self.filhos: List['NoMCTS'] = []
+        self.nao_expandidos: Optional[List[Movimento]] = None
+        self.visitas = 0
+        self.vitorias = 0.0
+
+    def melhor_filho_uct(self, constante_exploracao: float) -> 'NoMCTS':
+        """
+        Seleciona o filho com maior valor UCT.
+
+        Args:
+            constante_exploracao (float): Constante C da fórmula UCT
+
+        Returns:
+            NoMCTS: Filho selecionado
+        """
+        log_visitas = math.log(self.visitas)
+        melhor_filho = None
+        melhor_valor = float('-inf')
+        for filho in self.filhos:
+            valor = (filho.vitorias / filho.visitas +
+                     constante_exploracao * math.sqrt(log_visitas / filho.visitas))
+            if valor > melhor_valor:
+                melhor_valor = valor
+                melhor_filho = filho
+        return melhor_filho
+
+    def filho_mais_visitado(self) -> Optional['NoMCTS']:
+        """Retorna o filho com mais visitas (escolha final da jogada)."""
+        return max(self.filhos, key=lambda filho: filho.visitas, default=None)
+
+
+class BuscaMonteCarlo(EstrategiaJogo):
+    """
+    Estratégia baseada em Busca em Árvore Monte Carlo com seleção UCT.
+
+    A força do motor cresce com o orçamento: mais iterações ou mais tempo
+    produzem estimativas melhores.
+    """
+
+    def __init__(self, iteracoes: Optional[int] = 1000,
+                 tempo_limite: Optional[float] = None,
+                 constante_exploracao: float = 1.4,
+                 limite_rollout: int = 60,
+                 reaproveitar_arvore: bool = True):
+        """
+        Inicializa a busca Monte Carlo.
+
+        Args:
+            iteracoes (Optional[int]): Número máximo de iterações por jogada
+            tempo_limite (Optional[float]): Tempo máximo por jogada, em segundos
+            constante_exploracao (float): Constante C da fórmula UCT
+            limite_rollout (int): Jogadas simuladas antes de avaliar a posição
+            reaproveitar_arvore (bool): Se deve manter a subárvore entre jogadas
+        """
+        super().__init__(profundidade_maxima=limite_rollout)
+        if iteracoes is None and tempo_limite is None:
+            raise ValueError("Defina um limite de iterações ou de tempo")
+        self.iteracoes = iteracoes
+        self.tempo_limite = tempo_limite
+        self._tempo_busca = tempo_limite
+        self.constante_exploracao = constante_exploracao
+        self.limite_rollout = limite_rollout
+        self.reaproveitar_arvore = reaproveitar_arvore
+
+        self._raiz: Optional[NoMCTS] = None
+        self._historico_raiz: List[Movimento] = []
+        self.iteracoes_realizadas = 0
+        self.visitas_reaproveitadas = 0
+
+    def escolher_movimento(self, tabuleiro: Tabuleiro, cor_jogador: CorPeca) -> Movimento:
+        """
+        Escolhe a jogada mais visitada após o orçamento de simulações.
+
+        Args:
+            tabuleiro (Tabuleiro): Estado atual do tabuleiro
+            cor_jogador (CorPeca): Cor do jogador que deve jogar
+
+        Returns:
+            Movimento: Jogada escolhida
+        """
+        self.resetar_estatisticas()
+        inicio = time.time()
+        self._tempo_busca = self.limitar_tempo(self.tempo_limite, inicio)
+
+        movimentos_possiveis = tabuleiro.obter_movimentos_possiveis(cor_jogador)
+        if not movimentos_possiveis:
+            raise ValueError("Não há movimentos possíveis para o jogador atual")
+
+        raiz = self._obter_raiz(tabuleiro)
+        self.visitas_reaproveitadas = raiz.visitas
+
+        # Tabuleiro de trabalho: copiado uma vez por jogada, não por simulação
+        trabalho = tabuleiro.copy()
+        trabalho.turno_atual = cor_jogador
+
+        if len(movimentos_possiveis) == 1:
+            # Jogada forçada: não gastar o orçamento
+            self.iteracoes_realizadas = 0
+        else:
+            self.iteracoes_realizadas = self._executar_iteracoes(raiz, trabalho, inicio)
+
+        melhor_filho = raiz.filho_mais_visitado()
+        melhor_movimento = melhor_filho.movimento if melhor_filho else movimentos_possiveis[0]
+
+        self.nos_explorados = self.iteracoes_realizadas
+        self.melhor_movimento_encontrado = melhor_movimento
+        self.tempo_execucao = time.time() - inicio
+        return melhor_movimento
+
+    def _executar_iteracoes(self, raiz: NoMCTS, trabalho: Tabuleiro, inicio: float) -> int:
+        """Executa iterações até esgotar o orçamento; retorna quantas foram feitas."""
+        iteracoes = 0
+        while self.iteracoes is None or iteracoes < self.iteracoes:
+            # Consultar o relógio a cada 16 iterações
+            if (self._tempo_busca is not None and iteracoes % 16 == 0 and
+                    time.time() - inicio >= self._tempo_busca):
+                break
+            self._iteracao(raiz, trabalho)
+            iteracoes += 1
+        return iteracoes
+
+    def _obter_raiz(self, tabuleiro: Tabuleiro) -> NoMCTS:
+        """Reaproveita a subárvore da jogada anterior, se for da mesma partida."""
+        historico = tabuleiro.historico_movimentos
+        n = len(self._historico_raiz)
+
+        if (self.reaproveitar_arvore and self._raiz is not None and
+                len(historico) >= n and historico[:n] == self._historico_raiz):
+            no = self._raiz
+            for movimento in historico[n:]:
+                no = next((filho for filho in no.filhos if filho.movimento == movimento), None)
+                if no is None:
+                    break
+            if no is not None:
+                no.pai = None
+                no.movimento = None
+                self._raiz = no
+                self._historico_raiz = list(historico)
+                return no
+
+        self._raiz = NoMCTS()
+        self._historico_raiz = list(historico)
+        return self._raiz
+
+    def _iteracao(self, raiz: NoMCTS, tabuleiro: Tabuleiro) -> None:
+        """Executa uma iteração: seleção, expansão, simulação e retropropagação."""
+        no, jogadas = self._selecionar_expandir(raiz, tabuleiro)
+        recompensa = self._simular(tabuleiro)
+        self._retropropagar(no, recompensa)
+        for _ in range(jogadas):
+            tabuleiro.desfazer_movimento()
+
+    def _selecionar_expandir(self, raiz: NoMCTS, tabuleiro: Tabuleiro,
+                             perda_virtual: int = 0) -> Tuple[NoMCTS, int]:
+        """
+        Desce a árvore pela fórmula UCT e expande um novo filho.
+
+        Args:
+            raiz (NoMCTS): Raiz da árvore
+            tabuleiro (Tabuleiro): Tabuleiro na posição da raiz; termina na
+                posição do nó retornado
+            perda_virtual (int): Visitas perdidas somadas aos nós do caminho,
+                para desviar outras threads deste ramo
+
+        Returns:
+            Tuple[NoMCTS, int]: Nó selecionado e número de jogadas executadas
+        """
+        no = raiz
+        jogadas = 0
+        no.visitas += perda_virtual
+
+        # Seleção: descer enquanto o nó estiver totalmente expandido
+        while no.nao_expandidos is not None and not no.nao_expandidos and no.filhos:
+            no = no.melhor_filho_uct(self.constante_exploracao)
+            no.visitas += perda_virtual
+            tabuleiro.executar_movimento(no.movimento, validar=False)
+            jogadas += 1
+
+        # Expansão: criar um filho para um movimento ainda não explorado
+        if no.nao_expandidos is None:
+            no.nao_expandidos = tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)
+            random.shuffle(no.nao_expandidos)
+        if no.nao_expandidos:
+            movimento = no.nao_expandidos.pop()
+            filho = NoMCTS(movimento, tabuleiro.turno_atual, no)
+            filho.visitas = perda_virtual
+            no.filhos.append(filho)
+            tabuleiro.executar_movimento(movimento, validar=False)
+            jogadas += 1
+            no = filho
+
+        return no, jogadas
+
+    @staticmethod
+    def _retropropagar(no: NoMCTS, recompensa: float, perda_virtual: int = 0) -> None:
+        """
+        Soma a recompensa da simulação do nó até a raiz.
+
+        Args:
+            no (NoMCTS): Nó onde a simulação começou
+            recompensa (float): Recompensa do ponto de vista das brancas
+            perda_virtual (int): Perda virtual aplicada na seleção, a desfazer
+        """
+        while no is not None:
+            no.visitas += 1 - perda_virtual
+            no.vitorias += recompensa if no.cor_jogou == CorPeca.BRANCA else 1.0 - recompensa
+            no = no.pai
+
+    def _simular(self, tabuleiro: Tabuleiro) -> float:
+        """
+        Joga uma partida rápida a partir da posição e desfaz as jogadas.
+
+        A política escolhe, entre as capturas obrigatórias, as que capturam
+        mais peças; fora isso, joga aleatoriamente.
+
+        Returns:
+            float: Recompensa do ponto de vista das brancas (0 a 1)
+        """
+        jogadas = 0
+        recompensa = None
+
+        while jogadas < self.limite_rollout:
+            movimentos = tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)
+            if not movimentos:
+                # Quem não pode jogar perde
+                recompensa = 0.0 if tabuleiro.turno_atual == CorPeca.BRANCA else 1.0
+                break
+            if movimentos[0].e_captura:
+                maior = max(len(m.capturas) for m in movimentos)
+                movimentos = [m for m in movimentos if len(m.capturas) == maior]
+            tabuleiro.executar_movimento(random.choice(movimentos), validar=False)
+            jogadas += 1
+
+        if recompensa is None:
+            recompensa = self._avaliar_material(tabuleiro)
+
+        for _ in range(jogadas):
+            tabuleiro.desfazer_movimento()
+        return recompensa
+
+    @staticmethod
+    def _avaliar_material(tabuleiro: Tabuleiro) -> float:
+        """Converte a vantagem material em probabilidade de vitória das brancas."""
+        pesos = Tabuleiro.pesos_avaliacao
+        saldo = 0.0
+        for linha in tabuleiro.tabuleiro:
+            for peca in linha:
+                if peca:
+                    valor = pesos['dama'] if peca.e_dama() else pesos['peca']
+                    saldo += valor if peca.cor == CorPeca.BRANCA else -valor
+        return 1.0 / (1.0 + math.exp(-saldo / pesos['peca']))
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna estatísticas incluindo simulações por segundo."""
+        stats = super().obter_estatisticas()
+        stats['iteracoes'] = self.iteracoes_realizadas
+        stats['playouts_por_segundo'] = (self.iteracoes_realizadas / self.tempo_execucao
+                                         if self.tempo_execucao > 0 else 0.0)
+        stats['visitas_reaproveitadas'] = self.visitas_reaproveitadas
+        return stats
+
+
+def _chave_movimento(movimento: Movimento) -> tuple:
+    return (movimento.origem, movimento.destino, tuple(movimento.capturas))
+
+
+def _busca_raiz_processo(parametros: tuple) -> tuple:
+    """
+    Executa uma árvore independente em um processo trabalhador.
+
+    Args:
+        parametros (tuple): (tabuleiro, cor, iterações, tempo limite,
+            constante de exploração, limite de rollout, semente)
+
+    Returns:
+        tuple: ([(movimento, visitas, vitórias) dos filhos da raiz],
+            iterações realizadas, tempo gasto)
+    """
+    tabuleiro, cor, iteracoes, tempo_limite, constante, limite_rollout, semente = parametros
+    random.seed(semente)
+
+    motor = BuscaMonteCarlo(iteracoes, tempo_limite, constante, limite_rollout,
+                            reaproveitar_arvore=False)
+    inicio = time.time()
+    raiz = NoMCTS()
+    trabalho = tabuleiro.copy()
+    trabalho.turno_atual = cor
+    realizadas = motor._executar_iteracoes(raiz, trabalho, inicio)
+
+    filhos = [(filho.movimento, filho.visitas, filho.vitorias) for filho in raiz.filhos]
+    return filhos, realizadas, time.time() - inicio
+
+
+class BuscaMonteCarloParalelaRaiz(BuscaMonteCarlo):
+    """
+    MCTS com paralelismo na raiz.
+
+    Cada processo constrói uma árvore independente a partir da mesma
+    posição; ao final, as visitas e vitórias dos filhos da raiz são somadas
+    e a jogada mais visitada no total é escolhida. Como os processos não
+    compartilham memória, não há reaproveitamento de subárvore.
+
+    O orçamento (iteracoes e/ou tempo_limite) vale para cada processo.
+    """
+
+    def __init__(self, iteracoes: Optional[int] = 1000,
+                 tempo_limite: Optional[float] = None,
+                 constante_exploracao: float = 1.4,
+                 limite_rollout: int = 60,
+                 processos: Optional[int] = None):
+        """
+        Inicializa a busca paralela na raiz.
+
+        Args:
+            iteracoes (Optional[int]): Iterações por processo
+            tempo_limite (Optional[float]): Tempo máximo por jogada, em segundos
+            constante_exploracao (float): Constante C da fórmula UCT
+            limite_rollout (int): Jogadas simuladas antes de avaliar a posição
+            processos (Optional[int]): Número de processos (padrão: núcleos da CPU)
+        """
+        super().__init__(iteracoes, tempo_limite, constante_exploracao, limite_rollout,
+                         reaproveitar_arvore=False)
+        self.processos = processos or os.cpu_count() or 1
+        self.playouts_por_trabalhador: List[float] = []
+        self._pool = None
+
+    def escolher_movimento(self, tabuleiro: Tabuleiro, cor_jogador: CorPeca) -> Movimento:
+        """
+        Distribui a busca entre os processos e combina as árvores.
+
+        Args:
+            tabuleiro (Tabuleiro): Estado atual do tabuleiro
+            cor_jogador (CorPeca): Cor do jogador que deve jogar
+
+        Returns:
+            Movimento: Jogada com mais visitas somando todos os processos
+        """
+        self.resetar_estatisticas()
+        self.playouts_por_trabalhador = []
+        inicio = time.time()
+
+        movimentos_possiveis = tabuleiro.obter_movimentos_possiveis(cor_jogador)
+        if not movimentos_possiveis:
+            raise ValueError("Não há movimentos possíveis para o jogador atual")
+
+        raiz = NoMCTS()
+        self._raiz = raiz
+        self.iteracoes_realizadas = 0
+
+        if len(movimentos_possiveis) > 1:
+            if self._pool is None:
+                self._pool = multiprocessing.Pool(self.processos)
+
+            # Sementes distintas: processos criados por fork herdam o estado do random
+            tarefas = [(tabuleiro, cor_jogador, self.iteracoes,
+                        self.limitar_tempo(self.tempo_limite, inicio),
+                        self.constante_exploracao, self.limite_rollout,
+                        random.randrange(2 ** 32))
+                       for _ in range(self.processos)]
+
+            combinados = {}
+            for filhos, realizadas, tempo in self._pool.map(_busca_raiz_processo, tarefas):
+                self.iteracoes_realizadas += realizadas
+                self.playouts_por_trabalhador.append(realizadas / tempo if tempo > 0 else 0.0)
+                for movimento, visitas, vitorias in filhos:
+                    chave = _chave_movimento(movimento)
+                    if chave not in combinados:
+                        combinados[chave] = NoMCTS(movimento, cor_jogador, raiz)
+                        raiz.filhos.append(combinados[chave])
+                    combinados[chave].visitas += visitas
+                    combinados[chave].vitorias += vitorias
+            raiz.visitas = self.iteracoes_realizadas
+
+        melhor_filho = raiz.filho_mais_visitado()
+        melhor_movimento = melhor_filho.movimento if melhor_filho else movimentos_possiveis[0]
+
+        self.nos_explorados = self.iteracoes_realizadas
+        self.melhor_movimento_encontrado = melhor_movimento
+        self.tempo_execucao = time.time() - inicio
+        return melhor_movimento
+
+    def fechar(self) -> None:
+        """Encerra os processos trabalhadores."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __del__(self):
+        if self._pool is not None:
+            self._pool.terminate()
+
+    def __getstate__(self):
+        estado = self.__dict__.copy()
+        estado['_pool'] = None
+        return estado
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna estatísticas incluindo simulações por segundo de cada processo."""
+        stats = super().obter_estatisticas()
+        stats['playouts_por_trabalhador'] = list(self.playouts_por_trabalhador)
+        return stats
+
+
+class BuscaMonteCarloParalelaArvore(BuscaMonteCarlo):
+    """
+    MCTS com paralelismo na árvore.
+
+    Várias threads compartilham a mesma árvore, cada uma com seu próprio
+    tabuleiro de trabalho. A seleção, a expansão e a retropropagação são
+    protegidas por uma trava; a simulação roda fora dela. A perda virtual
+    conta visitas sem vitórias nos nós do caminho enquanto a simulação
+    está em andamento, para que as outras threads explorem ramos diferentes.
+
+    No CPython, o GIL limita o ganho das threads em simulações escritas em
+    Python puro; para usar vários núcleos, prefira BuscaMonteCarloParalelaRaiz.
+    """
+
+    def __init__(self, iteracoes: Optional[int] = 1000,
+                 tempo_limite: Optional[float] = None,
+                 constante_exploracao: float = 1.4,
+                 limite_rollout: int = 60,
+                 reaproveitar_arvore: bool = True,
+                 threads: Optional[int] = None,
+                 perda_virtual: int = 1):
+        """
+        Inicializa a busca paralela na árvore.
+
+        Args:
+            iteracoes (Optional[int]): Iterações por jogada, somando todas as threads
+            tempo_limite (Optional[float]): Tempo máximo por jogada, em segundos
+            constante_exploracao (float): Constante C da fórmula UCT
+            limite_rollout (int): Jogadas simuladas antes de avaliar a posição
+            reaproveitar_arvore (bool): Se deve manter a subárvore entre jogadas
+            threads (Optional[int]): Número de threads (padrão: núcleos da CPU)
+            perda_virtual (int): Visitas perdidas por simulação em andamento
+        """
+        super().__init__(iteracoes, tempo_limite, constante_exploracao, limite_rollout,
+                         reaproveitar_arvore)
+        if perda_virtual < 1:
+            raise ValueError("A perda virtual deve ser de pelo menos 1 visita")
+        self.threads = threads or os.cpu_count() or 1
+        self.perda_virtual = perda_virtual
+        self.playouts_por_trabalhador: List[float] = []
+        self._trava = threading.Lock()
+
+    def _executar_iteracoes(self, raiz: NoMCTS, trabalho: Tabuleiro, inicio: float) -> int:
+        """Distribui as iterações entre as threads; retorna o total realizado."""
+        contador = [0]
+        resultados = [(0, 0.0)] * self.threads
+
+        def trabalhar(indice: int, tabuleiro: Tabuleiro) -> None:
+            inicio_thread = time.time()
+            realizadas = 0
+            while True:
+                with self._trava:
+                    if self.iteracoes is not None and contador[0] >= self.iteracoes:
+                        break
+                    if (self._tempo_busca is not None and
+                            time.time() - inicio >= self._tempo_busca):
+                        break
+                    contador[0] += 1
+                    no, jogadas = self._selecionar_expandir(raiz, tabuleiro, self.perda_virtual)
+
+                recompensa = self._simular(tabuleiro)
+
+                with self._trava:
+                    self._retropropagar(no, recompensa, self.perda_virtual)
+                for _ in range(jogadas):
+                    tabuleiro.desfazer_movimento()
+                realizadas += 1
+            resultados[indice] = (realizadas, time.time() - inicio_thread)
+
+        trabalhadores = [threading.Thread(target=trabalhar, args=(i, trabalho.copy()), daemon=True)
+                         for i in range(self.threads)]
+        for thread in trabalhadores:
+            thread.start()
+        for thread in trabalhadores:
+            thread.join()
+
+        self.playouts_por_trabalhador = [realizadas / tempo if tempo > 0 else 0.0
+                                         for realizadas, tempo in resultados]
+        return sum(realizadas for realizadas, _ in resultados)
+
+    def escolher_movimento(self, tabuleiro: Tabuleiro, cor_jogador: CorPeca) -> Movimento:
+        self.playouts_por_trabalhador = []
+        return super().escolher_movimento(tabuleiro, cor_jogador)
+
+    def __getstate__(self):
+        estado = self.__dict__.copy()
+        del estado['_trava']
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self._trava = threading.Lock()
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna estatísticas incluindo simulações por segundo de cada thread."""
+        stats = super().obter_estatisticas()
+        stats['playouts_por_trabalhador'] = list(self.playouts_por_trabalhador)
+        return stats
@@ -0,0 +1,236 @@
+"""
+Ponderação: busca no tempo do oponente.
+
+MotorComPonderacao envolve um motor de utils/busca_avancada.py. Depois de
+devolver sua jogada, ele prevê a resposta do oponente (a melhor jogada
+guardada na tabela de transposição para a posição resultante) e começa a
+buscar, em uma thread, a posição após essa resposta. Quando a jogada real
+chega (EstrategiaJogo.notificar_jogada_oponente, chamado por JogoDamas e
+JogoVisual):
+
+- acerto: a busca em andamento continua e vira a busca da jogada, com o
+  tempo_limite do motor contado a partir desse momento; se a ponderação
+  já tiver chegado à profundidade máxima, a jogada sai imediatamente
+- erro: a busca é interrompida e o motor busca a posição real do zero
+  (a tabela de transposição, compartilhada, guarda o que foi calculado)
+
+A busca em segundo plano usa uma thread para compartilhar a tabela de
+transposição com o motor. Com o GIL, ela só ganha tempo de CPU real quando
+o oponente não está calculando no mesmo processo; o caso típico é uma
+partida contra um humano, em que o tempo de reflexão do humano é
+aproveitado sem aumentar a latência do motor.
+"""
+
+import copy
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from jogo_damas import Tabuleiro, Movimento, CorPeca
+from exercicios import EstrategiaJogo
+from utils.busca_avancada import BuscaNegamax
+
+
+class MotorComPonderacao(EstrategiaJogo):
+    """
+    Estratégia que pondera com um motor negamax (BuscaNegamax ou derivados).
+
+    Uma instância deve jogar com uma única cor por partida.
+    """
+
+    def __init__(self, motor: BuscaNegamax):
+        """
+        Inicializa a estratégia.
+
+        Args:
+            motor (BuscaNegamax): Motor usado nas jogadas; a ponderação usa uma
+                cópia dele, sem limite de tempo, com a mesma tabela de
+                transposição e ordenação de jogadas
+        """
+        super().__init__(motor.profundidade_maxima)
+        self.motor = motor
+        self.motor_ponderacao = copy.copy(motor)
+        self.motor_ponderacao.tempo_limite = None
+        self.motor_ponderacao.instrumentacao = None
+        self.motor_ponderacao.observadores = []
+        self.acertos_ponderacao = 0
+        self.erros_ponderacao = 0
+        self._thread: Optional[threading.Thread] = None
+        self._resultado: Optional[Movimento] = None
+        self._erro: Optional[BaseException] = None
+        self._chave_prevista: Optional[bytes] = None
+        self._resposta_prevista: Optional[Movimento] = None
+        self._cor: Optional[CorPeca] = None
+        self._erro_notificado = False
+        self._interrompida = False
+        self._inicio_ponderacao = 0.0
+        self._estatisticas: Dict[str, Any] = {}
+
+    def escolher_movimento(self, tabuleiro: Tabuleiro, cor_jogador: CorPeca) -> Movimento:
+        """
+        Escolhe a jogada, aproveitando a ponderação quando a previsão acertou.
+
+        Args:
+            tabuleiro (Tabuleiro): Estado atual do tabuleiro
+            cor_jogador (CorPeca): Cor do jogador que deve jogar
+
+        Returns:
+            Movimento: Jogada escolhida
+        """
+        inicio = time.time()
+        situacao = 'erro' if self._erro_notificado else None
+        self._erro_notificado = False
+        self._interrompida = False
+        tempo_ponderacao = 0.0
+
+        if self._thread is not None:
+            acerto = (self._cor == cor_jogador and
+                      self._chave_prevista == tabuleiro.chave_posicao())
+            tempo_ponderacao = inicio - self._inicio_ponderacao
+            if acerto and self._aguardar_ponderacao(self.motor.limitar_tempo(self.motor.tempo_limite,
+                                                                             inicio)):
+                situacao = 'acerto'
+                self.acertos_ponderacao += 1
+                movimento = self._resultado
+                origem = self.motor_ponderacao
+            else:
+                situacao = 'erro'
+                self.erros_ponderacao += 1
+                self._interromper_ponderacao()
+
+        if situacao != 'acerto':
+            movimento = self.motor.escolher_movimento(tabuleiro, cor_jogador)
+            origem = self.motor
+
+        self._estatisticas = origem.obter_estatisticas()
+        self._estatisticas['tempo_execucao'] = time.time() - inicio
+        self._estatisticas['ponderacao'] = situacao
+        self._estatisticas['tempo_ponderacao'] = tempo_ponderacao
+        self.nos_explorados = origem.nos_explorados
+        self.melhor_valor_encontrado = origem.melhor_valor_encontrado
+        self.melhor_movimento_encontrado = movimento
+        self.tempo_execucao = self._estatisticas['tempo_execucao']
+
+        self._iniciar_ponderacao(tabuleiro, cor_jogador, movimento)
+        return movimento
+
+    def notificar_jogada_oponente(self, tabuleiro: Tabuleiro, movimento: Movimento):
+        """
+        Interrompe a ponderação logo que a jogada do oponente difere da prevista.
+
+        Args:
+            tabuleiro (Tabuleiro): Tabuleiro após a jogada do oponente
+            movimento (Movimento): Jogada feita pelo oponente
+        """
+        if self._thread is not None and movimento != self._resposta_prevista:
+            self._interromper_ponderacao()
+            self.erros_ponderacao += 1
+            self._erro_notificado = True
+
+    def definir_prazo(self, prazo: Optional[float]):
+        """Repassa o prazo da jogada ao motor (vale também para a ponderação que a continua)."""
+        super().definir_prazo(prazo)
+        self.motor.definir_prazo(prazo)
+
+    def interromper_busca(self):
+        """Interrompe a busca da jogada (do motor ou da ponderação que a continua)."""
+        self._interrompida = True
+        self.motor.interromper_busca()
+
+    def encerrar_partida(self):
+        """Interrompe a ponderação ao fim da partida."""
+        self._interromper_ponderacao()
+        self._erro_notificado = False
+
+    def obter_estatisticas(self) -> dict:
+        """
+        Retorna as estatísticas da última jogada.
+
+        Além das estatísticas do motor, inclui 'ponderacao' ('acerto',
+        'erro' ou None quando não havia ponderação) e 'tempo_ponderacao'.
+        """
+        estatisticas = dict(self._estatisticas) if self._estatisticas else super().obter_estatisticas()
+        estatisticas['acertos_ponderacao'] = self.acertos_ponderacao
+        estatisticas['erros_ponderacao'] = self.erros_ponderacao
+        return estatisticas
+
+    def _prever_resposta(self, tabuleiro: Tabuleiro) -> Optional[Movimento]:
+        """Jogada prevista do oponente: a guardada na tabela ou, sem ela, a única legal."""
+        entrada = self.motor.tabela.entradas.get(tabuleiro.chave_posicao())
+        if entrada is not None and entrada[3] is not None:
+            return entrada[3]
+        movimentos = tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)
+        return movimentos[0] if len(movimentos) == 1 else None
+
+    def _iniciar_ponderacao(self, tabuleiro: Tabuleiro, cor_jogador: CorPeca,
+                            movimento: Movimento) -> None:
+        """
+        Começa a buscar a posição após a resposta prevista do oponente.
+
+        Args:
+            tabuleiro (Tabuleiro): Posição em que a jogada foi escolhida
+            cor_jogador (CorPeca): Cor desta estratégia
+            movimento (Movimento): Jogada escolhida
+        """
+        previsto = tabuleiro.copy()
+        previsto.turno_atual = cor_jogador
+        previsto.executar_movimento(movimento, validar=False)
+        if previsto.jogo_terminado()[0]:
+            return
+        resposta = self._prever_resposta(previsto)
+        if resposta is None:
+            return
+        try:
+            previsto.executar_movimento(resposta)
+        except Exception:
+            return
+        if not previsto.obter_movimentos_possiveis(cor_jogador):
+            return
+
+        self._resultado = None
+        self._erro = None
+        self._cor = cor_jogador
+        self._resposta_prevista = resposta
+        self._chave_prevista = previsto.chave_posicao()
+        self._inicio_ponderacao = time.time()
+
+        def ponderar():
+            try:
+                self._resultado = self.motor_ponderacao.escolher_movimento(previsto, cor_jogador)
+            except BaseException as erro:
+                self._erro = erro
+
+        self._thread = threading.Thread(target=ponderar, name='ponderacao', daemon=True)
+        self._thread.start()
+
+    def _aguardar_ponderacao(self, tempo_limite: Optional[float]) -> bool:
+        """
+        Espera a ponderação terminar, no máximo tempo_limite segundos.
+
+        Returns:
+            bool: Se a ponderação produziu uma jogada
+        """
+        prazo = time.time() + tempo_limite if tempo_limite is not None else None
+        self._esperar_thread(prazo)
+        return self._erro is None and self._resultado is not None
+
+    def _interromper_ponderacao(self) -> None:
+        """Interrompe a ponderação em andamento (se houver) e espera a thread."""
+        if self._thread is not None:
+            self._esperar_thread(0.0)
+
+    def _esperar_thread(self, prazo: Optional[float]) -> None:
+        """
+        Espera a thread de ponderação, impondo um prazo à busca.
+
+        O prazo é reaplicado a cada espera porque a busca redefine seu prazo
+        ao começar, o que pode acontecer depois desta chamada.
+        """
+        thread = self._thread
+        while thread.is_alive():
+            if self._interrompida:
+                prazo = 0.0
+            if prazo is not None:
+                self.motor_ponderacao.definir_prazo_busca(prazo)
+            thread.join(0.01)
+        self._thread = None
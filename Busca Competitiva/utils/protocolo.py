@@ -0,0 +1,578 @@
+"""
+Protocolo de texto para executar motores em processos separados.
+
+ServidorProtocolo expõe uma estratégia por stdin/stdout com um protocolo
+de linhas inspirado no UCI do xadrez. O processo do motor vive a partida
+inteira (ou o torneio inteiro), de modo que a tabela de transposição e a
+ordenação de jogadas continuam aquecidas entre as jogadas. MotorExterno é
+o lado cliente: uma EstrategiaJogo que conversa com o servidor em um
+subprocesso e pode ser usada diretamente em JogoDamas.
+
+Comandos (uma linha cada):
+
+- uci: identifica o motor; resposta "id name ..." e "uciok"
+- isready: resposta "readyok" (também durante a busca)
+- ucinewgame: nova partida; esvazia a tabela de transposição
+- position startpos [moves <j1> <j2> ...]
+- position fen <fen> [moves <j1> <j2> ...]
+- go [depth <n>] [movetime <ms>] [wtime <ms> btime <ms> [winc <ms> binc <ms>]]
+  [infinite]: inicia a busca em segundo plano; com os relógios, o tempo
+  da jogada é calculado por jogo_damas.relogio.alocar_tempo
+- stop: encerra a busca; o motor responde com a melhor jogada até agora
+- quit: encerra o servidor
+
+Respostas da busca:
+
+- info depth <n> score cp <v> nodes <n> time <ms> nps <n> pv <j1> <j2> ...
+  a cada profundidade concluída, com o valor em centésimos de peça do
+  ponto de vista de quem joga ("score win"/"score loss" para vitória ou
+  derrota forçada)
+- bestmove <jogada>, ou "bestmove (none)" sem jogadas legais
+- info string <texto>: erros e avisos
+
+Posições usam o FEN de damas (Tabuleiro.to_fen) e jogadas a notação PDN
+(Movimento.to_pdn, ex.: 22-18, 22x15, 22x15x24), com o caminho completo
+das capturas múltiplas para que cada jogada legal tenha uma notação única.
+
+Uso:
+    python -m utils.protocolo --motor pvs --tabela 2000000
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Dict, IO, List, Optional
+
+from jogo_damas import Tabuleiro, Movimento, CorPeca, alocar_tempo, posicao_para_casa
+from exercicios import EstrategiaJogo
+from utils.busca_avancada import (BuscaNegamax, BuscaPVS, BuscaMTDf, TabelaTransposicao,
+                                  ReducaoJogadasTardias, INFINITO)
+
+
+# Profundidade de "go infinite" para os motores negamax: a busca só
+# termina com stop (ou ao achar uma vitória forçada)
+PROFUNDIDADE_INFINITA = 64
+
+MOTORES = {
+    'negamax': BuscaNegamax,
+    'pvs': BuscaPVS,
+    'mtdf': BuscaMTDf,
+}
+
+
+def interpretar_movimento(tabuleiro: Tabuleiro, texto: str) -> Movimento:
+    """
+    Encontra a jogada legal escrita em notação PDN.
+
+    Capturas múltiplas são escritas com o caminho completo (Movimento.to_pdn,
+    ex.: "22x15x24"). A forma abreviada só com origem e destino ("22x24")
+    também é aceita quando uma única jogada legal corresponde a ela.
+
+    Args:
+        tabuleiro (Tabuleiro): Posição em que a jogada é feita
+        texto (str): Jogada em notação PDN (ex.: "22-18", "22x15")
+
+    Returns:
+        Movimento: Jogada legal correspondente
+
+    Raises:
+        ValueError: Se não há jogada legal com essa notação, ou se a forma
+            abreviada corresponde a mais de uma jogada
+    """
+    movimentos = tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)
+    for movimento in movimentos:
+        if movimento.to_pdn() == texto:
+            return movimento
+
+    candidatos: List[Movimento] = []
+    for movimento in movimentos:
+        if (movimento.e_captura and movimento not in candidatos and
+                f"{posicao_para_casa(movimento.origem)}x{posicao_para_casa(movimento.destino)}" == texto):
+            candidatos.append(movimento)
+    if len(candidatos) > 1:
+        opcoes = ", ".join(movimento.to_pdn() for movimento in candidatos)
+        raise ValueError(f"Jogada ambígua: {texto} (use o caminho completo: {opcoes})")
+    if candidatos:
+        return candidatos[0]
+    raise ValueError(f"Jogada inválida: {texto}")
+
+
+def montar_posicao(argumentos: List[str]) -> Tabuleiro:
+    """
+    Monta a posição descrita pelos argumentos do comando position.
+
+    Args:
+        argumentos (List[str]): "startpos" ou "fen <fen>", seguidos
+            opcionalmente de "moves" e jogadas em notação PDN
+
+    Returns:
+        Tabuleiro: Posição, com as jogadas executadas (e no histórico)
+
+    Raises:
+        ValueError: Se a posição ou alguma jogada é inválida
+    """
+    if 'moves' in argumentos:
+        indice = argumentos.index('moves')
+        argumentos, jogadas = argumentos[:indice], argumentos[indice + 1:]
+    else:
+        jogadas = []
+
+    if argumentos[:1] == ['startpos']:
+        tabuleiro = Tabuleiro()
+    elif argumentos[:1] == ['fen'] and len(argumentos) > 1:
+        tabuleiro = Tabuleiro.from_fen(''.join(argumentos[1:]))
+    else:
+        raise ValueError("use 'position startpos' ou 'position fen <fen>'")
+
+    for texto in jogadas:
+        tabuleiro.executar_movimento(interpretar_movimento(tabuleiro, texto), validar=False)
+    return tabuleiro
+
+
+def descrever_posicao(tabuleiro: Tabuleiro) -> str:
+    """
+    Argumentos do comando position que reproduzem a posição e suas repetições.
+
+    A posição é enviada como o FEN logo após o último movimento irreversível
+    (captura ou movimento de peça normal) mais as jogadas seguintes, que o
+    motor precisa para reconhecer repetições (Tabuleiro.repeticoes).
+
+    Args:
+        tabuleiro (Tabuleiro): Posição, com a vez de quem joga
+
+    Returns:
+        str: "fen <fen> [moves <jogadas>]"
+    """
+    historico = tabuleiro.historico_movimentos
+    quantidade = min(tabuleiro.jogadas_sem_progresso, len(historico))
+    if quantidade == 0:
+        return f"fen {tabuleiro.to_fen()}"
+    jogadas = historico[len(historico) - quantidade:]
+    inicio = tabuleiro.copy()
+    for _ in range(quantidade):
+        inicio.desfazer_movimento()
+    return f"fen {inicio.to_fen()} moves {' '.join(m.to_pdn() for m in jogadas)}"
+
+
+def formatar_valor(valor: float, cor: CorPeca) -> str:
+    """
+    Formata um valor (ponto de vista das brancas) para a linha info.
+
+    Args:
+        valor (float): Valor do ponto de vista das brancas
+        cor (CorPeca): Cor de quem joga na raiz
+
+    Returns:
+        str: "cp <centésimos>", "win" ou "loss", do ponto de vista de quem joga
+    """
+    if cor == CorPeca.PRETA:
+        valor = -valor
+    if valor == INFINITO:
+        return "win"
+    if valor == -INFINITO:
+        return "loss"
+    return f"cp {int(round(valor * 100))}"
+
+
+class ServidorProtocolo:
+    """
+    Servidor do protocolo para uma estratégia.
+
+    Os comandos são lidos na thread principal; a busca roda em outra
+    thread, para que stop e isready sejam atendidos durante a busca.
+    Limites de go (depth, movetime) valem só para aquela busca.
+    """
+
+    def __init__(self, motor: EstrategiaJogo, entrada: Optional[IO[str]] = None,
+                 saida: Optional[IO[str]] = None, nome: str = "Busca Competitiva"):
+        """
+        Inicializa o servidor.
+
+        Args:
+            motor (EstrategiaJogo): Estratégia servida (os motores de
+                utils/busca_avancada.py aceitam depth, movetime e stop)
+            entrada (Optional[IO[str]]): Fonte dos comandos (padrão: stdin)
+            saida (Optional[IO[str]]): Destino das respostas (padrão: stdout)
+            nome (str): Nome informado em resposta a uci
+        """
+        self.motor = motor
+        self.entrada = entrada if entrada is not None else sys.stdin
+        self.saida = saida if saida is not None else sys.stdout
+        self.nome = nome
+        self.tabuleiro = Tabuleiro()
+        self._lock_saida = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._parar = threading.Event()
+        self._cor_busca = CorPeca.BRANCA
+        self.motor.adicionar_observador(self._publicar_info)
+
+    def escrever(self, linha: str):
+        """Envia uma linha de resposta (seguro entre threads)."""
+        with self._lock_saida:
+            self.saida.write(linha + "\n")
+            self.saida.flush()
+
+    def executar(self):
+        """Atende comandos até quit ou o fim da entrada."""
+        try:
+            for linha in self.entrada:
+                if not self.processar(linha):
+                    break
+        finally:
+            self.parar()
+
+    def processar(self, linha: str) -> bool:
+        """
+        Executa um comando.
+
+        Args:
+            linha (str): Linha de comando
+
+        Returns:
+            bool: False se o servidor deve encerrar
+        """
+        partes = linha.split()
+        if not partes:
+            return True
+        comando, argumentos = partes[0], partes[1:]
+
+        try:
+            if comando == 'uci':
+                self.escrever(f"id name {self.nome} ({type(self.motor).__name__})")
+                self.escrever("uciok")
+            elif comando == 'isready':
+                self.escrever("readyok")
+            elif comando == 'ucinewgame':
+                self.parar()
+                self.motor.encerrar_partida()
+                if isinstance(self.motor, BuscaNegamax):
+                    self.motor.tabela.limpar()
+                self.tabuleiro = Tabuleiro()
+            elif comando == 'position':
+                self.parar()
+                self.tabuleiro = montar_posicao(argumentos)
+            elif comando == 'go':
+                self._iniciar_busca(argumentos)
+            elif comando == 'stop':
+                self.parar()
+            elif comando == 'quit':
+                return False
+            else:
+                self.escrever(f"info string comando desconhecido: {comando}")
+        except ValueError as erro:
+            self.escrever(f"info string erro: {erro}")
+        return True
+
+    def parar(self):
+        """Interrompe a busca em andamento e espera o bestmove ser enviado."""
+        self._parar.set()
+        thread = self._thread
+        if thread is not None:
+            # A busca redefine seu prazo ao começar: o pedido é repetido
+            # até a thread terminar
+            while thread.is_alive():
+                self.motor.interromper_busca()
+                thread.join(0.01)
+            self._thread = None
+
+    def _iniciar_busca(self, argumentos: List[str]):
+        if self._thread is not None and self._thread.is_alive():
+            raise ValueError("busca já em andamento")
+
+        profundidade = tempo_limite = None
+        infinita = False
+        relogios: Dict[str, float] = {}
+        indice = 0
+        while indice < len(argumentos):
+            chave = argumentos[indice]
+            if chave == 'infinite':
+                infinita = True
+            elif chave in ('depth', 'movetime', 'wtime', 'btime', 'winc', 'binc') and \
+                    indice + 1 < len(argumentos):
+                indice += 1
+                if chave == 'depth':
+                    profundidade = int(argumentos[indice])
+                elif chave == 'movetime':
+                    tempo_limite = int(argumentos[indice]) / 1000.0
+                else:
+                    relogios[chave] = int(argumentos[indice]) / 1000.0
+            else:
+                raise ValueError(f"argumento de go desconhecido: {chave}")
+            indice += 1
+
+        tabuleiro = self.tabuleiro.copy()
+        cor = tabuleiro.turno_atual
+        # Com o relógio de quem joga (e sem movetime), o prazo vem de alocar_tempo
+        lado = 'w' if cor == CorPeca.BRANCA else 'b'
+        if tempo_limite is None and f'{lado}time' in relogios:
+            pecas = tabuleiro.contar_pecas(CorPeca.BRANCA) + tabuleiro.contar_pecas(CorPeca.PRETA)
+            tempo_limite = alocar_tempo(relogios[f'{lado}time'], relogios.get(f'{lado}inc', 0.0), pecas)
+        if not tabuleiro.obter_movimentos_possiveis(cor):
+            self.escrever("bestmove (none)")
+            return
+
+        motor = self.motor
+        limites = {}
+        if isinstance(motor, BuscaNegamax):
+            if infinita:
+                limites = {'profundidade_maxima': PROFUNDIDADE_INFINITA, 'tempo_limite': None}
+            else:
+                if profundidade is not None:
+                    limites['profundidade_maxima'] = profundidade
+                if tempo_limite is not None:
+                    limites['tempo_limite'] = tempo_limite
+        elif hasattr(motor, 'tempo_limite') and tempo_limite is not None:
+            limites['tempo_limite'] = tempo_limite
+        originais = {nome: getattr(motor, nome) for nome in limites}
+
+        self._parar.clear()
+        self._cor_busca = cor
+
+        def buscar():
+            movimento = None
+            for nome, valor in limites.items():
+                setattr(motor, nome, valor)
+            try:
+                movimento = motor.escolher_movimento(tabuleiro, cor)
+            except Exception as erro:
+                self.escrever(f"info string erro na busca: {erro}")
+            finally:
+                for nome, valor in originais.items():
+                    setattr(motor, nome, valor)
+            # Em go infinite, o bestmove só sai depois de stop
+            if infinita:
+                self._parar.wait()
+            self.escrever(f"bestmove {movimento.to_pdn() if movimento else '(none)'}")
+
+        self._thread = threading.Thread(target=buscar, name='busca_protocolo', daemon=True)
+        self._thread.start()
+
+    def _publicar_info(self, resultado: Dict[str, Any]):
+        tempo_ms = int(resultado.get('tempo', 0.0) * 1000)
+        nos = resultado.get('nos_explorados', 0)
+        partes = [f"info depth {resultado['profundidade']}"]
+        if resultado.get('valor') is not None:
+            partes.append(f"score {formatar_valor(resultado['valor'], self._cor_busca)}")
+        partes.append(f"nodes {nos} time {tempo_ms} nps {nos * 1000 // max(tempo_ms, 1)}")
+        variacao = resultado.get('variacao_principal')
+        if variacao:
+            partes.append("pv " + " ".join(movimento.to_pdn() for movimento in variacao))
+        self.escrever(" ".join(partes))
+
+
+class MotorExterno(EstrategiaJogo):
+    """
+    Estratégia que delega a busca a um servidor do protocolo em um subprocesso.
+
+    Cada jogada envia a posição atual (position fen) e um go com os limites
+    configurados; as linhas info são repassadas aos observadores
+    (EstrategiaJogo.adicionar_observador) e o bestmove vira a jogada.
+    Chame fechar() ao terminar para encerrar o processo.
+    """
+
+    def __init__(self, comando: Optional[List[str]] = None,
+                 profundidade_maxima: Optional[int] = None,
+                 tempo_limite: Optional[float] = None,
+                 diretorio: Optional[str] = None):
+        """
+        Inicia o processo do motor.
+
+        Args:
+            comando (Optional[List[str]]): Comando do servidor (padrão:
+                python -m utils.protocolo, com o motor padrão)
+            profundidade_maxima (Optional[int]): Limite de profundidade (depth)
+            tempo_limite (Optional[float]): Tempo por jogada, em segundos (movetime)
+            diretorio (Optional[str]): Diretório de trabalho do processo
+                (padrão: a raiz do projeto)
+        """
+        super().__init__(profundidade_maxima or 0)
+        if comando is None:
+            comando = [sys.executable, '-m', 'utils.protocolo']
+        if diretorio is None:
+            diretorio = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.tempo_limite = tempo_limite
+        self.profundidade_alcancada = 0
+        self._lock_envio = threading.Lock()
+        self.processo = subprocess.Popen(comando, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                         text=True, bufsize=1, cwd=diretorio)
+        self._enviar("uci")
+        self.nome = self._ler_ate('uciok')
+
+    def _enviar(self, linha: str):
+        with self._lock_envio:
+            self.processo.stdin.write(linha + "\n")
+            self.processo.stdin.flush()
+
+    def _ler_linha(self) -> str:
+        linha = self.processo.stdout.readline()
+        if not linha:
+            raise RuntimeError("O processo do motor terminou")
+        return linha.strip()
+
+    def _ler_ate(self, resposta: str) -> str:
+        """Lê até a linha resposta; devolve o nome do motor (linha id name), se houver."""
+        nome = ""
+        while True:
+            linha = self._ler_linha()
+            if linha.startswith("id name "):
+                nome = linha[len("id name "):]
+            if linha == resposta:
+                return nome
+
+    def escolher_movimento(self, tabuleiro: Tabuleiro, cor_jogador: CorPeca) -> Movimento:
+        """
+        Escolhe a jogada pelo processo do motor.
+
+        Args:
+            tabuleiro (Tabuleiro): Estado atual do tabuleiro
+            cor_jogador (CorPeca): Cor do jogador que deve jogar
+
+        Returns:
+            Movimento: Jogada devolvida pelo motor
+        """
+        self.resetar_estatisticas()
+        self.profundidade_alcancada = 0
+        inicio = time.time()
+        posicao = tabuleiro.copy()
+        posicao.turno_atual = cor_jogador
+
+        go = ["go"]
+        if self.profundidade_maxima:
+            go.append(f"depth {self.profundidade_maxima}")
+        tempo_limite = self.limitar_tempo(self.tempo_limite, inicio)
+        if tempo_limite is not None:
+            go.append(f"movetime {int(tempo_limite * 1000)}")
+        self._enviar(f"position {descrever_posicao(posicao)}")
+        self._enviar(" ".join(go))
+
+        while True:
+            linha = self._ler_linha()
+            if linha.startswith("bestmove "):
+                texto = linha.split()[1]
+                break
+            if linha.startswith("info depth "):
+                self._receber_info(posicao, linha, cor_jogador)
+
+        if texto == "(none)":
+            raise ValueError("Não há movimentos possíveis para o jogador atual")
+        movimento = interpretar_movimento(posicao, texto)
+        self.melhor_movimento_encontrado = movimento
+        self.tempo_execucao = time.time() - inicio
+        return movimento
+
+    def _receber_info(self, posicao: Tabuleiro, linha: str, cor_jogador: CorPeca):
+        partes = linha.split()
+        campos: Dict[str, str] = {}
+        valor: Optional[float] = None
+        variacao: List[Movimento] = []
+        indice = 1
+        while indice < len(partes):
+            chave = partes[indice]
+            if chave == 'score':
+                if partes[indice + 1] == 'cp':
+                    valor = int(partes[indice + 2]) / 100.0
+                    indice += 1
+                else:
+                    valor = INFINITO if partes[indice + 1] == 'win' else -INFINITO
+                indice += 2
+            elif chave == 'pv':
+                variacao = self._interpretar_variacao(posicao, partes[indice + 1:])
+                break
+            else:
+                campos[chave] = partes[indice + 1]
+                indice += 2
+
+        if valor is not None and cor_jogador == CorPeca.PRETA:
+            valor = -valor
+        self.profundidade_alcancada = int(campos.get('depth', 0))
+        self.nos_explorados = int(campos.get('nodes', 0))
+        self.melhor_valor_encontrado = valor
+        if self.observadores:
+            self.publicar_resultado_parcial({
+                'profundidade': self.profundidade_alcancada,
+                'valor': valor,
+                'melhor_movimento': variacao[0] if variacao else None,
+                'variacao_principal': variacao,
+                'nos_explorados': self.nos_explorados,
+                'tempo': int(campos.get('time', 0)) / 1000.0,
+            })
+
+    @staticmethod
+    def _interpretar_variacao(posicao: Tabuleiro, textos: List[str]) -> List[Movimento]:
+        tabuleiro = posicao.copy()
+        variacao = []
+        for texto in textos:
+            try:
+                movimento = interpretar_movimento(tabuleiro, texto)
+            except ValueError:
+                break
+            tabuleiro.executar_movimento(movimento, validar=False)
+            variacao.append(movimento)
+        return variacao
+
+    def interromper_busca(self):
+        """Envia stop ao processo; ele responde com a melhor jogada até agora."""
+        if self.processo.poll() is None:
+            self._enviar("stop")
+
+    def encerrar_partida(self):
+        """Avisa o processo do fim da partida (ucinewgame)."""
+        if self.processo.poll() is None:
+            self._enviar("ucinewgame")
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna as estatísticas da última jogada, incluindo a profundidade alcançada."""
+        stats = super().obter_estatisticas()
+        stats['profundidade_alcancada'] = self.profundidade_alcancada
+        return stats
+
+    def fechar(self):
+        """Encerra o processo do motor."""
+        if self.processo.poll() is None:
+            self._enviar("quit")
+            try:
+                self.processo.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.processo.kill()
+
+
+def criar_motor(nome: str = 'pvs', profundidade_maxima: int = 32,
+                tamanho_tabela: int = 1000000, reducoes: bool = False) -> BuscaNegamax:
+    """
+    Cria um motor negamax para o servidor.
+
+    Args:
+        nome (str): Chave de MOTORES
+        profundidade_maxima (int): Profundidade padrão (go sem depth)
+        tamanho_tabela (int): Entradas da tabela de transposição
+        reducoes (bool): Se deve usar reduções de jogadas tardias
+
+    Returns:
+        BuscaNegamax: Motor criado
+    """
+    return MOTORES[nome](profundidade_maxima=profundidade_maxima,
+                         tabela_transposicao=TabelaTransposicao(tamanho_tabela),
+                         reducoes=ReducaoJogadasTardias() if reducoes else None)
+
+
+def main():
+    """Executa o servidor do protocolo em stdin/stdout."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Servidor de protocolo de texto para os motores")
+    parser.add_argument('--motor', choices=sorted(MOTORES), default='pvs', help="Motor servido")
+    parser.add_argument('--profundidade', type=int, default=32,
+                        help="Profundidade máxima quando go não informa depth")
+    parser.add_argument('--tabela', type=int, default=1000000,
+                        help="Entradas da tabela de transposição")
+    parser.add_argument('--reducoes', action='store_true', help="Usa reduções de jogadas tardias")
+    args = parser.parse_args()
+
+    motor = criar_motor(args.motor, args.profundidade, args.tabela, args.reducoes)
+    ServidorProtocolo(motor).executar()
+
+
+if __name__ == "__main__":
+    main()
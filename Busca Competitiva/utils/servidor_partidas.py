@@ -0,0 +1,545 @@
+"""
+Servidor de partidas simultâneas por TCP, com asyncio.
+
+ServidorPartidas hospeda várias partidas (JogoDamas) ao mesmo tempo.
+Alunos e bots se conectam por TCP e trocam mensagens JSON, uma por linha.
+Cada lugar de uma partida é ocupado por um jogador conectado ("remoto") ou
+por um motor de utils/busca_avancada.py. As buscas dos motores rodam em um
+pool de processos, de modo que o laço de eventos nunca bloqueia; cada
+processo mantém seus motores (e tabelas de transposição) entre jogadas.
+
+Cada partida pode ter um relógio (jogo_damas.Relogio): tempo total por lado
+mais incremento por jogada. O tempo de quem joga corre desde o fim da
+jogada anterior; os motores recebem o prazo alocado pelo relógio
+(Relogio.alocar_tempo), e quem deixa o relógio zerar perde a partida.
+
+Mensagens do cliente (campo "tipo"):
+
+- criar: {"branca": "remoto" | <motor>, "preta": ..., "profundidade": 6,
+  "tempo": 300, "incremento": 2, "limite_jogadas": 200}; resposta "criada"
+  com o número da partida. Partidas só entre motores começam na hora
+- entrar: {"partida": n, "cor": "branca" | "preta"} ocupa um lugar remoto;
+  a partida começa quando todos os lugares remotos estão ocupados
+- assistir: {"partida": n} passa a receber os estados da partida
+- jogar: {"partida": n, "jogada": "22-18"} (notação PDN; capturas múltiplas
+  com o caminho completo, ex.: "25x18x9", como em "jogadas_legais")
+- desistir: {"partida": n}
+- listar: partidas do servidor
+
+Mensagens do servidor: "estado" (FEN, turno, relógios, última jogada e
+jogadas legais) a jogadores e espectadores a cada jogada, "fim" com o
+vencedor e o motivo, e "erro".
+
+Uso:
+    python -m utils.servidor_partidas --porta 7000 --processos 4
+
+Exemplo de sessão (nc localhost 7000):
+    {"tipo": "criar", "branca": "remoto", "preta": "pvs", "tempo": 120}
+    {"tipo": "entrar", "partida": 1, "cor": "branca"}
+    {"tipo": "jogar", "partida": 1, "jogada": "22-18"}
+"""
+
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional, Set, Tuple
+
+from jogo_damas import (JogoDamas, Tabuleiro, Movimento, CorPeca, RegistroMemoria,
+                        ControleTempo, Relogio)
+from exercicios import EstrategiaJogo
+from utils.protocolo import (MOTORES, criar_motor, descrever_posicao, interpretar_movimento,
+                             montar_posicao)
+
+
+# Motores criados em cada processo do pool, reaproveitados entre jogadas
+# (e entre partidas com os mesmos parâmetros)
+_motores_processo: Dict[Tuple[str, int], EstrategiaJogo] = {}
+
+
+def buscar_jogada(nome_motor: str, profundidade: int, tempo_limite: Optional[float],
+                  posicao: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Busca uma jogada (executada nos processos do pool).
+
+    Args:
+        nome_motor (str): Chave de protocolo.MOTORES
+        profundidade (int): Profundidade máxima
+        tempo_limite (Optional[float]): Prazo da busca, em segundos
+        posicao (str): Posição, com a vez de quem joga, como nos argumentos
+            do comando position (veja protocolo.descrever_posicao)
+
+    Returns:
+        Tuple[str, Dict[str, Any]]: Jogada em notação PDN e estatísticas da busca
+    """
+    chave = (nome_motor, profundidade)
+    motor = _motores_processo.get(chave)
+    if motor is None:
+        motor = _motores_processo[chave] = criar_motor(nome_motor, profundidade)
+    motor.tempo_limite = tempo_limite
+
+    tabuleiro = montar_posicao(posicao.split())
+    movimento = motor.escolher_movimento(tabuleiro, tabuleiro.turno_atual)
+    estatisticas = motor.obter_estatisticas()
+    estatisticas['melhor_movimento'] = movimento.to_pdn()
+    return movimento.to_pdn(), estatisticas
+
+
+class JogadorRemoto(EstrategiaJogo):
+    """Lugar de um jogador conectado ao servidor; as jogadas chegam pela conexão."""
+
+    def __init__(self):
+        super().__init__(0)
+
+    def escolher_movimento(self, tabuleiro: Tabuleiro, cor_jogador: CorPeca) -> Movimento:
+        raise RuntimeError("As jogadas de um jogador remoto chegam pela conexão")
+
+
+class MotorEmProcesso(EstrategiaJogo):
+    """
+    Lugar de um motor, buscado por buscar_jogada().
+
+    O servidor executa buscar_jogada() no pool de processos; fora do
+    servidor, escolher_movimento() a executa no próprio processo.
+    """
+
+    def __init__(self, nome_motor: str = 'pvs', profundidade_maxima: int = 6,
+                 tempo_limite: Optional[float] = None):
+        """
+        Args:
+            nome_motor (str): Chave de protocolo.MOTORES
+            profundidade_maxima (int): Profundidade máxima
+            tempo_limite (Optional[float]): Tempo máximo por jogada, em segundos
+        """
+        if nome_motor not in MOTORES:
+            raise ValueError(f"Motor desconhecido: {nome_motor} (opções: {', '.join(sorted(MOTORES))})")
+        super().__init__(profundidade_maxima)
+        self.nome_motor = nome_motor
+        self.tempo_limite = tempo_limite
+        self._estatisticas: Dict[str, Any] = {}
+
+    def prazo(self, relogio: Optional[Relogio], pecas: int) -> Optional[float]:
+        """
+        Prazo da próxima busca: o tempo_limite, limitado pelo relógio.
+
+        Args:
+            relogio (Optional[Relogio]): Relógio da partida, com o turno
+                deste motor iniciado (None sem relógio)
+            pecas (int): Número de peças no tabuleiro
+
+        Returns:
+            Optional[float]: Prazo da busca, em segundos
+        """
+        if relogio is None:
+            return self.tempo_limite
+        alocacao = relogio.alocar_tempo(pecas)
+        self.definir_prazo(relogio.inicio_turno + alocacao if alocacao is not None else None)
+        return self.limitar_tempo(self.tempo_limite, time.time())
+
+    def escolher_movimento(self, tabuleiro: Tabuleiro, cor_jogador: CorPeca) -> Movimento:
+        """
+        Escolhe a jogada com buscar_jogada() no próprio processo.
+
+        Args:
+            tabuleiro (Tabuleiro): Estado atual do tabuleiro
+            cor_jogador (CorPeca): Cor do jogador que deve jogar
+
+        Returns:
+            Movimento: Jogada escolhida
+        """
+        posicao = tabuleiro.copy()
+        posicao.turno_atual = cor_jogador
+        texto, estatisticas = buscar_jogada(self.nome_motor, self.profundidade_maxima,
+                                            self.limitar_tempo(self.tempo_limite, time.time()),
+                                            descrever_posicao(posicao))
+        self.receber_estatisticas(estatisticas)
+        return interpretar_movimento(posicao, texto)
+
+    def receber_estatisticas(self, estatisticas: Dict[str, Any]):
+        """Guarda as estatísticas de uma busca feita em outro processo."""
+        self._estatisticas = estatisticas
+        self.nos_explorados = estatisticas['nos_explorados']
+        self.tempo_execucao = estatisticas['tempo_execucao']
+
+    def obter_estatisticas(self) -> dict:
+        """Retorna as estatísticas da última busca."""
+        return dict(self._estatisticas) if self._estatisticas else super().obter_estatisticas()
+
+
+class Conexao:
+    """Um cliente conectado; as mensagens são objetos JSON, um por linha."""
+
+    def __init__(self, escritor: asyncio.StreamWriter):
+        self.escritor = escritor
+        self.endereco = escritor.get_extra_info('peername')
+
+    def enviar(self, mensagem: Dict[str, Any]):
+        """Envia uma mensagem (sem esperar o envio)."""
+        if not self.escritor.is_closing():
+            self.escritor.write((json.dumps(mensagem, ensure_ascii=False) + "\n").encode('utf-8'))
+
+
+class Partida:
+    """Uma partida do servidor: o JogoDamas, os relógios e quem a acompanha."""
+
+    def __init__(self, numero: int, brancas: EstrategiaJogo, pretas: EstrategiaJogo,
+                 tempo: Optional[float], incremento: float, limite_jogadas: int):
+        self.numero = numero
+        controle = ControleTempo(tempo, incremento) if tempo is not None else None
+        self.jogo = JogoDamas(brancas, pretas, exibir_tabuleiro=False,
+                              limite_jogadas=limite_jogadas, registro_eventos=RegistroMemoria(),
+                              controle_tempo=controle)
+        self.jogadores: Dict[CorPeca, Optional[Conexao]] = {CorPeca.BRANCA: None, CorPeca.PRETA: None}
+        self.espectadores: Set[Conexao] = set()
+        self.iniciada = False
+        self.motivo: Optional[str] = None
+        self.ultima_jogada: Optional[str] = None
+        self.inicio_turno = 0.0
+        self.alarme: Optional[asyncio.TimerHandle] = None
+        self.busca: Optional[asyncio.Future] = None
+
+    @property
+    def em_andamento(self) -> bool:
+        return self.jogo.status.em_andamento
+
+    def lugares_livres(self) -> list:
+        """Cores remotas ainda sem jogador conectado."""
+        return [cor for cor, estrategia in self.jogo.estrategias.items()
+                if isinstance(estrategia, JogadorRemoto) and self.jogadores[cor] is None]
+
+    def relogio(self) -> Optional[Dict[str, float]]:
+        """Tempo restante de cada lado (o de quem joga, descontado o turno atual)."""
+        relogio = self.jogo.relogio
+        if relogio is None:
+            return None
+        return {cor.value: round(relogio.tempo_restante(cor), 3) for cor in CorPeca}
+
+    def resumo(self) -> Dict[str, Any]:
+        """Descrição curta da partida (mensagem listar)."""
+        return {
+            'partida': self.numero,
+            'branca': self._descricao(CorPeca.BRANCA),
+            'preta': self._descricao(CorPeca.PRETA),
+            'iniciada': self.iniciada,
+            'em_andamento': self.em_andamento,
+            'jogadas': self.jogo.status.numero_jogadas,
+            'espectadores': len(self.espectadores),
+        }
+
+    def _descricao(self, cor: CorPeca) -> str:
+        estrategia = self.jogo.estrategias[cor]
+        if isinstance(estrategia, MotorEmProcesso):
+            return f"{estrategia.nome_motor} (profundidade {estrategia.profundidade_maxima})"
+        return "remoto" if self.jogadores[cor] is not None else "remoto (livre)"
+
+    def conexoes(self) -> Set[Conexao]:
+        """Jogadores e espectadores."""
+        return self.espectadores | {c for c in self.jogadores.values() if c is not None}
+
+
+class ServidorPartidas:
+    """
+    Servidor TCP de partidas simultâneas.
+
+    Todo o estado das partidas vive no laço de eventos (uma única thread);
+    só as buscas dos motores saem dele, para o pool de processos.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', porta: int = 7000,
+                 processos: Optional[int] = None, profundidade_padrao: int = 6):
+        """
+        Inicializa o servidor.
+
+        Args:
+            host (str): Endereço de escuta
+            porta (int): Porta TCP (0 escolhe uma porta livre)
+            processos (Optional[int]): Processos de busca (padrão: todos os núcleos)
+            profundidade_padrao (int): Profundidade dos motores quando criar não informa
+        """
+        self.host = host
+        self.porta = porta
+        self.processos = processos or os.cpu_count()
+        self.profundidade_padrao = profundidade_padrao
+        self.partidas: Dict[int, Partida] = {}
+        self._proximo_numero = 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._servidor: Optional[asyncio.AbstractServer] = None
+
+    async def iniciar(self):
+        """Abre o pool de processos e começa a aceitar conexões."""
+        self._pool = ProcessPoolExecutor(self.processos)
+        self._servidor = await asyncio.start_server(self._atender, self.host, self.porta)
+        self.porta = self._servidor.sockets[0].getsockname()[1]
+
+    async def executar(self):
+        """Inicia o servidor e atende até ser cancelado."""
+        await self.iniciar()
+        try:
+            async with self._servidor:
+                await self._servidor.serve_forever()
+        finally:
+            self.fechar()
+
+    def fechar(self):
+        """Para de aceitar conexões, cancela os relógios e encerra o pool."""
+        if self._servidor is not None:
+            self._servidor.close()
+        for partida in self.partidas.values():
+            if partida.alarme is not None:
+                partida.alarme.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _atender(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        conexao = Conexao(escritor)
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+                if not linha.strip():
+                    continue
+                try:
+                    mensagem = json.loads(linha)
+                    if not isinstance(mensagem, dict):
+                        raise ValueError("a mensagem deve ser um objeto JSON")
+                    self._processar(conexao, mensagem)
+                except (ValueError, KeyError, TypeError) as erro:
+                    conexao.enviar({'tipo': 'erro', 'mensagem': str(erro)})
+                await escritor.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            # Conexão perdida ou servidor encerrado
+            pass
+        finally:
+            self._desconectar(conexao)
+            escritor.close()
+
+    def _desconectar(self, conexao: Conexao):
+        # O lugar fica livre para o jogador voltar; o relógio continua correndo
+        for partida in self.partidas.values():
+            partida.espectadores.discard(conexao)
+            for cor, jogador in partida.jogadores.items():
+                if jogador is conexao:
+                    partida.jogadores[cor] = None
+
+    def _processar(self, conexao: Conexao, mensagem: Dict[str, Any]):
+        tipo = mensagem.get('tipo')
+        if tipo == 'listar':
+            conexao.enviar({'tipo': 'partidas',
+                            'partidas': [p.resumo() for p in self.partidas.values()]})
+            return
+        if tipo == 'criar':
+            partida = self._criar_partida(mensagem)
+            conexao.enviar({'tipo': 'criada', **partida.resumo()})
+            if not partida.lugares_livres():
+                self._iniciar_partida(partida)
+            return
+
+        partida = self._obter_partida(mensagem)
+        if tipo == 'entrar':
+            cor = CorPeca(mensagem['cor'])
+            if cor not in partida.lugares_livres():
+                raise ValueError(f"O lugar {cor.value} da partida {partida.numero} não está livre")
+            partida.jogadores[cor] = conexao
+            conexao.enviar({'tipo': 'entrou', 'partida': partida.numero, 'cor': cor.value})
+            if not partida.iniciada and not partida.lugares_livres():
+                self._iniciar_partida(partida)
+            else:
+                conexao.enviar(self._estado(partida))
+        elif tipo == 'assistir':
+            partida.espectadores.add(conexao)
+            conexao.enviar(self._estado(partida))
+        elif tipo == 'jogar':
+            cor = self._cor_do_jogador(partida, conexao)
+            if not partida.iniciada or cor != partida.jogo.tabuleiro.turno_atual:
+                raise ValueError("Não é a sua vez")
+            movimento = interpretar_movimento(partida.jogo.tabuleiro, mensagem['jogada'])
+            self._registrar_jogada(partida, movimento, None)
+        elif tipo == 'desistir':
+            cor = self._cor_do_jogador(partida, conexao)
+            self._encerrar(partida, _oponente(cor), 'desistencia', cor)
+        else:
+            raise ValueError(f"Tipo de mensagem desconhecido: {tipo}")
+
+    def _obter_partida(self, mensagem: Dict[str, Any]) -> Partida:
+        partida = self.partidas.get(mensagem.get('partida'))
+        if partida is None:
+            raise ValueError(f"Partida inexistente: {mensagem.get('partida')}")
+        return partida
+
+    def _cor_do_jogador(self, partida: Partida, conexao: Conexao) -> CorPeca:
+        for cor, jogador in partida.jogadores.items():
+            if jogador is conexao:
+                if not partida.em_andamento:
+                    raise ValueError("A partida já terminou")
+                return cor
+        raise ValueError(f"Você não joga a partida {partida.numero}")
+
+    def _criar_partida(self, mensagem: Dict[str, Any]) -> Partida:
+        profundidade = int(mensagem.get('profundidade', self.profundidade_padrao))
+        tempo_limite = mensagem.get('tempo_limite')
+
+        def criar_lugar(descricao: str) -> EstrategiaJogo:
+            if descricao == 'remoto':
+                return JogadorRemoto()
+            return MotorEmProcesso(descricao, profundidade, tempo_limite)
+
+        tempo = mensagem.get('tempo')
+        partida = Partida(self._proximo_numero,
+                          criar_lugar(mensagem.get('branca', 'remoto')),
+                          criar_lugar(mensagem.get('preta', 'remoto')),
+                          float(tempo) if tempo is not None else None,
+                          float(mensagem.get('incremento', 0.0)),
+                          int(mensagem.get('limite_jogadas', 200)))
+        self.partidas[partida.numero] = partida
+        self._proximo_numero += 1
+        return partida
+
+    def _iniciar_partida(self, partida: Partida):
+        partida.iniciada = True
+        self._proximo_turno(partida)
+
+    def _proximo_turno(self, partida: Partida):
+        """Começa o turno de quem tem a vez: relógio, busca do motor e estado."""
+        jogo = partida.jogo
+        if jogo.verificar_termino():
+            if jogo.tabuleiro.jogo_terminado()[0]:
+                motivo = 'sem_jogadas'
+            else:
+                motivo = jogo.tabuleiro.verificar_empate() or 'limite'
+            self._encerrar(partida, jogo.status.vencedor, None, motivo=motivo)
+            return
+
+        loop = asyncio.get_running_loop()
+        cor = jogo.tabuleiro.turno_atual
+        partida.inicio_turno = loop.time()
+        if jogo.relogio is not None:
+            jogo.relogio.iniciar_turno(cor)
+            partida.alarme = loop.call_later(jogo.relogio.tempo_disponivel(),
+                                             self._tempo_esgotado, partida, cor)
+
+        estrategia = jogo.estrategias[cor]
+        if isinstance(estrategia, MotorEmProcesso):
+            posicao = jogo.tabuleiro.copy()
+            prazo = estrategia.prazo(jogo.relogio, posicao.contar_pecas(CorPeca.BRANCA) +
+                                     posicao.contar_pecas(CorPeca.PRETA))
+            busca = loop.run_in_executor(self._pool, buscar_jogada, estrategia.nome_motor,
+                                         estrategia.profundidade_maxima, prazo,
+                                         descrever_posicao(posicao))
+            partida.busca = busca
+            busca.add_done_callback(lambda futuro: self._jogada_motor(partida, posicao, futuro))
+
+        self._difundir(partida, self._estado(partida))
+
+    def _jogada_motor(self, partida: Partida, posicao: Tabuleiro, futuro: asyncio.Future):
+        # Resultados de buscas de partidas já encerradas (por tempo) são descartados
+        if futuro is not partida.busca or futuro.cancelled() or not partida.em_andamento:
+            return
+        partida.busca = None
+        cor = posicao.turno_atual
+        try:
+            texto, estatisticas = futuro.result()
+            movimento = interpretar_movimento(posicao, texto)
+        except Exception as erro:
+            self._encerrar(partida, _oponente(cor), 'erro', erro)
+            return
+        partida.jogo.estrategias[cor].receber_estatisticas(estatisticas)
+        self._registrar_jogada(partida, movimento, estatisticas)
+
+    def _registrar_jogada(self, partida: Partida, movimento: Movimento,
+                          estatisticas: Optional[Dict[str, Any]]):
+        """Desconta o relógio, aplica a jogada e passa a vez."""
+        cor = partida.jogo.tabuleiro.turno_atual
+        decorrido = asyncio.get_running_loop().time() - partida.inicio_turno
+        if partida.alarme is not None:
+            partida.alarme.cancel()
+            partida.alarme = None
+        if partida.jogo.relogio is not None and not partida.jogo.relogio.encerrar_turno():
+            self._encerrar(partida, _oponente(cor), 'tempo', cor)
+            return
+
+        if estatisticas is None:
+            estatisticas = {'nos_explorados': 0, 'tempo_execucao': decorrido,
+                            'profundidade_maxima': 0, 'melhor_movimento': movimento.to_pdn()}
+        partida.ultima_jogada = movimento.to_pdn()
+        partida.jogo.aplicar_jogada(movimento, estatisticas)
+        self._proximo_turno(partida)
+
+    def _tempo_esgotado(self, partida: Partida, cor: CorPeca):
+        if not partida.em_andamento:
+            return
+        partida.jogo.relogio.marcar_tempo_esgotado()
+        self._encerrar(partida, _oponente(cor), 'tempo', cor)
+
+    def _encerrar(self, partida: Partida, vencedor: Optional[CorPeca], evento: Optional[str],
+                  *dados, motivo: Optional[str] = None):
+        """Encerra a partida, cancela relógio e busca e avisa todos."""
+        if partida.alarme is not None:
+            partida.alarme.cancel()
+            partida.alarme = None
+        if partida.busca is not None:
+            partida.busca.cancel()
+            partida.busca = None
+        partida.motivo = motivo or evento
+        partida.jogo.encerrar(vencedor, evento, *dados)
+        self._difundir(partida, {
+            'tipo': 'fim',
+            'partida': partida.numero,
+            'vencedor': vencedor.value if vencedor else None,
+            'motivo': partida.motivo,
+            'jogadas': partida.jogo.status.numero_jogadas,
+            'relogio': partida.relogio(),
+        })
+
+    def _estado(self, partida: Partida) -> Dict[str, Any]:
+        tabuleiro = partida.jogo.tabuleiro
+        em_andamento = partida.iniciada and partida.em_andamento
+        return {
+            'tipo': 'estado',
+            'partida': partida.numero,
+            'fen': tabuleiro.to_fen(),
+            'turno': tabuleiro.turno_atual.value,
+            'jogadas': partida.jogo.status.numero_jogadas,
+            'ultima_jogada': partida.ultima_jogada,
+            'relogio': partida.relogio(),
+            'jogadas_legais': ([m.to_pdn() for m in tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)]
+                               if em_andamento else []),
+            'iniciada': partida.iniciada,
+            'em_andamento': partida.em_andamento,
+        }
+
+    @staticmethod
+    def _difundir(partida: Partida, mensagem: Dict[str, Any]):
+        for conexao in partida.conexoes():
+            conexao.enviar(mensagem)
+
+
+def _oponente(cor: CorPeca) -> CorPeca:
+    return CorPeca.PRETA if cor == CorPeca.BRANCA else CorPeca.BRANCA
+
+
+def main():
+    """Executa o servidor de partidas."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Servidor TCP de partidas simultâneas")
+    parser.add_argument('--host', default='127.0.0.1', help="Endereço de escuta")
+    parser.add_argument('--porta', type=int, default=7000, help="Porta TCP")
+    parser.add_argument('--processos', type=int, default=None,
+                        help="Processos de busca (padrão: todos os núcleos)")
+    parser.add_argument('--profundidade', type=int, default=6,
+                        help="Profundidade padrão dos motores")
+    args = parser.parse_args()
+
+    servidor = ServidorPartidas(args.host, args.porta, args.processos, args.profundidade)
+    print(f"Servidor de partidas em {args.host}:{args.porta} ({servidor.processos} processos de busca)")
+    try:
+        asyncio.run(servidor.executar())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
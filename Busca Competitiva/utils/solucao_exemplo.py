@@ -77,6 +77,7 @@ class MiniMaxCompleto(EstrategiaJogo):
                     melhor_movimento = movimento
         
         self.melhor_movimento_encontrado = melhor_movimento
+        self.melhor_valor_encontrado = melhor_valor
         self.tempo_execucao = time.time() - inicio
         return melhor_movimento
     
@@ -135,6 +136,16 @@ class PodaAlfaBetaCompleta(EstrategiaJogo):
     Tente implementar primeiro nos espaços TODO!
     """
     
+    def __init__(self, profundidade_maxima: int = 6, registro_arvore=None):
+        """
+        Args:
+            profundidade_maxima (int): Profundidade máxima de busca
+            registro_arvore (Optional[RegistroArvore]): Se dado, grava a
+                árvore explorada (veja utils/arvore_busca.py)
+        """
+        super().__init__(profundidade_maxima)
+        self.registro_arvore = registro_arvore
+    
     def escolher_movimento(self, tabuleiro: Tabuleiro, cor_jogador: CorPeca) -> Movimento:
         """Implementação completa da Poda Alfa-Beta."""
         self.resetar_estatisticas()
@@ -149,19 +160,27 @@ class PodaAlfaBetaCompleta(EstrategiaJogo):
         maximizando = (cor_jogador == CorPeca.BRANCA)
         alfa = float('-inf')
         beta = float('inf')
+        registro = self.registro_arvore
+        if registro is not None:
+            registro.iniciar_busca(alfa, beta)
+            registro.definir_filhos(len(movimentos_possiveis))
         
         if maximizando:
             melhor_valor = float('-inf')
-            for movimento in movimentos_possiveis:
+            for indice, movimento in enumerate(movimentos_possiveis):
                 tabuleiro_copia = tabuleiro.copy()
                 tabuleiro_copia.executar_movimento(movimento)
                 
+                if registro is not None:
+                    registro.entrar(movimento, indice, alfa, beta)
                 valor = self.alfabeta_recursivo(
                     tabuleiro_copia, 
                     self.profundidade_maxima - 1, 
                     alfa, beta, False, 
                     CorPeca.PRETA
                 )
+                if registro is not None:
+                    registro.sair(valor)
                 
                 if valor > melhor_valor:
                     melhor_valor = valor
@@ -169,19 +188,25 @@ class PodaAlfaBetaCompleta(EstrategiaJogo):
                 
                 alfa = max(alfa, melhor_valor)
                 if beta <= alfa:
+                    if registro is not None:
+                        registro.marcar_corte(indice)
                     break  # Poda
         else:
             melhor_valor = float('inf')
-            for movimento in movimentos_possiveis:
+            for indice, movimento in enumerate(movimentos_possiveis):
                 tabuleiro_copia = tabuleiro.copy()
                 tabuleiro_copia.executar_movimento(movimento)
                 
+                if registro is not None:
+                    registro.entrar(movimento, indice, alfa, beta)
                 valor = self.alfabeta_recursivo(
                     tabuleiro_copia, 
                     self.profundidade_maxima - 1, 
                     alfa, beta, True, 
                     CorPeca.BRANCA
                 )
+                if registro is not None:
+                    registro.sair(valor)
                 
                 if valor < melhor_valor:
                     melhor_valor = valor
@@ -189,9 +214,15 @@ class PodaAlfaBetaCompleta(EstrategiaJogo):
                 
                 beta = min(beta, melhor_valor)
                 if beta <= alfa:
+                    if registro is not None:
+                        registro.marcar_corte(indice)
                     break  # Poda
         
+        if registro is not None:
+            registro.finalizar_busca(melhor_valor)
+        
         self.melhor_movimento_encontrado = melhor_movimento
+        self.melhor_valor_encontrado = melhor_valor
         self.tempo_execucao = time.time() - inicio
         return melhor_movimento
     
@@ -210,44 +241,60 @@ class PodaAlfaBetaCompleta(EstrategiaJogo):
         if not movimentos:
             return tabuleiro.avaliar_posicao()
         
+        registro = self.registro_arvore
+        if registro is not None:
+            registro.definir_filhos(len(movimentos))
+        
         # Recursão com poda
         if maximizando:
             melhor_valor = float('-inf')
-            for movimento in movimentos:
+            for indice, movimento in enumerate(movimentos):
                 tabuleiro_copia = tabuleiro.copy()
                 tabuleiro_copia.executar_movimento(movimento)
                 
+                if registro is not None:
+                    registro.entrar(movimento, indice, alfa, beta)
                 valor = self.alfabeta_recursivo(
                     tabuleiro_copia, 
                     profundidade - 1, 
                     alfa, beta, False, 
                     CorPeca.PRETA
                 )
+                if registro is not None:
+                    registro.sair(valor)
                 
                 melhor_valor = max(melhor_valor, valor)
                 alfa = max(alfa, melhor_valor)
                 
                 if beta <= alfa:
+                    if registro is not None:
+                        registro.marcar_corte(indice)
                     break  # Poda alfa-beta
             
             return melhor_valor
         else:
             melhor_valor = float('inf')
-            for movimento in movimentos:
+            for indice, movimento in enumerate(movimentos):
                 tabuleiro_copia = tabuleiro.copy()
                 tabuleiro_copia.executar_movimento(movimento)
                 
+                if registro is not None:
+                    registro.entrar(movimento, indice, alfa, beta)
                 valor = self.alfabeta_recursivo(
                     tabuleiro_copia, 
                     profundidade - 1, 
                     alfa, beta, True, 
                     CorPeca.BRANCA
                 )
+                if registro is not None:
+                    registro.sair(valor)
                 
                 melhor_valor = min(melhor_valor, valor)
                 beta = min(beta, melhor_valor)
                 
                 if beta <= alfa:
+                    if registro is not None:
+                        registro.marcar_corte(indice)
                     break  # Poda alfa-beta
             
             return melhor_valor
@@ -312,6 +359,7 @@ class ExpectMiniMaxCompleto(EstrategiaJogo):
                     melhor_movimento = movimento
         
         self.melhor_movimento_encontrado = melhor_movimento
+        self.melhor_valor_encontrado = melhor_valor
         self.tempo_execucao = time.time() - inicio
         return melhor_movimento
     
@@ -7,11 +7,13 @@ permitindo jogar e visualizar os algoritmos de forma intuitiva.
 
 from .interface_grafica import InterfaceGrafica
 from .jogo_visual import JogoVisual
+from .renderizador import RenderizadorPartidas
 from .configuracao_visual import Cores, Fontes, Animacao, LayoutPresets, obter_preset
 
 __all__ = [
     'InterfaceGrafica', 
     'JogoVisual',
+    'RenderizadorPartidas',
     'Cores',
     'Fontes', 
     'Animacao',
@@ -0,0 +1,107 @@
+"""
+Análise da posição em segundo plano para a interface gráfica.
+
+AnaliseSegundoPlano mantém um motor com aprofundamento iterativo buscando,
+em uma thread, a posição mostrada na tela. A cada profundidade concluída o
+motor publica um resultado parcial (EstrategiaJogo.adicionar_observador);
+a interface lê o último resultado a cada quadro para desenhar a barra de
+avaliação e a variação principal, sem esperar a busca. Quando a posição
+muda, a busca anterior é interrompida e outra começa na posição nova.
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+from jogo_damas import Tabuleiro
+from exercicios.algoritmos_busca import EstrategiaJogo
+
+
+class AnaliseSegundoPlano:
+    """
+    Análise contínua da posição atual.
+
+    A análise começa desligada; alternar() a liga e desliga. Enquanto
+    ligada, atualizar() deve ser chamado a cada quadro com o tabuleiro
+    exibido.
+    """
+
+    def __init__(self, motor: Optional[EstrategiaJogo] = None):
+        """
+        Inicializa a análise.
+
+        Args:
+            motor (Optional[EstrategiaJogo]): Motor que publica resultados
+                parciais e pode ser interrompido (padrão: BuscaPVS até a
+                profundidade 32, sem limite de tempo)
+        """
+        if motor is None:
+            from utils.busca_avancada import BuscaPVS
+            motor = BuscaPVS(profundidade_maxima=32)
+        self.motor = motor
+        self.motor.adicionar_observador(self._receber_resultado)
+        self.ativa = False
+        self._chave: Optional[bytes] = None
+        self._resultado: Optional[Dict[str, Any]] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def alternar(self) -> bool:
+        """
+        Liga ou desliga a análise.
+
+        Returns:
+            bool: Se a análise ficou ligada
+        """
+        self.ativa = not self.ativa
+        if not self.ativa:
+            self.parar()
+        return self.ativa
+
+    def atualizar(self, tabuleiro: Tabuleiro) -> Optional[Dict[str, Any]]:
+        """
+        Acompanha a posição exibida e devolve o último resultado da análise.
+
+        Args:
+            tabuleiro (Tabuleiro): Posição exibida (é copiada ao mudar)
+
+        Returns:
+            Optional[Dict[str, Any]]: Último resultado publicado pelo motor
+            para esta posição (veja EstrategiaJogo.publicar_resultado_parcial),
+            ou None se a análise está desligada ou ainda não concluiu a
+            primeira profundidade
+        """
+        if not self.ativa:
+            return None
+        chave = tabuleiro.chave_posicao()
+        if chave != self._chave:
+            self.parar()
+            self._chave = chave
+            if not tabuleiro.jogo_terminado()[0]:
+                self._iniciar(tabuleiro.copy())
+        return self._resultado
+
+    def parar(self):
+        """Interrompe a busca em andamento e descarta o resultado."""
+        thread = self._thread
+        if thread is not None:
+            # A busca redefine seu prazo ao começar: o pedido é repetido
+            # até a thread terminar
+            while thread.is_alive():
+                self.motor.interromper_busca()
+                thread.join(0.01)
+            self._thread = None
+        self._chave = None
+        self._resultado = None
+
+    def _iniciar(self, tabuleiro: Tabuleiro):
+        def analisar():
+            try:
+                self.motor.escolher_movimento(tabuleiro, tabuleiro.turno_atual)
+            except Exception:
+                # Análise é só informativa: um erro encerra a análise desta posição
+                pass
+
+        self._thread = threading.Thread(target=analisar, name='analise', daemon=True)
+        self._thread.start()
+
+    def _receber_resultado(self, resultado: Dict[str, Any]):
+        self._resultado = resultado
@@ -5,9 +5,10 @@ Este módulo implementa a renderização visual do tabuleiro, peças e interface
 de usuário para o jogo de damas.
 """
 
+import math
 import pygame
 import sys
-from typing import Tuple, Optional, List
+from typing import Dict, Tuple, Optional, List
 from jogo_damas import Tabuleiro, CorPeca, Movimento
 
 
@@ -31,6 +32,9 @@ class InterfaceGrafica:
     COR_FUNDO = (50, 50, 50)              # Cinza escuro
     COR_TEXTO = (255, 255, 255)           # Branco
     
+    # Número máximo de textos renderizados guardados em cache
+    LIMITE_CACHE_TEXTOS = 256
+    
     def __init__(self, largura: int = 800, altura: int = 900):
         """
         Inicializa a interface gráfica.
@@ -71,6 +75,26 @@ class InterfaceGrafica:
         
         # Clock para controlar FPS
         self.clock = pygame.time.Clock()
+        
+        # Caches de renderização: camada estática do tabuleiro, sprites das
+        # peças, textos renderizados e o estado desenhado no último quadro
+        self._superficie_tabuleiro = self._criar_superficie_tabuleiro()
+        self._sprites_pecas: Dict[Tuple[CorPeca, bool], pygame.Surface] = {}
+        self._textos: Dict[Tuple[str, pygame.font.Font, Tuple[int, int, int]], pygame.Surface] = {}
+        self._casas_anteriores: Optional[List[Tuple]] = None
+        self._info_anterior: Optional[Tuple] = None
+        self._analise_anterior: Optional[Tuple] = None
+        
+        # Análise em segundo plano (visual.analise.AnaliseSegundoPlano),
+        # desenhada como barra de avaliação e variação principal
+        self.analise = None
+        
+        # Jogadas legais do turno, calculadas uma vez por posição
+        # (veja movimentos_do_turno)
+        self._chave_movimentos: Optional[bytes] = None
+        self._movimentos_turno: List[Movimento] = []
+        self._movimentos_por_origem: Dict[Tuple[int, int], List[Movimento]] = {}
+        self._movimentos_por_origem_destino: Dict[Tuple[Tuple[int, int], Tuple[int, int]], Movimento] = {}
     
     def posicao_para_coordenadas(self, linha: int, coluna: int) -> Tuple[int, int]:
         """
@@ -109,29 +133,90 @@ class InterfaceGrafica:
             return (linha, coluna)
         return None
     
-    def desenhar_tabuleiro(self):
-        """Desenha o tabuleiro de damas."""
+    def _criar_superficie_tabuleiro(self) -> pygame.Surface:
+        """
+        Pré-renderiza as 64 casas com bordas.
+        
+        Returns:
+            pygame.Surface: Camada estática do tabuleiro
+        """
+        tamanho = self.tamanho_casa
+        superficie = pygame.Surface((tamanho * 8, tamanho * 8))
         for linha in range(8):
             for coluna in range(8):
-                x, y = self.posicao_para_coordenadas(linha, coluna)
-                
-                # Escolher cor da casa
-                if (linha + coluna) % 2 == 0:
-                    cor = self.COR_CASA_CLARA
-                else:
-                    cor = self.COR_CASA_ESCURA
-                
-                # Destacar posição selecionada
-                if self.posicao_selecionada == (linha, coluna):
-                    cor = self.COR_DESTAQUE
-                
-                # Desenhar casa
-                pygame.draw.rect(self.tela, cor, 
-                               (x, y, self.tamanho_casa, self.tamanho_casa))
-                
-                # Desenhar borda
-                pygame.draw.rect(self.tela, (0, 0, 0), 
-                               (x, y, self.tamanho_casa, self.tamanho_casa), 1)
+                cor = self.COR_CASA_CLARA if (linha + coluna) % 2 == 0 else self.COR_CASA_ESCURA
+                retangulo = (coluna * tamanho, linha * tamanho, tamanho, tamanho)
+                pygame.draw.rect(superficie, cor, retangulo)
+                pygame.draw.rect(superficie, (0, 0, 0), retangulo, 1)
+        return superficie
+    
+    def _sprite_peca(self, cor: CorPeca, dama: bool) -> pygame.Surface:
+        """
+        Retorna o sprite (do tamanho de uma casa) de uma peça, criando-o na primeira vez.
+        
+        Args:
+            cor (CorPeca): Cor da peça
+            dama (bool): Se a peça é dama
+            
+        Returns:
+            pygame.Surface: Sprite com fundo transparente
+        """
+        chave = (cor, dama)
+        sprite = self._sprites_pecas.get(chave)
+        if sprite is None:
+            tamanho = self.tamanho_casa
+            centro = (tamanho // 2, tamanho // 2)
+            raio = tamanho // 3
+            cor_peca = self.COR_PECA_BRANCA if cor == CorPeca.BRANCA else self.COR_PECA_PRETA
+            
+            sprite = pygame.Surface((tamanho, tamanho), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, cor_peca, centro, raio)
+            pygame.draw.circle(sprite, self.COR_BORDA_PECA, centro, raio, 3)
+            
+            # Indicar dama com círculo menor interno
+            if dama:
+                pygame.draw.circle(sprite, self.COR_BORDA_PECA, centro, raio // 2, 2)
+            self._sprites_pecas[chave] = sprite
+        return sprite
+    
+    def _texto(self, texto: str, fonte: pygame.font.Font,
+               cor: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Renderiza um texto, reaproveitando a superfície se ele não mudou.
+        
+        Args:
+            texto (str): Texto a renderizar
+            fonte (pygame.font.Font): Fonte
+            cor (Tuple[int, int, int]): Cor do texto
+            
+        Returns:
+            pygame.Surface: Texto renderizado
+        """
+        chave = (texto, fonte, cor)
+        superficie = self._textos.get(chave)
+        if superficie is None:
+            if len(self._textos) >= self.LIMITE_CACHE_TEXTOS:
+                self._textos.clear()
+            superficie = fonte.render(texto, True, cor)
+            self._textos[chave] = superficie
+        return superficie
+    
+    def invalidar(self):
+        """Força o redesenho completo no próximo quadro (após desenhar fora de renderizar)."""
+        self._casas_anteriores = None
+        self._info_anterior = None
+        self._analise_anterior = None
+    
+    def desenhar_tabuleiro(self):
+        """Desenha o tabuleiro de damas."""
+        self.tela.blit(self._superficie_tabuleiro, (self.offset_x, self.offset_y))
+        
+        # Destacar posição selecionada
+        if self.posicao_selecionada is not None:
+            x, y = self.posicao_para_coordenadas(*self.posicao_selecionada)
+            retangulo = (x, y, self.tamanho_casa, self.tamanho_casa)
+            pygame.draw.rect(self.tela, self.COR_DESTAQUE, retangulo)
+            pygame.draw.rect(self.tela, (0, 0, 0), retangulo, 1)
     
     def desenhar_movimentos_possiveis(self):
         """Desenha indicadores para movimentos possíveis."""
@@ -163,25 +248,8 @@ class InterfaceGrafica:
         if not peca:
             return
         
-        x, y = self.posicao_para_coordenadas(linha, coluna)
-        centro_x = x + self.tamanho_casa // 2
-        centro_y = y + self.tamanho_casa // 2
-        raio = self.tamanho_casa // 3
-        
-        # Cor da peça
-        if peca.cor == CorPeca.BRANCA:
-            cor_peca = self.COR_PECA_BRANCA
-        else:
-            cor_peca = self.COR_PECA_PRETA
-        
-        # Desenhar peça
-        pygame.draw.circle(self.tela, cor_peca, (centro_x, centro_y), raio)
-        pygame.draw.circle(self.tela, self.COR_BORDA_PECA, (centro_x, centro_y), raio, 3)
-        
-        # Indicar dama com círculo menor interno
-        if peca.e_dama():
-            pygame.draw.circle(self.tela, self.COR_BORDA_PECA, 
-                             (centro_x, centro_y), raio // 2, 2)
+        self.tela.blit(self._sprite_peca(peca.cor, peca.e_dama()),
+                       self.posicao_para_coordenadas(linha, coluna))
     
     def desenhar_pecas(self, tabuleiro: Tabuleiro):
         """
@@ -194,6 +262,58 @@ class InterfaceGrafica:
             for coluna in range(8):
                 self.desenhar_peca(linha, coluna, tabuleiro)
     
+    def _estado_casas(self, tabuleiro: Tabuleiro) -> List[Tuple]:
+        """
+        Descreve o que é desenhado em cada casa, para detectar casas alteradas.
+        
+        Returns:
+            List[Tuple]: Por casa, (peça como (cor, dama) ou None, selecionada,
+            indicador de movimento: None, False para movimento, True para captura)
+        """
+        indicadores = {movimento.destino: movimento.e_captura
+                       for movimento in self.movimentos_possiveis}
+        estados = []
+        for linha in range(8):
+            for coluna in range(8):
+                posicao = (linha, coluna)
+                peca = tabuleiro.get_peca(posicao)
+                estados.append(((peca.cor, peca.e_dama()) if peca else None,
+                                posicao == self.posicao_selecionada,
+                                indicadores.get(posicao)))
+        return estados
+    
+    def _desenhar_casa(self, linha: int, coluna: int, estado: Tuple) -> pygame.Rect:
+        """
+        Redesenha uma casa a partir das camadas em cache.
+        
+        Args:
+            linha (int): Linha da casa
+            coluna (int): Coluna da casa
+            estado (Tuple): Estado da casa (veja _estado_casas)
+            
+        Returns:
+            pygame.Rect: Área da tela redesenhada
+        """
+        peca, selecionada, indicador = estado
+        tamanho = self.tamanho_casa
+        x, y = self.posicao_para_coordenadas(linha, coluna)
+        retangulo = pygame.Rect(x, y, tamanho, tamanho)
+        
+        if selecionada:
+            pygame.draw.rect(self.tela, self.COR_DESTAQUE, retangulo)
+            pygame.draw.rect(self.tela, (0, 0, 0), retangulo, 1)
+        else:
+            area = pygame.Rect(coluna * tamanho, linha * tamanho, tamanho, tamanho)
+            self.tela.blit(self._superficie_tabuleiro, retangulo, area)
+        
+        if indicador is not None:
+            cor = self.COR_CAPTURA if indicador else self.COR_MOVIMENTO_POSSIVEL
+            pygame.draw.circle(self.tela, cor, retangulo.center, 10)
+        
+        if peca is not None:
+            self.tela.blit(self._sprite_peca(*peca), retangulo)
+        return retangulo
+    
     def desenhar_informacoes(self, tabuleiro: Tabuleiro, info_adicional: str = ""):
         """
         Desenha informações do jogo na parte superior.
@@ -207,7 +327,7 @@ class InterfaceGrafica:
         
         # Linha 1: Título do jogo
         titulo = "JOGO DE DAMAS - BUSCA COMPETITIVA"
-        titulo_surface = self.fonte_media.render(titulo, True, self.COR_TEXTO)
+        titulo_surface = self._texto(titulo, self.fonte_media, self.COR_TEXTO)
         titulo_x = (self.largura - titulo_surface.get_width()) // 2
         self.tela.blit(titulo_surface, (titulo_x, 10))
         
@@ -218,14 +338,14 @@ class InterfaceGrafica:
         else:
             cor_turno = (200, 200, 200)  # Cinza claro para pretas
         
-        turno_surface = self.fonte.render(turno_texto, True, cor_turno)
+        turno_surface = self._texto(turno_texto, self.fonte, cor_turno)
         self.tela.blit(turno_surface, (10, 40))
         
         # Linha 2: Contagem de peças (direita)
         brancas = tabuleiro.contar_pecas(CorPeca.BRANCA)
         pretas = tabuleiro.contar_pecas(CorPeca.PRETA)
         pecas_texto = f"Peças - Brancas: {brancas} | Pretas: {pretas}"
-        pecas_surface = self.fonte_pequena.render(pecas_texto, True, self.COR_TEXTO)
+        pecas_surface = self._texto(pecas_texto, self.fonte_pequena, self.COR_TEXTO)
         pecas_x = self.largura - pecas_surface.get_width() - 10
         self.tela.blit(pecas_surface, (pecas_x, 45))
         
@@ -239,9 +359,8 @@ class InterfaceGrafica:
             
             for palavra in palavras:
                 teste_linha = linha_atual + (" " if linha_atual else "") + palavra
-                teste_surface = self.fonte_pequena.render(teste_linha, True, self.COR_TEXTO)
-                
-                if teste_surface.get_width() <= max_largura:
+                # size() mede o texto sem renderizá-lo
+                if self.fonte_pequena.size(teste_linha)[0] <= max_largura:
                     linha_atual = teste_linha
                 else:
                     if linha_atual:
@@ -254,7 +373,7 @@ class InterfaceGrafica:
             # Desenhar linhas centralizadas
             y_start = 75
             for i, linha in enumerate(linhas[:2]):  # Máximo 2 linhas
-                info_surface = self.fonte_pequena.render(linha, True, (255, 255, 100))  # Amarelo suave
+                info_surface = self._texto(linha, self.fonte_pequena, (255, 255, 100))  # Amarelo suave
                 info_x = (self.largura - info_surface.get_width()) // 2
                 self.tela.blit(info_surface, (info_x, y_start + i * 20))
         
@@ -281,6 +400,7 @@ class InterfaceGrafica:
         
         # Lista de botões com suas descrições
         botoes = [
+            ("ESPAÇO", "Jogar agora"),
             ("R", "Reiniciar"),
             ("H", "Ajuda"),
             ("ESC", "Sair")
@@ -294,40 +414,150 @@ class InterfaceGrafica:
             x_base = 20 + i * espaco_por_botao
             
             # Desenhar tecla em destaque
-            tecla_surface = self.fonte_pequena.render(f"[{tecla}]", True, (255, 255, 100))
+            tecla_surface = self._texto(f"[{tecla}]", self.fonte_pequena, (255, 255, 100))
             self.tela.blit(tecla_surface, (x_base, y_botoes))
             
             # Desenhar descrição
-            desc_surface = self.fonte_pequena.render(descricao, True, self.COR_TEXTO)
+            desc_surface = self._texto(descricao, self.fonte_pequena, self.COR_TEXTO)
             desc_x = x_base + tecla_surface.get_width() + 5
             self.tela.blit(desc_surface, (desc_x, y_botoes))
             
-        # Adicionar informação de controles do mouse no centro
-        mouse_info = "🖱️ Clique nas peças para jogar"
-        mouse_surface = self.fonte_pequena.render(mouse_info, True, (200, 200, 255))
-        mouse_x = (self.largura - mouse_surface.get_width()) // 2
-        self.tela.blit(mouse_surface, (mouse_x, y_botoes + 25))
+        self.desenhar_linha_analise(None)
     
-    def renderizar(self, tabuleiro: Tabuleiro, info_adicional: str = ""):
+    def desenhar_linha_analise(self, resultado: Optional[dict]) -> pygame.Rect:
         """
-        Renderiza o estado completo do jogo.
+        Desenha a linha inferior: a análise, quando há resultado, ou a dica do mouse.
+        
+        Args:
+            resultado (Optional[dict]): Último resultado da análise em segundo plano
+            
+        Returns:
+            pygame.Rect: Área redesenhada
+        """
+        area = pygame.Rect(0, self.altura - 22, self.largura, 22)
+        pygame.draw.rect(self.tela, self.COR_FUNDO, area)
+        
+        if resultado is None:
+            # Informação de controles do mouse no centro
+            texto = "🖱️ Clique nas peças para jogar"
+            cor = (200, 200, 255)
+        else:
+            variacao = " ".join(mov.to_pdn() for mov in resultado['variacao_principal'])
+            texto = (f"Análise: prof {resultado['profundidade']} | "
+                     f"{self._formatar_avaliacao(resultado['valor'])} | {variacao}")
+            # Cortar a variação que não cabe na largura
+            while self.fonte_pequena.size(texto)[0] > self.largura - 20 and " " in texto:
+                texto = texto.rsplit(" ", 1)[0]
+            cor = (150, 255, 150)
+        
+        superficie = self._texto(texto, self.fonte_pequena, cor)
+        self.tela.blit(superficie, ((self.largura - superficie.get_width()) // 2, self.altura - 20))
+        return area
+    
+    def desenhar_barra_avaliacao(self, valor: Optional[float]) -> pygame.Rect:
+        """
+        Desenha a barra de avaliação na margem esquerda do tabuleiro.
+        
+        A parte branca, de baixo para cima, é a vantagem das brancas; sem
+        análise a barra é apagada.
+        
+        Args:
+            valor (Optional[float]): Avaliação do ponto de vista das brancas
+            
+        Returns:
+            pygame.Rect: Área redesenhada
+        """
+        altura_barra = 8 * self.tamanho_casa
+        largura_barra = max(4, min(12, self.offset_x - 4))
+        area = pygame.Rect((self.offset_x - largura_barra) // 2, self.offset_y,
+                           largura_barra, altura_barra)
+        pygame.draw.rect(self.tela, self.COR_FUNDO, area)
+        if valor is None:
+            return area
+        
+        # Uma dama de vantagem (10) ocupa cerca de 88% da barra
+        if math.isinf(valor):
+            fracao_brancas = 1.0 if valor > 0 else 0.0
+        else:
+            fracao_brancas = 0.5 + 0.5 * math.tanh(valor / 10.0)
+        altura_brancas = int(round(altura_barra * fracao_brancas))
+        pygame.draw.rect(self.tela, (30, 30, 30), area)
+        pygame.draw.rect(self.tela, (235, 235, 235),
+                         (area.x, area.bottom - altura_brancas, area.width, altura_brancas))
+        pygame.draw.line(self.tela, (200, 60, 60), (area.x, area.centery), (area.right - 1, area.centery))
+        return area
+    
+    @staticmethod
+    def _formatar_avaliacao(valor: float) -> str:
+        if math.isinf(valor):
+            return "vitória das brancas" if valor > 0 else "vitória das pretas"
+        return f"{valor:+.1f}"
+    
+    def desenhar_quadro(self, tabuleiro: Tabuleiro, info_adicional: str = "") -> List[pygame.Rect]:
+        """
+        Desenha o estado do jogo na superfície da tela, apenas onde mudou.
+        
+        As casas vêm da camada pré-renderizada do tabuleiro, e peças e textos
+        de caches. Só as casas e a área de informações alteradas desde o
+        último quadro são redesenhadas; um quadro sem mudança não desenha nada.
         
         Args:
             tabuleiro (Tabuleiro): Tabuleiro atual
             info_adicional (str): Informação adicional para exibir
+            
+        Returns:
+            List[pygame.Rect]: Áreas redesenhadas
+        """
+        retangulos = []
+        
+        # Primeiro quadro (ou após invalidar): tela inteira
+        if self._casas_anteriores is None:
+            self.tela.fill(self.COR_FUNDO)
+            self.desenhar_botoes()
+            retangulos.append(self.tela.get_rect())
+        
+        info = (info_adicional, tabuleiro.turno_atual,
+                tabuleiro.contar_pecas(CorPeca.BRANCA), tabuleiro.contar_pecas(CorPeca.PRETA))
+        if info != self._info_anterior:
+            self.desenhar_informacoes(tabuleiro, info_adicional)
+            retangulos.append(pygame.Rect(0, 0, self.largura, self.espaco_info_topo))
+            self._info_anterior = info
+        
+        resultado = self.analise.atualizar(tabuleiro) if self.analise is not None else None
+        analise = None
+        if resultado is not None:
+            analise = (resultado['profundidade'], resultado['valor'],
+                       tuple(resultado['variacao_principal']))
+        if analise != self._analise_anterior:
+            retangulos.append(self.desenhar_barra_avaliacao(resultado['valor'] if resultado else None))
+            retangulos.append(self.desenhar_linha_analise(resultado))
+            self._analise_anterior = analise
+        
+        casas = self._estado_casas(tabuleiro)
+        anteriores = self._casas_anteriores
+        for indice, estado in enumerate(casas):
+            if anteriores is None or anteriores[indice] != estado:
+                retangulos.append(self._desenhar_casa(indice // 8, indice % 8, estado))
+        self._casas_anteriores = casas
+        return retangulos
+    
+    def renderizar(self, tabuleiro: Tabuleiro, info_adicional: str = ""):
         """
-        # Limpar tela
-        self.tela.fill(self.COR_FUNDO)
+        Renderiza o estado do jogo, enviando à tela apenas o que mudou.
+        
+        Usa desenhar_quadro() e display.update com os retângulos alterados;
+        quadros sem mudança não desenham nada, o que deixa a espera por
+        cliques praticamente sem custo de CPU.
         
-        # Desenhar componentes
-        self.desenhar_informacoes(tabuleiro, info_adicional)
-        self.desenhar_tabuleiro()
-        self.desenhar_movimentos_possiveis()
-        self.desenhar_pecas(tabuleiro)
-        self.desenhar_botoes()
+        Args:
+            tabuleiro (Tabuleiro): Tabuleiro atual
+            info_adicional (str): Informação adicional para exibir
+        """
+        retangulos = self.desenhar_quadro(tabuleiro, info_adicional)
         
         # Atualizar tela
-        pygame.display.flip()
+        if retangulos:
+            pygame.display.update(retangulos)
         self.clock.tick(60)  # 60 FPS
     
     def processar_eventos(self) -> List[str]:
@@ -354,11 +584,48 @@ class InterfaceGrafica:
                     eventos.append("reset")
                 elif evento.key == pygame.K_h:
                     eventos.append("help")
+                elif evento.key == pygame.K_a:
+                    if self.analise is not None:
+                        self.analise.alternar()
+                    eventos.append("analise")
+                elif evento.key == pygame.K_SPACE:
+                    eventos.append("stop")
                 elif evento.key == pygame.K_ESCAPE:
                     eventos.append("quit")
         
         return eventos
     
+    def movimentos_do_turno(self, tabuleiro: Tabuleiro) -> List[Movimento]:
+        """
+        Retorna as jogadas legais de quem joga, calculadas uma vez por posição.
+        
+        A lista e os índices por origem e por (origem, destino) são
+        compartilhados pela seleção, pelos destaques e pela busca de
+        movimentos, e só são recalculados quando a posição (peças e turno)
+        muda.
+        
+        Args:
+            tabuleiro (Tabuleiro): Tabuleiro atual
+            
+        Returns:
+            List[Movimento]: Jogadas legais do turno atual
+        """
+        chave = tabuleiro.chave_posicao()
+        if chave != self._chave_movimentos:
+            movimentos = tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)
+            por_origem: Dict[Tuple[int, int], List[Movimento]] = {}
+            por_origem_destino: Dict[Tuple[Tuple[int, int], Tuple[int, int]], Movimento] = {}
+            for movimento in movimentos:
+                por_origem.setdefault(movimento.origem, []).append(movimento)
+                # Com dois caminhos de captura iguais nas pontas, vale o primeiro
+                por_origem_destino.setdefault((movimento.origem, movimento.destino), movimento)
+            
+            self._chave_movimentos = chave
+            self._movimentos_turno = movimentos
+            self._movimentos_por_origem = por_origem
+            self._movimentos_por_origem_destino = por_origem_destino
+        return self._movimentos_turno
+    
     def selecionar_posicao(self, posicao: Tuple[int, int], tabuleiro: Tabuleiro):
         """
         Seleciona uma posição no tabuleiro.
@@ -372,9 +639,8 @@ class InterfaceGrafica:
         # Obter movimentos possíveis para a peça selecionada
         peca = tabuleiro.get_peca(posicao)
         if peca and peca.cor == tabuleiro.turno_atual:
-            todos_movimentos = tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)
-            self.movimentos_possiveis = [mov for mov in todos_movimentos 
-                                       if mov.origem == posicao]
+            self.movimentos_do_turno(tabuleiro)
+            self.movimentos_possiveis = self._movimentos_por_origem.get(posicao, [])
         else:
             self.movimentos_possiveis = []
     
@@ -397,13 +663,8 @@ class InterfaceGrafica:
         Returns:
             Optional[Movimento]: Movimento encontrado ou None
         """
-        movimentos_possiveis = tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)
-        
-        for movimento in movimentos_possiveis:
-            if movimento.origem == origem and movimento.destino == destino:
-                return movimento
-        
-        return None
+        self.movimentos_do_turno(tabuleiro)
+        return self._movimentos_por_origem_destino.get((origem, destino))
     
     def mostrar_mensagem(self, mensagem: str, cor: Tuple[int, int, int] = None):
         """
@@ -464,10 +725,13 @@ class InterfaceGrafica:
             y_atual += superficie.get_height() + 10
         
         pygame.display.flip()
+        self.invalidar()
         
         # Aguardar um tempo ou clique
         pygame.time.wait(2000)
     
     def fechar(self):
         """Fecha a interface gráfica."""
+        if self.analise is not None:
+            self.analise.parar()
         pygame.quit() 
\ No newline at end of file
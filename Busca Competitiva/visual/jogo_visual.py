@@ -11,6 +11,8 @@ from typing import Optional, Tuple
 from jogo_damas import JogoDamas, Tabuleiro, CorPeca
 from exercicios.algoritmos_busca import EstrategiaJogo, JogadorHumano, JogadorAleatorio
 from .interface_grafica import InterfaceGrafica
+from .trabalhador_ia import TrabalhadorIA
+from .analise import AnaliseSegundoPlano
 
 
 class JogadorHumanoVisual(EstrategiaJogo):
@@ -46,7 +48,8 @@ class JogadorHumanoVisual(EstrategiaJogo):
         self.resetar_estatisticas()
         inicio = time.time()
         
-        movimentos_possiveis = tabuleiro.obter_movimentos_possiveis(cor_jogador)
+        # Lista compartilhada com a seleção e a busca de movimentos da interface
+        movimentos_possiveis = self.interface.movimentos_do_turno(tabuleiro)
         if not movimentos_possiveis:
             raise ValueError("Não há movimentos possíveis para o jogador atual")
         
@@ -120,18 +123,23 @@ class JogoVisual:
     partidas interativas e visualização de algoritmos.
     """
     
-    def __init__(self, largura: int = 800, altura: int = 950):
+    def __init__(self, largura: int = 800, altura: int = 950,
+                 motor_analise: Optional[EstrategiaJogo] = None):
         """
         Inicializa o jogo visual.
         
         Args:
             largura (int): Largura da janela
             altura (int): Altura da janela (aumentada para mais espaço)
+            motor_analise (Optional[EstrategiaJogo]): Motor da análise em
+                segundo plano, ligada com a tecla A (padrão: BuscaPVS)
         """
         self.interface = InterfaceGrafica(largura, altura)
+        self.interface.analise = AnaliseSegundoPlano(motor_analise)
         self.jogo: Optional[JogoDamas] = None
         self.pausado = False
-        self.velocidade_ia = 1.0  # Segundos entre jogadas da IA
+        self.velocidade_ia = 1.0  # Tempo mínimo (segundos) de cada jogada da IA
+        self.ultima_jogada = ""
     
     def criar_jogo(self, estrategia_brancas: EstrategiaJogo, 
                    estrategia_pretas: EstrategiaJogo) -> JogoDamas:
@@ -188,31 +196,20 @@ class JogoVisual:
                     if evento == "quit":
                         return None
                     elif evento == "reset":
+                        jogo.encerrar_estrategias()
                         return self.executar_partida(estrategia_brancas, estrategia_pretas)
                     elif evento == "help":
                         self.mostrar_ajuda()
                 
-                # Verificar se o jogo terminou
-                jogo_terminado, vencedor = jogo.tabuleiro.jogo_terminado()
-                if jogo_terminado:
-                    jogo.status.finalizar_jogo(vencedor)
-                    break
-                
-                # Verificar limite de jogadas
-                if jogo.status.numero_jogadas >= jogo.limite_jogadas:
-                    avaliacao_final = jogo.tabuleiro.avaliar_posicao()
-                    if avaliacao_final > 0:
-                        vencedor = CorPeca.BRANCA
-                    elif avaliacao_final < 0:
-                        vencedor = CorPeca.PRETA
-                    else:
-                        vencedor = None
-                    jogo.status.finalizar_jogo(vencedor)
+                # Verificar se o jogo terminou (no tabuleiro ou pelo limite)
+                if jogo.verificar_termino():
                     break
                 
                 # Realizar jogada
                 try:
-                    self._realizar_jogada_visual(jogo)
+                    if self._realizar_jogada_visual(jogo) == "reset":
+                        jogo.encerrar_estrategias()
+                        return self.executar_partida(estrategia_brancas, estrategia_pretas)
                 except SystemExit:
                     return None
                 except Exception as e:
@@ -230,52 +227,102 @@ class JogoVisual:
         except Exception as e:
             self.interface.mostrar_mensagem(f"Erro inesperado: {e}")
             return None
+        finally:
+            # Parar buscas em segundo plano (ponderação) das estratégias
+            jogo.encerrar_estrategias()
     
-    def _realizar_jogada_visual(self, jogo: JogoDamas):
+    def _realizar_jogada_visual(self, jogo: JogoDamas) -> Optional[str]:
         """
         Realiza uma jogada com visualização.
         
         Args:
             jogo (JogoDamas): Instância do jogo atual
+            
+        Returns:
+            Optional[str]: "reset" se o usuário reiniciou durante a busca da IA
         """
         jogador_atual = jogo.tabuleiro.turno_atual
         estrategia = jogo.estrategias[jogador_atual]
         
-        # Informação sobre o turno
-        nome_estrategia = type(estrategia).__name__
-        info = f"Turno: {jogador_atual.value} ({nome_estrategia})"
-        
-        # Se for IA, adicionar delay para visualização
-        if not isinstance(estrategia, JogadorHumanoVisual):
-            info += " - Pensando..."
-            self.interface.renderizar(jogo.tabuleiro, info)
-            pygame.time.wait(int(self.velocidade_ia * 1000))
-        
         # Obter movimento da estratégia
-        movimento = estrategia.escolher_movimento(jogo.tabuleiro, jogador_atual)
-        
-        # Registrar estatísticas
-        estatisticas = estrategia.obter_estatisticas()
-        jogo.status.estatisticas_jogadores[jogador_atual].append(estatisticas)
-        
-        # Executar movimento
-        jogo.tabuleiro.executar_movimento(movimento)
+        if isinstance(estrategia, JogadorHumanoVisual):
+            movimento = estrategia.escolher_movimento(jogo.tabuleiro, jogador_atual)
+            estatisticas = estrategia.obter_estatisticas()
+        else:
+            resultado = self._aguardar_ia(jogo, estrategia, jogador_atual)
+            if resultado is None:
+                return "reset"
+            movimento, estatisticas = resultado
         
-        # Registrar avaliação da posição
-        avaliacao = jogo.tabuleiro.avaliar_posicao()
-        jogo.status.registrar_jogada(estatisticas, avaliacao)
+        jogo.aplicar_jogada(movimento, estatisticas)
         
         # Mostrar informações do movimento
         info_movimento = f"{jogador_atual.value}: {movimento}"
         if estatisticas['tempo_execucao'] > 0:
             info_movimento += f" | Tempo: {estatisticas['tempo_execucao']:.3f}s"
             info_movimento += f" | Nós: {estatisticas['nos_explorados']}"
+        self.ultima_jogada = info_movimento
         
         self.interface.renderizar(jogo.tabuleiro, info_movimento)
+        return None
+    
+    def _aguardar_ia(self, jogo: JogoDamas, estrategia: EstrategiaJogo,
+                     jogador_atual: CorPeca):
+        """
+        Executa a busca da IA em segundo plano, renderizando o progresso.
+        
+        A jogada só é aplicada depois de velocidade_ia segundos, para que
+        jogadas rápidas possam ser acompanhadas. Durante a busca, ESPAÇO pede
+        a jogada imediatamente, R reinicia e ESC sai.
+        
+        Args:
+            jogo (JogoDamas): Instância do jogo atual
+            estrategia (EstrategiaJogo): Estratégia da IA
+            jogador_atual (CorPeca): Cor da IA
+            
+        Returns:
+            Optional[Tuple[Movimento, dict]]: Jogada e estatísticas, ou None se
+            o usuário reiniciou o jogo
+        """
+        trabalhador = TrabalhadorIA(estrategia, jogo.tabuleiro, jogador_atual)
+        nome_estrategia = type(estrategia).__name__
+        
+        while not (trabalhador.concluido and
+                   (trabalhador.interrompido or
+                    time.time() - trabalhador.inicio >= self.velocidade_ia)):
+            for evento in self.interface.processar_eventos():
+                if evento == "quit":
+                    # A thread é daemon: ao sair, não é preciso esperá-la
+                    trabalhador.cancelar(esperar=False)
+                    raise SystemExit("Jogo fechado pelo usuário")
+                elif evento == "reset":
+                    # A nova partida usa as mesmas estratégias: a busca
+                    # antiga precisa terminar antes
+                    self.interface.renderizar(jogo.tabuleiro, "Reiniciando...")
+                    trabalhador.cancelar()
+                    return None
+                elif evento == "stop":
+                    trabalhador.interromper()
+            
+            if trabalhador.interrompido:
+                trabalhador.interromper()
+            
+            progresso = trabalhador.progresso()
+            info = f"Turno: {jogador_atual.value} ({nome_estrategia}) - Pensando... "
+            if progresso['profundidade'] is not None:
+                info += f"profundidade {progresso['profundidade']} | "
+            info += f"nós {progresso['nos']} | {progresso['tempo']:.1f}s"
+            if trabalhador.interrompido:
+                info += " | interrompendo..."
+            elif self.ultima_jogada:
+                info += f" | última: {self.ultima_jogada}"
+            
+            # renderizar() limita o laço a 60 quadros por segundo
+            self.interface.renderizar(jogo.tabuleiro, info)
         
-        # Pausa para visualizar o movimento
-        if not isinstance(estrategia, JogadorHumanoVisual):
-            pygame.time.wait(500)
+        if trabalhador.erro is not None:
+            raise trabalhador.erro
+        return trabalhador.movimento, trabalhador.estatisticas
     
     def _mostrar_resultado_final(self, jogo: JogoDamas):
         """
@@ -313,7 +360,9 @@ class JogoVisual:
             "CONTROLES:",
             "• Clique nas peças para selecioná-las",
             "• Clique no destino para mover",
+            "• ESPAÇO - IA joga imediatamente",
             "• R - Reiniciar jogo",
+            "• A - Ligar/desligar a análise",
             "• H - Mostrar esta ajuda",
             "• ESC - Sair do jogo",
             "",
@@ -325,7 +374,8 @@ class JogoVisual:
             "Pressione qualquer tecla para continuar..."
         ]
         
-        # Limpar tela
+        # Limpar tela (a próxima renderização redesenha tudo)
+        self.interface.invalidar()
         self.interface.tela.fill(self.interface.COR_FUNDO)
         
         # Desenhar texto da ajuda
@@ -356,7 +406,7 @@ class JogoVisual:
         Define a velocidade de jogada da IA.
         
         Args:
-            velocidade (float): Tempo em segundos entre jogadas da IA
+            velocidade (float): Tempo mínimo, em segundos, de cada jogada da IA
         """
         self.velocidade_ia = max(0.1, min(5.0, velocidade))
     
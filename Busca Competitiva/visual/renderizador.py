@@ -0,0 +1,230 @@
+"""
+Renderização sem janela de partidas salvas.
+
+RenderizadorPartidas desenha partidas em uma superfície fora da tela, com o
+driver de vídeo "dummy" do SDL, reaproveitando o desenho da
+InterfaceGrafica (InterfaceGrafica.desenhar_quadro). Como só as casas
+alteradas são redesenhadas a cada jogada, gerar os quadros custa pouco;
+o tempo de exportação fica dominado pela codificação das imagens.
+
+Entradas aceitas:
+- arquivos JSON de JogoDamas.salvar_partida() (carregar_partida_json)
+- arquivos binários de jogo_damas.arquivo_partidas (carregar_partidas_binarias)
+
+Saídas: sequência de PNGs (pygame) ou GIF animado (requer Pillow).
+
+Uso:
+    python -m visual.renderizador partida.json --diretorio quadros
+    python -m visual.renderizador partida.json --gif partida.gif
+    python -m visual.renderizador partidas.bin --gif torneio.gif
+"""
+
+import os
+from typing import Iterable, Iterator, List
+
+import pygame
+
+try:
+    from PIL import Image
+    PILLOW_DISPONIVEL = True
+except ImportError:
+    PILLOW_DISPONIVEL = False
+
+from jogo_damas import Tabuleiro, Movimento, LeitorArquivoPartidas
+from .interface_grafica import InterfaceGrafica
+
+
+def _exigir_pillow():
+    if not PILLOW_DISPONIVEL:
+        raise ImportError("A exportação para GIF requer Pillow. Instale com: pip install pillow")
+
+
+def carregar_partida_json(caminho: str) -> List[Movimento]:
+    """
+    Lê os movimentos de uma partida salva com JogoDamas.salvar_partida().
+
+    O JSON guarda os movimentos como texto; cada um é identificado
+    reproduzindo a partida e comparando com as jogadas legais.
+
+    Args:
+        caminho (str): Arquivo JSON da partida
+
+    Returns:
+        List[Movimento]: Movimentos da partida
+    """
+    import json
+
+    with open(caminho, 'r', encoding='utf-8') as arquivo:
+        historico = json.load(arquivo)['historico_movimentos']
+
+    tabuleiro = Tabuleiro()
+    movimentos = []
+    for numero, texto in enumerate(historico, 1):
+        legais = tabuleiro.obter_movimentos_possiveis(tabuleiro.turno_atual)
+        movimento = next((mov for mov in legais if str(mov) == texto), None)
+        if movimento is None:
+            raise ValueError(f"Jogada {numero} inválida em {caminho}: {texto}")
+        tabuleiro.executar_movimento(movimento, validar=False)
+        movimentos.append(movimento)
+    return movimentos
+
+
+def carregar_partidas_binarias(caminho: str) -> Iterator[List[Movimento]]:
+    """
+    Lê as partidas de um arquivo binário de partidas.
+
+    Args:
+        caminho (str): Arquivo escrito por EscritorArquivoPartidas
+
+    Returns:
+        Iterator[List[Movimento]]: Movimentos de cada partida
+    """
+    with LeitorArquivoPartidas(caminho) as leitor:
+        for partida in leitor:
+            yield partida.reconstruir()
+
+
+class RenderizadorPartidas:
+    """
+    Desenha partidas fora da tela, quadro a quadro.
+
+    Um quadro é desenhado para a posição inicial e para a posição após cada
+    jogada, com o número e a jogada na área de informações.
+    """
+
+    def __init__(self, largura: int = 800, altura: int = 950):
+        """
+        Inicializa o renderizador.
+
+        Args:
+            largura (int): Largura dos quadros
+            altura (int): Altura dos quadros
+        """
+        # O driver "dummy" só vale se o vídeo ainda não foi iniciado
+        if not pygame.display.get_init():
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        self.interface = InterfaceGrafica(largura, altura)
+
+    def quadros(self, movimentos: Iterable[Movimento]) -> Iterator[pygame.Surface]:
+        """
+        Gera os quadros de uma partida.
+
+        A superfície devolvida é sempre a mesma, atualizada a cada quadro;
+        copie-a (Surface.copy) para guardar um quadro.
+
+        Args:
+            movimentos (Iterable[Movimento]): Movimentos da partida
+
+        Returns:
+            Iterator[pygame.Surface]: Superfície com cada quadro
+        """
+        interface = self.interface
+        interface.desselecionar()
+        interface.invalidar()
+        tabuleiro = Tabuleiro()
+
+        interface.desenhar_quadro(tabuleiro, "Posição inicial")
+        yield interface.tela
+        for numero, movimento in enumerate(movimentos, 1):
+            cor = tabuleiro.turno_atual
+            tabuleiro.executar_movimento(movimento, validar=False)
+            interface.desenhar_quadro(tabuleiro, f"Jogada {numero} - {cor.value}: {movimento}")
+            yield interface.tela
+
+    def salvar_png(self, movimentos: Iterable[Movimento], diretorio: str,
+                   prefixo: str = 'quadro') -> List[str]:
+        """
+        Salva os quadros de uma partida como PNGs numerados.
+
+        Args:
+            movimentos (Iterable[Movimento]): Movimentos da partida
+            diretorio (str): Diretório de saída (criado se não existir)
+            prefixo (str): Prefixo dos nomes dos arquivos
+
+        Returns:
+            List[str]: Caminhos dos arquivos salvos
+        """
+        os.makedirs(diretorio, exist_ok=True)
+        caminhos = []
+        for indice, quadro in enumerate(self.quadros(movimentos)):
+            caminho = os.path.join(diretorio, f"{prefixo}_{indice:04d}.png")
+            pygame.image.save(quadro, caminho)
+            caminhos.append(caminho)
+        return caminhos
+
+    def salvar_gif(self, movimentos: Iterable[Movimento], caminho: str,
+                   duracao_ms: int = 500, escala: float = 0.5) -> int:
+        """
+        Salva uma partida como GIF animado (requer Pillow).
+
+        Args:
+            movimentos (Iterable[Movimento]): Movimentos da partida
+            caminho (str): Arquivo GIF de saída
+            duracao_ms (int): Duração de cada quadro, em milissegundos
+            escala (float): Fator de escala dos quadros
+
+        Returns:
+            int: Número de quadros salvos
+        """
+        _exigir_pillow()
+        largura = max(1, int(self.interface.largura * escala))
+        altura = max(1, int(self.interface.altura * escala))
+
+        imagens = []
+        for quadro in self.quadros(movimentos):
+            if escala != 1.0:
+                quadro = pygame.transform.smoothscale(quadro, (largura, altura))
+            imagens.append(Image.frombytes('RGB', quadro.get_size(),
+                                           pygame.image.tobytes(quadro, 'RGB')))
+
+        imagens[0].save(caminho, save_all=True, append_images=imagens[1:],
+                        duration=duracao_ms, loop=0, optimize=True)
+        return len(imagens)
+
+    def fechar(self):
+        """Libera o pygame."""
+        self.interface.fechar()
+
+
+def main():
+    """Exporta partidas salvas pela linha de comando."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Exporta partidas salvas como PNGs ou GIF")
+    parser.add_argument('arquivo', help="Partida JSON (salvar_partida) ou arquivo binário de partidas")
+    parser.add_argument('--diretorio', default=None, help="Diretório para os quadros PNG")
+    parser.add_argument('--gif', default=None, help="Arquivo GIF de saída")
+    parser.add_argument('--duracao', type=int, default=500, help="Duração de cada quadro do GIF (ms)")
+    parser.add_argument('--escala', type=float, default=0.5, help="Escala dos quadros do GIF")
+    parser.add_argument('--partida', type=int, default=None,
+                        help="Índice da partida no arquivo binário (padrão: todas)")
+    args = parser.parse_args()
+
+    if args.diretorio is None and args.gif is None:
+        parser.error("informe --diretorio e/ou --gif")
+
+    if args.arquivo.endswith('.json'):
+        partidas = [carregar_partida_json(args.arquivo)]
+    else:
+        partidas = list(carregar_partidas_binarias(args.arquivo))
+        if args.partida is not None:
+            partidas = [partidas[args.partida]]
+
+    renderizador = RenderizadorPartidas()
+    try:
+        for indice, movimentos in enumerate(partidas):
+            sufixo = f"_{indice:04d}" if len(partidas) > 1 else ""
+            if args.diretorio is not None:
+                caminhos = renderizador.salvar_png(movimentos, args.diretorio, f"partida{sufixo}")
+                print(f"{len(caminhos)} quadros em {args.diretorio}")
+            if args.gif is not None:
+                base, extensao = os.path.splitext(args.gif)
+                caminho = f"{base}{sufixo}{extensao or '.gif'}"
+                quadros = renderizador.salvar_gif(movimentos, caminho, args.duracao, args.escala)
+                print(f"{quadros} quadros em {caminho}")
+    finally:
+        renderizador.fechar()
+
+
+if __name__ == "__main__":
+    main()
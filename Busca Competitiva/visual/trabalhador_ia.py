@@ -0,0 +1,108 @@
+"""
+Busca da IA em segundo plano para a interface gráfica.
+
+TrabalhadorIA executa estrategia.escolher_movimento em uma thread, sobre
+uma cópia do tabuleiro, para que o laço de renderização continue
+processando eventos enquanto a IA pensa. O laço consulta concluido e
+progresso() a cada quadro.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from jogo_damas import Tabuleiro, Movimento, CorPeca
+from exercicios.algoritmos_busca import EstrategiaJogo
+
+
+class TrabalhadorIA:
+    """
+    Uma busca da IA executando em uma thread.
+
+    interromper() pede à estratégia que termine a busca e devolva a melhor
+    jogada encontrada até agora (motores com aprofundamento iterativo, como
+    os de utils/busca_avancada.py). Estratégias que não podem ser
+    interrompidas terminam a busca normalmente. cancelar() também descarta
+    o resultado e, por padrão, espera a thread terminar.
+    """
+
+    def __init__(self, estrategia: EstrategiaJogo, tabuleiro: Tabuleiro, cor_jogador: CorPeca):
+        """
+        Inicia a busca.
+
+        Args:
+            estrategia (EstrategiaJogo): Estratégia que escolhe a jogada
+            tabuleiro (Tabuleiro): Posição atual (é copiada)
+            cor_jogador (CorPeca): Cor do jogador que deve jogar
+        """
+        self.estrategia = estrategia
+        self.cor_jogador = cor_jogador
+        self.movimento: Optional[Movimento] = None
+        self.estatisticas: Optional[Dict[str, Any]] = None
+        self.erro: Optional[BaseException] = None
+        self.cancelado = False
+        self.interrompido = False
+        self.inicio = time.time()
+        self._tabuleiro = tabuleiro.copy()
+        self._thread = threading.Thread(target=self._executar, name='busca_ia', daemon=True)
+        self._thread.start()
+
+    def _executar(self):
+        try:
+            if self.cancelado:
+                return
+            self.movimento = self.estrategia.escolher_movimento(self._tabuleiro, self.cor_jogador)
+            self.estatisticas = self.estrategia.obter_estatisticas()
+        except BaseException as erro:
+            self.erro = erro
+
+    @property
+    def concluido(self) -> bool:
+        """Se a busca terminou (com jogada, erro ou cancelamento)."""
+        return not self._thread.is_alive()
+
+    def progresso(self) -> Dict[str, Any]:
+        """
+        Lê o progresso da busca em andamento.
+
+        Returns:
+            Dict[str, Any]: 'tempo' decorrido, 'nos' explorados e, para motores
+            com aprofundamento iterativo, 'profundidade' concluída
+        """
+        return {
+            'tempo': time.time() - self.inicio,
+            'nos': self.estrategia.nos_explorados,
+            'profundidade': getattr(self.estrategia, 'profundidade_alcancada', None),
+        }
+
+    def interromper(self):
+        """
+        Pede que a busca termine com a melhor jogada até agora.
+
+        Pode ser chamado a cada quadro enquanto a busca não termina: o pedido
+        é repetido caso a busca ainda não tivesse começado.
+        """
+        self.interrompido = True
+        if not self.concluido:
+            self.estrategia.interromper_busca()
+
+    def cancelar(self, esperar: bool = True):
+        """
+        Interrompe a busca e descarta o resultado.
+
+        Args:
+            esperar (bool): Se deve esperar a thread terminar. A estratégia
+                continua em uso pela thread até lá: espere antes de usá-la
+                em outra busca (por exemplo, ao reiniciar a partida). A
+                busca redefine seu prazo ao começar, então o pedido de
+                interrupção é repetido até a thread terminar; estratégias
+                que não podem ser interrompidas terminam a busca normalmente
+        """
+        self.cancelado = True
+        self.interrompido = True
+        if not esperar:
+            self.interromper()
+            return
+        while self._thread.is_alive():
+            self.estrategia.interromper_busca()
+            self._thread.join(0.01)